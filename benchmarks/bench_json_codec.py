@@ -0,0 +1,46 @@
+"""
+Compares JSON codecs on search responses shaped like the API's hits (sentence, data and a
+graph_context of neighbouring nodes), and shows how much gzip shrinks them on the wire.
+
+    python benchmarks/bench_json_codec.py --hits 200 --repeat 20
+"""
+import argparse
+import gzip
+import time
+
+from praxos_python.codec import get_json_codec
+
+from payloads import make_search_response
+
+def _time(func, arg, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hits", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = make_search_response(args.hits)
+    body = get_json_codec("json").encode(payload)
+    size_mb = len(body) / 1e6
+    print(f"payload: {args.hits} hits, {len(body):,} bytes, {len(gzip.compress(body)):,} bytes gzipped")
+    print(f"{'codec':<10}{'decode MB/s':>14}{'encode MB/s':>14}")
+
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_json_codec(name)
+        except ImportError:
+            print(f"{name:<10}{'not installed':>14}")
+            continue
+        decode = _time(codec.decode, body, args.repeat)
+        encode = _time(codec.encode, payload, args.repeat)
+        print(f"{name:<10}{size_mb / decode:>14.1f}{size_mb / encode:>14.1f}")
+
+if __name__ == "__main__":
+    main()
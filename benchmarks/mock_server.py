@@ -0,0 +1,110 @@
+"""
+In-process mock of the Praxos API for benchmarks.
+
+MockPraxos serves /search, /extract, /fetch-graph-nodes, /sources and /environment (plus the API
+key check) through httpx.MockTransport, so the SDK runs its full request path (encoding, retries,
+connection handling, decoding) without a network. Every response is delayed by `latency` seconds
+to stand in for server time; responses are pre-encoded so the mock itself costs next to nothing.
+"""
+import json
+import time
+import asyncio
+import threading
+from collections import Counter
+from typing import Dict, Any
+
+import httpx
+
+from payloads import make_search_response, make_items, make_source, make_environment
+
+class MockPraxos:
+    def __init__(self, latency: float = 0.005, total_items: int = 5000, total_sources: int = 300,
+                 total_environments: int = 50, neighbours: int = 8):
+        self.latency = latency
+        self.total_items = total_items
+        self.total_sources = total_sources
+        self.total_environments = total_environments
+        self.neighbours = neighbours
+
+        self.requests = Counter()
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+        self._search_bodies: Dict[int, bytes] = {}
+        self._items = make_items(total_items)
+        self._sources = [make_source(i) for i in range(total_sources)]
+        self._environments = [make_environment(i) for i in range(total_environments)]
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for SyncClient (transport=...)."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if self.latency:
+                time.sleep(self.latency)
+            return self.handle(request)
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for AsyncClient; latency is awaited, so concurrent requests overlap."""
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            await request.aread()
+            return self.handle(request)
+        return httpx.MockTransport(handler)
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.bytes_received = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.strip("/").split("/")[-1]
+        body = request.read()
+        with self._lock:
+            self.requests[f"{request.method} /{endpoint}"] += 1
+            self.bytes_received += len(body)
+
+        route = getattr(self, f"_{request.method.lower()}_{endpoint.replace('-', '_')}", None)
+        if route is None:
+            return httpx.Response(404, json={"message": f"no mock route for {request.method} /{endpoint}"})
+        return route(request, body)
+
+    @staticmethod
+    def _json(value: Any) -> httpx.Response:
+        return httpx.Response(200, content=json.dumps(value).encode("utf-8"), headers={"Content-Type": "application/json"})
+
+    @staticmethod
+    def _page(rows: list, request: httpx.Request, payload: Dict[str, Any] = None) -> list:
+        source = payload if payload is not None else request.url.params
+        if "limit" not in source:
+            return rows
+        offset = int(source.get("offset", 0))
+        return rows[offset:offset + int(source["limit"])]
+
+    def _get_api_token_validataion(self, request, body):
+        return self._json({})
+
+    def _post_search(self, request, body):
+        top_k = json.loads(body).get("top_k", 10)
+        encoded = self._search_bodies.get(top_k)
+        if encoded is None:
+            encoded = self._search_bodies[top_k] = json.dumps(make_search_response(top_k, self.neighbours)).encode("utf-8")
+        return httpx.Response(200, content=encoded, headers={"Content-Type": "application/json"})
+
+    def _post_extract(self, request, body):
+        return self._json({"items": self._page(self._items, request, json.loads(body))})
+
+    def _post_fetch_graph_nodes(self, request, body):
+        return self._json({"results": [{"id": node_id, "label": node_id, "properties": {}} for node_id in json.loads(body)["node_ids"]]})
+
+    def _get_sources(self, request, body):
+        if "id" in request.url.params:
+            return self._json(make_source(0))
+        return self._json(self._page(self._sources, request))
+
+    def _post_sources(self, request, body):
+        return self._json(make_source(len(self._sources), status="processing"))
+
+    def _get_environment(self, request, body):
+        if "id" in request.url.params or "name" in request.url.params:
+            return self._json(self._environments[0])
+        return self._json(self._page(self._environments, request))
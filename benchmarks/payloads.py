@@ -0,0 +1,49 @@
+"""Synthetic API payloads shaped like real Praxos responses, shared by the benchmarks."""
+import random
+import string
+from typing import Dict, Any, List
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+
+def make_node(rng: random.Random, index: int) -> Dict[str, Any]:
+    return {
+        "id": f"node-{index}",
+        "type": rng.choice(["Person", "Company", "Email", "Event"]),
+        "label": " ".join(_word(rng) for _ in range(3)),
+        "properties": {_word(rng): rng.random() for _ in range(6)},
+        "created_at": "2024-05-01T12:00:00Z",
+    }
+
+def make_hit(rng: random.Random, index: int, neighbours: int = 8) -> Dict[str, Any]:
+    return {
+        "score": rng.random(),
+        "node_id": f"node-{index}",
+        "sentence": " ".join(_word(rng) for _ in range(20)),
+        "data": make_node(rng, index),
+        "graph_context": {
+            "nodes": [make_node(rng, index * 100 + j) for j in range(neighbours)],
+            "edges": [{"source": f"node-{index}", "target": f"node-{index * 100 + j}", "label": _word(rng)} for j in range(neighbours)],
+        },
+    }
+
+def make_search_response(hits: int, neighbours: int = 8, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    return {"hits": [make_hit(rng, i, neighbours) for i in range(hits)]}
+
+def make_items(count: int, offset: int = 0, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed + offset)
+    return [make_node(rng, offset + i) for i in range(count)]
+
+def make_source(index: int, environment_id: str = "env-0", status: str = "completed") -> Dict[str, Any]:
+    return {
+        "id": f"source-{index}",
+        "environment_id": environment_id,
+        "name": f"source {index}",
+        "created_at": "2024-05-01T12:00:00Z",
+        "description": None,
+        "status": status,
+    }
+
+def make_environment(index: int) -> Dict[str, Any]:
+    return {"id": f"env-{index}", "name": f"environment {index}", "created_at": "2024-05-01T12:00:00Z", "description": None}
@@ -0,0 +1,251 @@
+"""
+SDK benchmark suite against the in-process mock API (see mock_server.py). Runs offline.
+
+Measures throughput and exact p50/p99 request latency for sync vs async clients, serial vs
+batched search, paginated extraction, node loading, uploads and JSON decoding. The latency
+injected by the mock is reported alongside, so the SDK's own overhead is the difference.
+
+    python benchmarks/run.py                          # all scenarios
+    python benchmarks/run.py -k search --latency 0    # pure client overhead of the search paths
+    python benchmarks/run.py --save baseline.json
+    python benchmarks/run.py --baseline baseline.json --tolerance 0.25   # exit 1 on regressions
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+from typing import Dict, Any, Callable, List
+
+from praxos_python import SyncClient, AsyncClient, Instrumentation, RetryPolicy
+from praxos_python.codec import get_json_codec
+
+from mock_server import MockPraxos
+from payloads import make_search_response
+
+BASE_URL = "http://praxos.mock/"
+
+
+class Recorder:
+    """Collects the exact total_time of every request through an instrumentation hook."""
+    def __init__(self):
+        self.instrumentation = Instrumentation(metrics=False)
+        self.latencies: List[float] = []
+        self.instrumentation.on_response(self._record)
+
+    def _record(self, event) -> None:
+        if event.endpoint != "api-token-validataion":
+            self.latencies.append(event.total_time)
+
+    def clear(self) -> None:
+        self.latencies = []
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _result(name: str, ops: int, wall: float, recorder: Recorder, unit: str = "ops") -> Dict[str, Any]:
+    return {
+        "name": name,
+        "ops": ops,
+        "unit": unit,
+        "wall_s": wall,
+        "throughput": ops / wall if wall else 0.0,
+        "requests": len(recorder.latencies),
+        "p50_ms": _percentile(recorder.latencies, 0.5) * 1000,
+        "p99_ms": _percentile(recorder.latencies, 0.99) * 1000,
+    }
+
+
+def _sync_env(server: MockPraxos, recorder: Recorder):
+    client = SyncClient("bench-key", base_url=BASE_URL, transport=server.transport(),
+                        instrumentation=recorder.instrumentation, retry_policy=RetryPolicy(max_retries=0))
+    return client, client.get_environment(id="env-0")
+
+
+async def _async_env(server: MockPraxos, recorder: Recorder):
+    client = AsyncClient("bench-key", base_url=BASE_URL, transport=server.async_transport(),
+                         instrumentation=recorder.instrumentation, retry_policy=RetryPolicy(max_retries=0))
+    return client, await client.get_environment(id="env-0")
+
+
+def _timed(name: str, recorder: Recorder, ops: int, func: Callable[[], Any], unit: str = "ops") -> Dict[str, Any]:
+    recorder.clear()
+    start = time.perf_counter()
+    func()
+    return _result(name, ops, time.perf_counter() - start, recorder, unit)
+
+
+# Scenarios: each takes (server, args) and returns a list of results.
+
+def bench_search_sync(server: MockPraxos, args) -> List[Dict[str, Any]]:
+    recorder = Recorder()
+    client, env = _sync_env(server, recorder)
+    queries = [{"query": f"query {i}", "top_k": args.top_k} for i in range(args.n)]
+    try:
+        return [
+            _timed("search.sync.serial", recorder, args.n, lambda: [env.search(**query) for query in queries]),
+            _timed("search.sync.batched", recorder, args.n, lambda: env.search_many(queries, max_concurrency=args.concurrency)),
+        ]
+    finally:
+        client.close()
+
+
+def bench_search_async(server: MockPraxos, args) -> List[Dict[str, Any]]:
+    recorder = Recorder()
+    queries = [{"query": f"query {i}", "top_k": args.top_k} for i in range(args.n)]
+
+    async def run():
+        client, env = await _async_env(server, recorder)
+        results = []
+        try:
+            for name, coroutine in (
+                ("search.async.serial", lambda: _serial(env, queries)),
+                ("search.async.batched", lambda: env.search_many(queries, max_concurrency=args.concurrency)),
+            ):
+                recorder.clear()
+                start = time.perf_counter()
+                await coroutine()
+                results.append(_result(name, args.n, time.perf_counter() - start, recorder))
+        finally:
+            await client.close()
+        return results
+
+    async def _serial(env, queries):
+        for query in queries:
+            await env.search(**query)
+
+    return asyncio.run(run())
+
+
+def bench_extract(server: MockPraxos, args) -> List[Dict[str, Any]]:
+    recorder = Recorder()
+    client, env = _sync_env(server, recorder)
+    total = server.total_items
+    try:
+        return [
+            _timed("extract.single_response", recorder, total, lambda: env.extract_items("Person"), unit="items"),
+            _timed("extract.iter_items", recorder, total, lambda: sum(1 for _ in env.iter_items("Person", page_size=500)), unit="items"),
+            _timed("sources.iter_sources", recorder, server.total_sources, lambda: sum(1 for _ in env.iter_sources(page_size=100)), unit="sources"),
+        ]
+    finally:
+        client.close()
+
+
+def bench_graph_nodes(server: MockPraxos, args) -> List[Dict[str, Any]]:
+    recorder = Recorder()
+    client, env = _sync_env(server, recorder)
+    # Overlapping neighbourhoods, as produced by successive hops of an exploration.
+    rounds = [[f"node-{i}" for i in range(start, start + 200)] for start in range(0, 2000, 100)]
+    ops = sum(len(ids) for ids in rounds)
+    try:
+        return [
+            _timed("graph.fetch_graph_nodes", recorder, ops, lambda: [env.fetch_graph_nodes(ids) for ids in rounds], unit="nodes"),
+            _timed("graph.load_nodes", recorder, ops, lambda: [env.load_nodes(ids) for ids in rounds], unit="nodes"),
+        ]
+    finally:
+        client.close()
+
+
+def bench_uploads(server: MockPraxos, args) -> List[Dict[str, Any]]:
+    recorder = Recorder()
+    client, env = _sync_env(server, recorder)
+    size = args.upload_mb * 1024 * 1024
+    records = [{"id": i, "name": f"record {i}", "values": list(range(20))} for i in range(20000)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "document.pdf")
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+        try:
+            return [
+                _timed("upload.add_file", recorder, args.upload_mb, lambda: env.add_file(path), unit="MB"),
+                _timed("upload.add_business_data", recorder, len(records), lambda: env.add_business_data({"records": records}), unit="records"),
+                _timed("upload.add_business_data_chunked", recorder, len(records),
+                       lambda: env.add_business_data_chunked(records, max_batch_bytes=256 * 1024), unit="records"),
+            ]
+        finally:
+            client.close()
+
+
+def bench_json_decode(server: MockPraxos, args) -> List[Dict[str, Any]]:
+    body = json.dumps(make_search_response(args.top_k, server.neighbours)).encode("utf-8")
+    megabytes = len(body) / 1e6
+    results = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_json_codec(name)
+        except ImportError:
+            continue
+        recorder = Recorder()
+        results.append(_timed(f"json.decode.{name}", recorder, round(megabytes * 200, 2), lambda: [codec.decode(body) for _ in range(200)], unit="MB"))
+    return results
+
+
+SCENARIOS = {
+    "search_sync": bench_search_sync,
+    "search_async": bench_search_async,
+    "extract": bench_extract,
+    "graph_nodes": bench_graph_nodes,
+    "uploads": bench_uploads,
+    "json_decode": bench_json_decode,
+}
+
+
+def _print_table(results: List[Dict[str, Any]], latency: float) -> None:
+    print(f"mock latency: {latency * 1000:.1f} ms per request")
+    print(f"{'scenario':<36}{'throughput':>20}{'requests':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for result in results:
+        throughput = f"{result['throughput']:,.1f} {result['unit']}/s"
+        print(f"{result['name']:<36}{throughput:>20}{result['requests']:>10}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}")
+
+
+def _regressions(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    previous = {result["name"]: result for result in baseline["results"]}
+    failures = []
+    for result in results:
+        before = previous.get(result["name"])
+        if before and result["throughput"] < before["throughput"] * (1 - tolerance):
+            failures.append(f"{result['name']}: {result['throughput']:,.1f} {result['unit']}/s vs baseline {before['throughput']:,.1f}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="select", default="", help="only run scenarios whose name contains this")
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds of injected server latency")
+    parser.add_argument("-n", type=int, default=200, help="searches per search scenario")
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--upload-mb", type=int, default=8)
+    parser.add_argument("--save", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare throughput against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed throughput drop vs baseline")
+    args = parser.parse_args()
+
+    server = MockPraxos(latency=args.latency)
+    results = []
+    for name, scenario in SCENARIOS.items():
+        if args.select in name:
+            results.extend(scenario(server, args))
+    _print_table(results, args.latency)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"latency": args.latency, "results": results}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = _regressions(results, json.load(f), args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
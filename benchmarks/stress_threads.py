@@ -0,0 +1,176 @@
+"""
+Thread-safety stress check: many threads share one SyncClient (with result cache, single-flight,
+metadata cache, instrumentation and rate limiter all enabled) against the in-process mock API,
+mixing searches, node loads, extraction, metadata lookups and ingestion. Every result is checked
+against what the mock serves and the shared state is checked for consistency afterwards.
+
+    python benchmarks/stress_threads.py                       # 64 threads
+    python benchmarks/stress_threads.py --threads 200 --rounds 20
+
+Exits 1 and lists the failures if any check fails.
+"""
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+from typing import Callable, List
+
+from praxos_python import (
+    SyncClient, SyncEnvironment, ResultCache, MetadataCache, Instrumentation, RateLimiter, RateLimit, RetryPolicy
+)
+
+from mock_server import MockPraxos
+from payloads import make_search_response
+
+BASE_URL = "http://praxos.mock/"
+
+
+class Failures:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.messages: List[str] = []
+
+    def add(self, message: str) -> None:
+        with self._lock:
+            self.messages.append(message)
+
+    def check(self, condition: bool, message: str) -> None:
+        if not condition:
+            self.add(message)
+
+
+def _run_threads(count: int, target: Callable[[int], None], failures: Failures) -> None:
+    barrier = threading.Barrier(count)
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except Exception as e:
+            failures.add(f"thread {index}: {type(e).__name__}: {e}")
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def check_mixed_workload(client: SyncClient, server: MockPraxos, args, failures: Failures) -> None:
+    """Every thread runs a random mix of operations on environment objects of its own."""
+    expected_hits = {top_k: make_search_response(top_k, server.neighbours)["hits"] for top_k in (3, 5, 8)}
+
+    def worker(index):
+        rng = random.Random(index)
+        env = client.get_environment(id="env-0")
+        for _ in range(args.rounds):
+            operation = rng.choice(("search", "search", "hybrid", "nodes", "extract", "metadata", "ingest", "sources"))
+            if operation == "search":
+                top_k = rng.choice((3, 5, 8))
+                # Few distinct queries, so threads collide in the cache and in single-flight.
+                hits = env.search(f"query {rng.randrange(4)}", top_k=top_k)
+                failures.check(hits == expected_hits[top_k], f"search top_k={top_k} returned unexpected hits")
+                hits[0]["score"] = -1.0  # callers own their results; must not leak into other threads
+            elif operation == "hybrid":
+                hits = env.hybrid_search("query 0", top_k=5, modalities=("fast", "graph"))
+                failures.check(len(hits) == 5, f"hybrid_search returned {len(hits)} hits")
+            elif operation == "nodes":
+                start = rng.randrange(0, 500)
+                ids = [f"node-{i}" for i in range(start, start + rng.randint(1, 60))]
+                nodes = env.load_nodes(ids)
+                failures.check([node["id"] for node in nodes] == ids, "load_nodes returned the wrong nodes")
+            elif operation == "extract":
+                count = sum(1 for _ in env.iter_items("Person", page_size=rng.choice((250, 1000))))
+                failures.check(count == server.total_items, f"iter_items yielded {count} of {server.total_items}")
+            elif operation == "metadata":
+                failures.check(client.get_environment(id="env-0").id == "env-0", "get_environment returned another environment")
+            elif operation == "ingest":
+                env.add_business_data({"records": [{"thread": index}]})
+            else:
+                count = sum(1 for _ in env.iter_sources(page_size=100))
+                failures.check(count == server.total_sources, f"iter_sources yielded {count} of {server.total_sources}")
+
+    _run_threads(args.threads, worker, failures)
+
+
+def check_shared_state(client: SyncClient, server: MockPraxos, failures: Failures) -> None:
+    """After the workload: counters agree with the server and nothing is left in flight."""
+    snapshot = client.config.instrumentation.metrics.snapshot()
+    recorded = sum(endpoint["requests"] for endpoint in snapshot.values())
+    served = sum(server.requests.values())
+    failures.check(recorded == served, f"metrics recorded {recorded} requests, the mock served {served}")
+    for name, stats in client.config.rate_limiter.stats().items():
+        failures.check(stats["in_flight"] == 0, f"rate limiter class {name} still has {stats['in_flight']} in flight")
+    failures.check(not client._single_flight._calls, "single-flight still holds calls")
+
+
+def check_invalidation_epochs(client: SyncClient, args, failures: Failures) -> None:
+    """Concurrent ingestions into one environment must each advance its epoch."""
+    before = client._ingestion_epochs.get("env-epochs", 0)
+    _run_threads(args.threads, lambda index: [client._invalidate_cache("env-epochs") for _ in range(50)], failures)
+    advanced = client._ingestion_epochs.get("env-epochs", 0) - before
+    failures.check(advanced == args.threads * 50, f"ingestion epoch advanced {advanced} times, expected {args.threads * 50}")
+
+
+def check_map_concurrent(client: SyncClient, failures: Failures) -> None:
+    """Results come back in input order, and a timeout cancels what has not started."""
+    env = SyncEnvironment(client, id="env-0", name="environment 0", created_at=None, description=None)
+    ids = [f"node-{i}" for i in range(200)]
+    results = env.map_concurrent("fetch_graph_nodes", [([node_id],) for node_id in ids], max_concurrency=16)
+    failures.check([result[0]["id"] for result in results] == ids, "map_concurrent returned results out of order")
+
+    def slow(item):
+        time.sleep(0.05)
+        return item
+
+    start = time.perf_counter()
+    results = env.map_concurrent(slow, range(400), max_concurrency=8, timeout=0.2)
+    elapsed = time.perf_counter() - start
+    finished = [(index, result) for index, result in enumerate(results) if not isinstance(result, TimeoutError)]
+    failures.check(elapsed < 1.0, f"map_concurrent took {elapsed:.2f}s to honour a 0.2s timeout")
+    # Calls running at the deadline may finish in any order, but each result stays in its input's slot.
+    failures.check(0 < len(finished) < 400 and all(index == result for index, result in finished),
+                   "map_concurrent timeout did not keep finished results in their slots")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=10, help="operations per thread")
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds of injected server latency")
+    args = parser.parse_args()
+
+    server = MockPraxos(latency=args.latency, total_items=2000)
+    failures = Failures()
+    limits = {name: RateLimit(rate=5000, burst=5000, max_in_flight=64) for name in ("search", "extract", "upload", "default")}
+    with tempfile.TemporaryDirectory() as directory:
+        client = SyncClient(
+            "stress-key", base_url=BASE_URL, transport=server.transport(),
+            cache=ResultCache(ttl=60), metadata_cache=MetadataCache(directory, ttl=0.01),
+            instrumentation=Instrumentation(), rate_limit=RateLimiter(limits),
+            retry_policy=RetryPolicy(max_retries=0), max_connections=args.threads,
+        )
+        server.reset_counters()
+        client.config.instrumentation.metrics.reset()
+        start = time.perf_counter()
+        try:
+            check_mixed_workload(client, server, args, failures)
+            check_shared_state(client, server, failures)
+            check_invalidation_epochs(client, args, failures)
+            check_map_concurrent(client, failures)
+        finally:
+            client.metadata_cache.close()
+            client.close()
+
+    print(f"{args.threads} threads x {args.rounds} operations, {sum(server.requests.values())} requests "
+          f"in {time.perf_counter() - start:.2f}s")
+    for message in sorted(set(failures.messages)):
+        print(f"FAIL {message}", file=sys.stderr)
+    print("OK" if not failures.messages else f"{len(failures.messages)} failures")
+    return 1 if failures.messages else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,15 +2,35 @@
 Praxos Python SDK
 """
 from .config import ClientConfig, DEFAULT_BASE_URL, SDK_VERSION
-from .exceptions import APIError
+from .exceptions import APIError, APIKeyInvalidError, CircuitOpenError
+from .cache import ResultCache
+from .metadata_cache import MetadataCache
+from .singleflight import SingleFlight, AsyncSingleFlight
+from .retry import RetryPolicy, CircuitBreaker
+from .ratelimit import RateLimiter, RateLimit
+from .codec import JSONCodec, get_json_codec
+from .instrumentation import Instrumentation, Metrics, RequestEvent
+from .models.loader import NodeLoader, AsyncNodeLoader
 
 # Client Imports
 from .client import SyncClient
+from .async_client import AsyncClient
 
 # Model/Resource Imports (these are the classes users will interact with)
 from .models import (
     SyncEnvironment,
     SyncSource,
+    AsyncEnvironment,
+    AsyncSource,
+    LocalEnvironment,
+    SearchHit,
+    SearchResults,
+    ContextBundle,
+    LexicalReranker,
+    fuse_results,
+    GraphTraversal,
+    AsyncGraphTraversal,
+    TraversalNode,
 )
 
 
@@ -20,9 +40,40 @@ __all__ = [
     'DEFAULT_BASE_URL',
     'SDK_VERSION',
     'APIError',
+    'APIKeyInvalidError',
+    'CircuitOpenError',
+    'ResultCache',
+    'MetadataCache',
+    'SingleFlight',
+    'AsyncSingleFlight',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'RateLimiter',
+    'RateLimit',
+    'JSONCodec',
+    'get_json_codec',
+    'Instrumentation',
+    'Metrics',
+    'RequestEvent',
+    'NodeLoader',
+    'AsyncNodeLoader',
+    'SearchHit',
+    'SearchResults',
+    'ContextBundle',
+    'LexicalReranker',
+    'fuse_results',
+    'GraphTraversal',
+    'AsyncGraphTraversal',
+    'TraversalNode',
 
     # Sync components
     'SyncClient',
     'SyncEnvironment',
     'SyncSource',
+
+    # Async components
+    'AsyncClient',
+    'AsyncEnvironment',
+    'AsyncSource',
+    'LocalEnvironment',
 ]
@@ -0,0 +1,274 @@
+# my_api_sdk/async_client.py
+import httpx
+import time
+import asyncio
+from typing import Dict, Any, AsyncIterator, Iterable, Optional, List, Tuple
+
+from .config import ClientConfig
+from .base_client import BaseClient
+from .cache import ResultCache
+from .metadata_cache import MetadataCache, ontology_json_schema
+from .singleflight import AsyncSingleFlight
+from .codec import JSONCodec
+from .instrumentation import Instrumentation
+from .retry import RetryPolicy, CircuitBreaker
+from .ratelimit import RateLimiter
+from .utils import aiter_pages
+from .models import AsyncEnvironment, AsyncOntology
+from typing import TYPE_CHECKING, Type, Union
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+class AsyncClient(BaseClient):
+    """
+    Asynchronous client for interacting with the API.
+
+    All requests share one pooled httpx.AsyncClient, so concurrent calls
+    (e.g. several searches under asyncio.gather) reuse open connections.
+    The API key is validated lazily, before the first request; await
+    validate_api_key() explicitly if an earlier failure is wanted.
+    """
+    _log_label = "async "
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 10.0,
+        cache: Optional[ResultCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[bool, CircuitBreaker] = False,
+        httpx_settings: Optional[Dict[str, Any]] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        upload_timeout: Optional[float] = 300.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        json_codec: Union[str, JSONCodec, None] = "auto",
+        compression: Union[bool, str, Iterable[str]] = True,
+        instrumentation: Optional[Instrumentation] = None,
+        rate_limit: Union[bool, RateLimiter, None] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        single_flight: bool = True,
+        metadata_cache: Optional[MetadataCache] = None,
+    ):
+        config = ClientConfig(
+            api_key=api_key, base_url=base_url, timeout=timeout, params=params,
+            retry_policy=retry_policy, circuit_breaker=circuit_breaker, httpx_settings=httpx_settings,
+            max_connections=max_connections, max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry, http2=http2,
+            connect_timeout=connect_timeout, read_timeout=read_timeout,
+            write_timeout=write_timeout, pool_timeout=pool_timeout, upload_timeout=upload_timeout,
+            transport=transport, json_codec=json_codec, compression=compression,
+            instrumentation=instrumentation, rate_limit=rate_limit
+        )
+        super().__init__(config, cache, metadata_cache)
+
+        # Requests carry their own URL, headers and params, so the pool can be shared across API keys.
+        if http_client is not None:
+            self._http_client = http_client
+            self._owns_http_client = False
+        else:
+            self._http_client = httpx.AsyncClient(
+                base_url=self.config.base_url,
+                headers=self.config.common_headers,
+                params=self.config.params,
+                **self.config.pool_settings()
+            )
+            self._owns_http_client = True
+
+        # Concurrent identical search/get_context calls share one request unless single_flight=False.
+        self._single_flight = AsyncSingleFlight() if single_flight else None
+
+        # The key is validated on the first request (a constructor cannot await), once per process.
+        self._validation_lock = asyncio.Lock()
+        self._needs_validation = not self.config.is_api_key_validated()
+
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        retryable: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        return_response: bool = False,
+        skip_validation: bool = False
+    ) -> Union[Dict[str, Any], Tuple[Dict[str, Any], httpx.Response]]:
+        if self._needs_validation and not skip_validation:
+            await self._ensure_api_key_validated()
+
+        request_start = time.perf_counter()
+        content, headers, event = self._start_request(method, endpoint, json_data, data, files, content, headers)
+        try:
+            http_start = time.perf_counter()
+            response, retries = await self._send(
+                method,
+                endpoint,
+                retryable=retryable,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+                params=params,
+                data=data,
+                files=files,
+                content=content,
+                headers=headers
+            )
+            return self._finish_request(method, endpoint, response, retries, event, request_start, http_start, return_response)
+        except Exception as e:
+            error = self._request_error(e, event, method, endpoint, request_start)
+            if error is e:
+                raise
+            raise error from e
+        finally:
+            self._end_request(event, request_start)
+
+    async def _send(self, method: str, endpoint: str, retryable: Optional[bool] = None, **request_kwargs: Any) -> Tuple[httpx.Response, int]:
+        """See SyncClient._send."""
+        retryable, url, params, headers = self._prepare_send(method, endpoint, retryable, request_kwargs)
+        limiter = self.config.rate_limiter
+
+        attempt = 0
+        while True:
+            trial = self._before_attempt()
+            budget = None
+            try:
+                if limiter is not None:
+                    budget, _ = await limiter.acquire_async(method, endpoint)
+                response = await self._http_client.request(
+                    method, url=url, headers=headers, params=params, **request_kwargs
+                )
+            except httpx.RequestError as e:
+                delay = self._attempt_failed(budget, attempt, retryable)
+                if delay is None:
+                    raise
+                reason = str(e) or type(e).__name__
+            except BaseException:
+                self._attempt_aborted(budget, trial)
+                raise
+            else:
+                delay = self._attempt_completed(response, budget, attempt, retryable)
+                if delay is None:
+                    return response, attempt
+                reason = f"status_code={response.status_code}"
+                await response.aclose()
+
+            attempt += 1
+            self._log_retry(method, endpoint, reason, attempt, delay)
+            await asyncio.sleep(delay)
+
+    async def _cached_request(self, endpoint: str, json_data: Dict[str, Any]) -> Dict[str, Any]:
+        """See SyncClient._cached_request."""
+        if self.cache is None and self._single_flight is None:
+            return await self._request("POST", endpoint, json_data=json_data)
+
+        environment_id, key, cached = self._cache_lookup(endpoint, json_data)
+        if cached is not None:
+            return cached
+        if self._single_flight is None:
+            return await self._fetch_query(endpoint, json_data, key, environment_id)
+
+        codec = self.config.json_codec
+        result, shared = await self._single_flight.do(self._flight_key(environment_id, key),
+                                                      lambda: self._fetch_query(endpoint, json_data, key, environment_id),
+                                                      share=codec.encode)
+        return codec.decode(result) if shared else result
+
+    async def _fetch_query(self, endpoint: str, json_data: Dict[str, Any], key: str, environment_id: Optional[str]) -> Dict[str, Any]:
+        if self.cache is None:
+            return await self._request("POST", endpoint, json_data=json_data)
+        generation = self.cache.generation(environment_id)
+        result = await self._request("POST", endpoint, json_data=json_data)
+        self.cache.set(key, result, environment_id=environment_id, generation=generation)
+        return result
+
+    async def _get_metadata(self, kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """See SyncClient._get_metadata."""
+        if self.metadata_cache is None:
+            return await self._request("GET", kind, params=params)
+
+        key, entry = self._metadata_lookup(kind, params)
+        if entry is not None and entry.fresh:
+            return entry.value
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        result, response = await self._request("GET", kind, params=params, headers=headers, return_response=True)
+        return self._metadata_stored(key, entry, result, response)
+
+    async def validate_api_key(self) -> None:
+        """Validates the API key, raising APIKeyInvalidError if the API rejects it."""
+        # Other requests wait for the key to be validated, so this one must not.
+        await self._request("GET", "api-token-validataion", skip_validation=True)
+        self.config.mark_api_key_validated()
+        self._needs_validation = False
+
+    async def _ensure_api_key_validated(self) -> None:
+        async with self._validation_lock:
+            if self._needs_validation:
+                await self.validate_api_key()
+
+
+    async def create_environment(self, name: str, description: str=None, ontologies: List[Union[AsyncOntology, str]]=None) -> AsyncEnvironment:
+        """Creates an environment."""
+        payload = self._environment_payload(name, description, ontologies, AsyncOntology)
+        response_data = await self._request("POST", "environment", json_data=payload)
+        self._remember_metadata("environment", response_data)
+        return AsyncEnvironment(client=self, **response_data)
+
+    async def get_environments(self) -> List[AsyncEnvironment]:
+        """Retrieves all environments."""
+        response_data = await self._request("GET", "environment")
+        return [AsyncEnvironment(client=self, **env) for env in response_data]
+
+    async def iter_environments(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[AsyncEnvironment]:
+        """Streams all environments page by page (limit/offset), prefetching the next page."""
+        async def fetch_page(offset, limit):
+            return await self._request("GET", "environment", params={"limit": limit, "offset": offset})
+
+        async for env in aiter_pages(fetch_page, page_size, prefetch=prefetch):
+            yield AsyncEnvironment(client=self, **env)
+
+    async def get_environment(self, id: str=None, name: str=None) -> AsyncEnvironment:
+        """Retrieves an environment by name or id."""
+        response_data = await self._get_metadata("environment", self._lookup_params(id, name))
+        return AsyncEnvironment(client=self, **response_data)
+
+    async def create_ontology(self, name: str, schemas: List[Type["BaseModel"]], description: str=None) -> AsyncOntology:
+        """Creates an ontology."""
+        self._check_ontology_args(name, schemas)
+        json_schema = ontology_json_schema(schemas, cache=self.metadata_cache)
+        response_data = await self._request("POST", "ontology", json_data={"name": name, "description": description, "schemas": json_schema})
+        self._remember_metadata("ontology", response_data)
+        return AsyncOntology(client=self, **response_data)
+
+
+    async def get_ontology(self, id: str=None, name: str=None) -> AsyncOntology:
+        """Retrieves an ontology by name or id."""
+        response_data = await self._get_metadata("ontology", self._lookup_params(id, name))
+        return AsyncOntology(client=self, **response_data)
+
+    async def get_ontologies(self) -> List[AsyncOntology]:
+        """Retrieves all ontologies."""
+        response_data = await self._request("GET", "ontology")
+        return [AsyncOntology(client=self, **ontology) for ontology in response_data]
+
+    async def close(self) -> None:
+        """Closes the underlying httpx client unless it was passed in by the caller."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> 'AsyncClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -0,0 +1,252 @@
+import httpx
+import time
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from .config import ClientConfig
+from .cache import ResultCache
+from .metadata_cache import MetadataCache, MetadataEntry
+from .instrumentation import RequestEvent
+from .ratelimit import _Budget
+from .exceptions import APIError
+from .utils import parse_httpx_error, handle_response_content
+
+class BaseClient:
+    """
+    State and request handling shared by SyncClient and AsyncClient.
+
+    Everything except the I/O lives here: request encoding, instrumentation, response
+    handling, error mapping, the retry/circuit breaker/rate limiter bookkeeping of each attempt,
+    result and metadata cache lookups. The subclasses only send, sleep and await.
+    """
+    # Marks the client's log lines ("" or "async ").
+    _log_label = ""
+
+    def __init__(self, config: ClientConfig, cache: Optional[ResultCache], metadata_cache: Optional[MetadataCache]):
+        self.config = config
+        # Opt-in result cache for search/get_context; None disables caching.
+        self.cache = cache
+        self._ingestion_epochs: Dict[str, int] = {}
+        # Taken by both clients: ingestion can run in threads (SyncClient, or AsyncClient driven from executors).
+        self._state_lock = threading.Lock()
+        # Optional on-disk cache of environment/ontology lookups and ontology schemas.
+        self.metadata_cache = metadata_cache
+        # Per-environment node loaders (see SyncEnvironment.node_loader), cleared with the cache.
+        self._node_loaders: Dict[str, Any] = {}
+
+    # Requests
+
+    def _start_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        files: Optional[Dict[str, Any]],
+        content: Optional[bytes],
+        headers: Optional[Dict[str, str]]
+    ) -> Tuple[Optional[bytes], Optional[Dict[str, str]], Optional[RequestEvent]]:
+        """Encodes the body and opens the instrumentation event; returns the body, headers and event."""
+        logger = logging.getLogger(__name__)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("PRAXOS-PYTHON: Starting %s%s request to %s", self._log_label, method, self.config.url_for(endpoint))
+
+        # JSON bodies are encoded with the configured codec rather than httpx's json=.
+        if json_data is not None and not files and not data and content is None:
+            content = self.config.json_codec.encode(json_data)
+        if content is not None:
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        instrumentation = self.config.instrumentation
+        event = instrumentation.start(method, endpoint, len(content) if content is not None else 0) if instrumentation is not None else None
+        return content, headers, event
+
+    def _finish_request(
+        self,
+        method: str,
+        endpoint: str,
+        response: httpx.Response,
+        retries: int,
+        event: Optional[RequestEvent],
+        request_start: float,
+        http_start: float,
+        return_response: bool
+    ) -> Any:
+        """Checks the status of a (fully read) response and decodes its body."""
+        http_time = time.perf_counter() - http_start
+        if event is not None:
+            event.status_code = response.status_code
+            event.retries = retries
+            event.http_time = http_time
+            event.response_bytes = len(response.content)
+
+        processing_start = time.perf_counter()
+        # A 304 answers a conditional request; callers asking for the response handle it.
+        if not (return_response and response.status_code == 304):
+            response.raise_for_status()
+        result = handle_response_content(response, self.config.json_codec.decode)
+        processing_time = time.perf_counter() - processing_start
+        total_time = time.perf_counter() - request_start
+        if event is not None:
+            event.processing_time = processing_time
+
+        logging.getLogger(__name__).debug(
+            "PRAXOS-PYTHON: %s%s %s completed - http_request=%.3fs, response_processing=%.3fs, "
+            "total_time=%.3fs, retries=%d, status_code=%d",
+            self._log_label, method, endpoint, http_time, processing_time, total_time, retries, response.status_code
+        )
+        return (result, response) if return_response else result
+
+    def _request_error(self, e: Exception, event: Optional[RequestEvent], method: str, endpoint: str, request_start: float) -> Exception:
+        """Maps an exception raised by a request to the one raised to the caller, and records it."""
+        logger = logging.getLogger(__name__)
+        if isinstance(e, httpx.HTTPStatusError):
+            error = parse_httpx_error(e)
+            logger.error("PRAXOS-PYTHON: %s%s %s failed with HTTP error in %.3fs - %s",
+                         self._log_label, method, endpoint, time.perf_counter() - request_start, e)
+        elif isinstance(e, httpx.RequestError):
+            error = APIError(status_code=0, message=f"Request failed: {str(e)}")
+            logger.error("PRAXOS-PYTHON: %s%s %s failed with request error in %.3fs - %s",
+                         self._log_label, method, endpoint, time.perf_counter() - request_start, e)
+        else:
+            error = e
+        if event is not None:
+            event.error = error
+        return error
+
+    def _end_request(self, event: Optional[RequestEvent], request_start: float) -> None:
+        if event is not None:
+            event.total_time = time.perf_counter() - request_start
+            self.config.instrumentation.finish(event)
+
+    # Attempts. _send applies the circuit breaker, rate limiter and retry policy from the config;
+    # these helpers do the bookkeeping around each attempt and decide whether to retry.
+
+    def _prepare_send(self, method: str, endpoint: str, retryable: Optional[bool],
+                      request_kwargs: Dict[str, Any]) -> Tuple[bool, httpx.URL, Optional[Dict[str, Any]], Dict[str, str]]:
+        """Returns whether the request may be replayed, its URL, params and headers."""
+        if retryable is None:
+            retryable = self.config.retry_policy.is_retryable_request(method, endpoint)
+        params = request_kwargs.pop("params", None)
+        if self.config.params:
+            params = {**self.config.params, **(params or {})}
+        extra_headers = request_kwargs.pop("headers", None)
+        headers = {**self.config.common_headers, **extra_headers} if extra_headers else self.config.common_headers
+        return retryable, self.config.url_for(endpoint), params, headers
+
+    def _before_attempt(self) -> bool:
+        """Raises CircuitOpenError if the circuit breaker holds this attempt back; True if it is the breaker's trial."""
+        if self.config.circuit_breaker is None:
+            return False
+        return self.config.circuit_breaker.before_request(self.config.base_url.host)
+
+    def _attempt_failed(self, budget: Optional[_Budget], attempt: int, retryable: bool) -> Optional[float]:
+        """After a connection error: returns the delay before the next attempt, or None to give up."""
+        if budget is not None:
+            self.config.rate_limiter.release(budget)
+        if self.config.circuit_breaker is not None:
+            self.config.circuit_breaker.record_failure()
+        policy = self.config.retry_policy
+        if not retryable or attempt >= policy.max_retries:
+            return None
+        return policy.get_backoff(attempt)
+
+    def _attempt_aborted(self, budget: Optional[_Budget], trial: bool) -> None:
+        """
+        After anything other than a response or a connection error: cancellation, KeyboardInterrupt,
+        an exception from an upload's progress callback. The attempt says nothing about the server,
+        but a half-open trial must still give its slot back or the circuit never closes again.
+        """
+        if budget is not None:
+            self.config.rate_limiter.release(budget)
+        if trial:
+            self.config.circuit_breaker.release_trial()
+
+    def _attempt_completed(self, response: httpx.Response, budget: Optional[_Budget], attempt: int, retryable: bool) -> Optional[float]:
+        """After a response: returns the delay before the next attempt, or None to return the response."""
+        if budget is not None:
+            self.config.rate_limiter.release(budget, response)
+        breaker = self.config.circuit_breaker
+        if breaker is not None:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        policy = self.config.retry_policy
+        if not (retryable and attempt < policy.max_retries and policy.is_retryable_status(response.status_code)):
+            return None
+        return policy.get_backoff(attempt, response)
+
+    def _log_retry(self, method: str, endpoint: str, reason: str, attempt: int, delay: float) -> None:
+        logging.getLogger(__name__).warning("PRAXOS-PYTHON: %s%s %s %s, retry %d/%d in %.2fs", self._log_label,
+                                            method, endpoint, reason, attempt, self.config.retry_policy.max_retries, delay)
+
+    # Result cache and single-flight
+
+    def _cache_lookup(self, endpoint: str, json_data: Dict[str, Any]) -> Tuple[Optional[str], str, Optional[Dict[str, Any]]]:
+        """Returns the query's environment id, cache key and cached result (None on a miss)."""
+        key = ResultCache.make_key(endpoint, json_data)
+        cached = self.cache.get(key) if self.cache is not None else None
+        return json_data.get("environment_id"), key, cached
+
+    def _flight_key(self, environment_id: Optional[str], key: str) -> str:
+        # The ingestion epoch keeps queries issued after new data was added from joining older flights.
+        return f"{self._ingestion_epochs.get(environment_id, 0)}:{key}"
+
+    def _invalidate_cache(self, environment_id: str) -> None:
+        """Drops cached results of an environment after new data was ingested into it."""
+        with self._state_lock:
+            self._ingestion_epochs[environment_id] = self._ingestion_epochs.get(environment_id, 0) + 1
+        if self.cache is not None:
+            self.cache.invalidate_environment(environment_id)
+        loader = self._node_loaders.get(environment_id)
+        if loader is not None:
+            loader.clear()
+
+    # Metadata cache
+
+    def _metadata_lookup(self, kind: str, params: Dict[str, Any]) -> Tuple[str, Optional[MetadataEntry]]:
+        key = self.metadata_cache.make_key(self.config, kind, params)
+        return key, self.metadata_cache.get(key)
+
+    def _metadata_stored(self, key: str, entry: Optional[MetadataEntry], result: Dict[str, Any], response: httpx.Response) -> Dict[str, Any]:
+        """Stores a metadata response, or refreshes the cached entry it revalidated (304)."""
+        if response.status_code == 304:
+            if entry is None:
+                # Only sent without If-None-Match, so there is nothing to revalidate and no body to cache.
+                raise APIError(status_code=304, message="Not Modified returned for metadata that is not cached")
+            self.metadata_cache.touch(key)
+            return entry.value
+        self.metadata_cache.set(key, result, etag=response.headers.get("ETag"))
+        return result
+
+    def _remember_metadata(self, kind: str, data: Dict[str, Any]) -> None:
+        """Seeds the metadata cache with a just-created resource, under both its id and its name."""
+        if self.metadata_cache is not None:
+            for field in ("id", "name"):
+                if data.get(field):
+                    self.metadata_cache.set(self.metadata_cache.make_key(self.config, kind, {field: data[field]}), data)
+
+    # Argument checks of the resource methods
+
+    @staticmethod
+    def _lookup_params(id: Optional[str], name: Optional[str]) -> Dict[str, str]:
+        if id is None and name is None:
+            raise ValueError("Either id or name must be provided")
+        return {"id": id} if id else {"name": name}
+
+    @staticmethod
+    def _environment_payload(name: str, description: Optional[str], ontologies: Optional[List[Any]], ontology_type: type) -> Dict[str, Any]:
+        if not name:
+            raise ValueError("Environment name is required")
+        ontology_ids = [ontology.id if isinstance(ontology, ontology_type) else ontology for ontology in ontologies] if ontologies else None
+        return {"name": name, "description": description, "ontology_ids": ontology_ids}
+
+    @staticmethod
+    def _check_ontology_args(name: str, schemas: Any) -> None:
+        if not name:
+            raise ValueError("Ontology name is required")
+        if not schemas:
+            raise ValueError("At least one schema is required")
+        if not isinstance(schemas, list):
+            raise ValueError("Schemas must be a list")
@@ -0,0 +1,131 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class ResultCache:
+    """
+    Thread-safe, in-memory TTL/LRU cache for read-only query results (search, get_context).
+
+    Entries are keyed on the canonical JSON form of the endpoint and request payload, so any
+    difference in environment_id, search_modality or filters produces a separate entry.
+    Values are stored as encoded JSON, which bounds memory by max_bytes and hands every
+    caller a fresh copy that it can mutate freely.
+    """
+    def __init__(self, ttl: float = 300.0, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # key -> (expires_at, environment_id, encoded value)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._keys_by_environment: Dict[Optional[str], set] = {}
+        self._generations: Dict[Optional[str], int] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f"<ResultCache entries={len(self._entries)} bytes={self._bytes} ttl={self.ttl}>"
+
+    @staticmethod
+    def make_key(endpoint: str, payload: Dict[str, Any]) -> str:
+        """Returns the canonical cache key for a request."""
+        body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{endpoint.strip('/')}:{body}"
+
+    def generation(self, environment_id: Optional[str]) -> int:
+        """Returns the invalidation generation of an environment; see set()."""
+        with self._lock:
+            return self._generations.get(environment_id, 0)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns a copy of the cached value, or None on a miss or an expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            blob = entry[2]
+        return json.loads(blob)
+
+    def set(self, key: str, value: Any, environment_id: Optional[str] = None, generation: Optional[int] = None) -> None:
+        """
+        Stores a value. If generation is given and the environment has been invalidated since
+        it was read, the value is dropped: it may predate the ingestion that invalidated it.
+        """
+        blob = json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+        if len(blob) > self.max_bytes:
+            return
+
+        with self._lock:
+            if generation is not None and self._generations.get(environment_id, 0) != generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl, environment_id, blob)
+            self._keys_by_environment.setdefault(environment_id, set()).add(key)
+            self._bytes += len(blob)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate_environment(self, environment_id: str) -> int:
+        """Drops every entry of an environment and returns how many were removed."""
+        with self._lock:
+            self._generations[environment_id] = self._generations.get(environment_id, 0) + 1
+            keys = self._keys_by_environment.pop(environment_id, set())
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drops all entries. Counters are kept."""
+        with self._lock:
+            for environment_id in list(self._keys_by_environment):
+                self._generations[environment_id] = self._generations.get(environment_id, 0) + 1
+            self._entries.clear()
+            self._keys_by_environment.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: str) -> None:
+        # Caller holds the lock.
+        _, environment_id, blob = self._entries.pop(key)
+        self._bytes -= len(blob)
+        keys = self._keys_by_environment.get(environment_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_environment[environment_id]
@@ -1,39 +1,118 @@
 # my_api_sdk/sync_client.py
 import httpx
 import time
-import logging
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
 
 from .config import ClientConfig
-from .exceptions import APIError, APIKeyInvalidError
-from .utils import parse_httpx_error, handle_response_content
+from .base_client import BaseClient
+from .cache import ResultCache
+from .metadata_cache import MetadataCache, ontology_json_schema
+from .singleflight import SingleFlight
+from .codec import JSONCodec
+from .instrumentation import Instrumentation
+from .retry import RetryPolicy, CircuitBreaker
+from .ratelimit import RateLimiter
+from .utils import iter_pages
 from .models import SyncEnvironment, SyncOntology
-from pydantic import BaseModel
-from typing import Type, Union
-from pydantic import TypeAdapter
+from typing import TYPE_CHECKING, Type, Union
 
-class SyncClient:
-    """Synchronous client for interacting with the API."""
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+_shared_http_clients: Dict[tuple, httpx.Client] = {}
+_shared_http_clients_lock = threading.Lock()
+
+def get_shared_http_client(config: ClientConfig) -> httpx.Client:
+    """
+    Returns the process-wide pooled httpx.Client for config's pool settings, creating it on first use.
+    SyncClients built with share_pool=True and equal pool settings reuse it, whatever their API key.
+    """
+    key = config.pool_key()
+    with _shared_http_clients_lock:
+        http_client = _shared_http_clients.get(key)
+        if http_client is None or http_client.is_closed:
+            http_client = _shared_http_clients[key] = httpx.Client(**config.pool_settings())
+        return http_client
+
+class SyncClient(BaseClient):
+    """
+    Synchronous client for interacting with the API.
+
+    A SyncClient is thread-safe and meant to be shared: one instance (and the environments,
+    sources and ontologies it returns) can be used from any number of threads at once. Requests
+    go through httpx's thread-safe connection pool, and every piece of shared mutable state (the
+    result cache, single-flight, metadata cache, node loaders, rate limiter, metrics and the
+    ingestion epochs) is guarded by its own lock. New shared state must keep that guarantee;
+    tests/test_thread_safety.py checks it under many threads (benchmarks/stress_threads.py at scale).
+    """
     def __init__(
         self,
         api_key: str,
         base_url: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
         timeout: float = 10.0,
+        cache: Optional[ResultCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[bool, CircuitBreaker] = False,
+        httpx_settings: Optional[Dict[str, Any]] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        upload_timeout: Optional[float] = 300.0,
+        transport: Optional[httpx.BaseTransport] = None,
+        json_codec: Union[str, JSONCodec, None] = "auto",
+        compression: Union[bool, str, Iterable[str]] = True,
+        instrumentation: Optional[Instrumentation] = None,
+        rate_limit: Union[bool, RateLimiter, None] = None,
+        http_client: Optional[httpx.Client] = None,
+        share_pool: bool = False,
+        lazy_validation: bool = False,
+        single_flight: bool = True,
+        metadata_cache: Optional[MetadataCache] = None,
     ):
-        self.config = ClientConfig(
-            api_key=api_key, base_url=base_url, timeout=timeout, params=params
+        config = ClientConfig(
+            api_key=api_key, base_url=base_url, timeout=timeout, params=params,
+            retry_policy=retry_policy, circuit_breaker=circuit_breaker, httpx_settings=httpx_settings,
+            max_connections=max_connections, max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry, http2=http2,
+            connect_timeout=connect_timeout, read_timeout=read_timeout,
+            write_timeout=write_timeout, pool_timeout=pool_timeout, upload_timeout=upload_timeout,
+            transport=transport, json_codec=json_codec, compression=compression,
+            instrumentation=instrumentation, rate_limit=rate_limit
         )
+        super().__init__(config, cache, metadata_cache)
 
-        self._http_client = httpx.Client(
-            base_url=self.config.base_url,
-            headers=self.config.common_headers,
-            timeout=self.config.timeout,
-            params=self.config.params,
-            **self.config.httpx_settings
-        )
+        # Requests carry their own URL, headers and params, so the pool can be shared across API keys.
+        if http_client is not None:
+            self._http_client = http_client
+            self._owns_http_client = False
+        elif share_pool:
+            self._http_client = get_shared_http_client(self.config)
+            self._owns_http_client = False
+        else:
+            self._http_client = httpx.Client(
+                base_url=self.config.base_url,
+                headers=self.config.common_headers,
+                params=self.config.params,
+                **self.config.pool_settings()
+            )
+            self._owns_http_client = True
+
+        # Concurrent identical search/get_context calls share one request unless single_flight=False.
+        self._single_flight = SingleFlight() if single_flight else None
 
-        self.validate_api_key()
+        # Keys already validated in this process are trusted; with lazy_validation the
+        # check is deferred to the first request instead of blocking construction.
+        self._validation_lock = threading.Lock()
+        self._needs_validation = not self.config.is_api_key_validated()
+        if self._needs_validation and not lazy_validation:
+            self._ensure_api_key_validated()
 
 
     def _request(
@@ -43,112 +122,171 @@ class SyncClient:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
-        files: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        logger = logging.getLogger(__name__)
-        
-        # Log request details
-        request_start = time.time()
-        url = f"{self.config.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"PRAXOS-PYTHON: Starting {method} request to {url}")
-        
+        files: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        retryable: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        return_response: bool = False,
+        skip_validation: bool = False
+    ) -> Union[Dict[str, Any], Tuple[Dict[str, Any], httpx.Response]]:
+        if self._needs_validation and not skip_validation:
+            self._ensure_api_key_validated()
+
+        request_start = time.perf_counter()
+        content, headers, event = self._start_request(method, endpoint, json_data, data, files, content, headers)
         try:
-            # Time the actual HTTP request
-            http_start = time.time()
-            response = self._http_client.request(
+            http_start = time.perf_counter()
+            response, retries = self._send(
                 method,
-                url=endpoint.lstrip('/'),
+                endpoint,
+                retryable=retryable,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
                 params=params,
-                json=json_data if not files and not data else None,
                 data=data,
-                files=files
+                files=files,
+                content=content,
+                headers=headers
             )
-            http_time = time.time() - http_start
-            
-            # Time response processing
-            processing_start = time.time()
-            response.raise_for_status()
-            result = handle_response_content(response)
-            processing_time = time.time() - processing_start
-            
-            total_time = time.time() - request_start
-            
-            logger.info(f"PRAXOS-PYTHON: {method} {endpoint} completed - "
-                       f"http_request={http_time:.3f}s, "
-                       f"response_processing={processing_time:.3f}s, "
-                       f"total_time={total_time:.3f}s, "
-                       f"status_code={response.status_code}")
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            error_time = time.time() - request_start
-            logger.error(f"PRAXOS-PYTHON: {method} {endpoint} failed with HTTP error in {error_time:.3f}s - {e}")
-            raise parse_httpx_error(e) from e
-        except httpx.RequestError as e:
-            error_time = time.time() - request_start
-            logger.error(f"PRAXOS-PYTHON: {method} {endpoint} failed with request error in {error_time:.3f}s - {e}")
-            raise APIError(status_code=0, message=f"Request failed: {str(e)}") from e
-        
+            return self._finish_request(method, endpoint, response, retries, event, request_start, http_start, return_response)
+        except Exception as e:
+            error = self._request_error(e, event, method, endpoint, request_start)
+            if error is e:
+                raise
+            raise error from e
+        finally:
+            self._end_request(event, request_start)
+
+    def _send(self, method: str, endpoint: str, retryable: Optional[bool] = None, **request_kwargs: Any) -> Tuple[httpx.Response, int]:
+        """
+        Sends one logical request, applying the circuit breaker and retry policy from the config.
+        retryable overrides the policy's decision of whether this request may be replayed.
+        Returns the final response (which may still be an error status) and the number of retries.
+        """
+        retryable, url, params, headers = self._prepare_send(method, endpoint, retryable, request_kwargs)
+        limiter = self.config.rate_limiter
+
+        attempt = 0
+        while True:
+            trial = self._before_attempt()
+            budget = None
+            try:
+                if limiter is not None:
+                    budget, _ = limiter.acquire(method, endpoint)
+                response = self._http_client.request(
+                    method, url=url, headers=headers, params=params, **request_kwargs
+                )
+            except httpx.RequestError as e:
+                delay = self._attempt_failed(budget, attempt, retryable)
+                if delay is None:
+                    raise
+                reason = str(e) or type(e).__name__
+            except BaseException:
+                self._attempt_aborted(budget, trial)
+                raise
+            else:
+                delay = self._attempt_completed(response, budget, attempt, retryable)
+                if delay is None:
+                    return response, attempt
+                reason = f"status_code={response.status_code}"
+                response.close()
+
+            attempt += 1
+            self._log_retry(method, endpoint, reason, attempt, delay)
+            time.sleep(delay)
+
+    def _cached_request(self, endpoint: str, json_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POSTs a read-only query. Identical queries already in flight are joined rather than sent
+        again (single-flight), and results are served from the result cache when one is configured.
+        """
+        if self.cache is None and self._single_flight is None:
+            return self._request("POST", endpoint, json_data=json_data)
+
+        environment_id, key, cached = self._cache_lookup(endpoint, json_data)
+        if cached is not None:
+            return cached
+        if self._single_flight is None:
+            return self._fetch_query(endpoint, json_data, key, environment_id)
+
+        # Joiners get the result encoded before the leader returns, and each decodes its own copy
+        # to mutate, as with the result cache.
+        codec = self.config.json_codec
+        result, shared = self._single_flight.do(self._flight_key(environment_id, key),
+                                                lambda: self._fetch_query(endpoint, json_data, key, environment_id),
+                                                share=codec.encode)
+        return codec.decode(result) if shared else result
+
+    def _fetch_query(self, endpoint: str, json_data: Dict[str, Any], key: str, environment_id: Optional[str]) -> Dict[str, Any]:
+        if self.cache is None:
+            return self._request("POST", endpoint, json_data=json_data)
+        generation = self.cache.generation(environment_id)
+        result = self._request("POST", endpoint, json_data=json_data)
+        self.cache.set(key, result, environment_id=environment_id, generation=generation)
+        return result
+
+    def _get_metadata(self, kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GETs environment/ontology metadata, through the on-disk metadata cache when one is configured."""
+        if self.metadata_cache is None:
+            return self._request("GET", kind, params=params)
+
+        key, entry = self._metadata_lookup(kind, params)
+        if entry is not None and entry.fresh:
+            return entry.value
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        result, response = self._request("GET", kind, params=params, headers=headers, return_response=True)
+        return self._metadata_stored(key, entry, result, response)
+
     def validate_api_key(self) -> None:
-        """Validates the API key."""
-        self._request("GET", "api-token-validataion")
+        """Validates the API key, raising APIKeyInvalidError if the API rejects it."""
+        # Other requests wait for the key to be validated, so this one must not.
+        self._request("GET", "api-token-validataion", skip_validation=True)
+        self.config.mark_api_key_validated()
+        self._needs_validation = False
+
+    def _ensure_api_key_validated(self) -> None:
+        with self._validation_lock:
+            if self._needs_validation:
+                self.validate_api_key()
         
 
     def create_environment(self, name: str, description: str=None, ontologies: List[Union[SyncOntology, str]]=None) -> SyncEnvironment:
         """Creates an environment."""
-
-        if not name:
-            raise ValueError("Environment name is required")
-        
-        ontology_ids = [ontology.id if isinstance(ontology, SyncOntology) else ontology for ontology in ontologies] if ontologies else None
-
-        response_data = self._request("POST", "environment", json_data={"name": name, "description": description, "ontology_ids": ontology_ids})
+        payload = self._environment_payload(name, description, ontologies, SyncOntology)
+        response_data = self._request("POST", "environment", json_data=payload)
+        self._remember_metadata("environment", response_data)
         return SyncEnvironment(client=self, **response_data)
 
     def get_environments(self) -> List[SyncEnvironment]:
         """Retrieves all environments."""
         response_data = self._request("GET", "environment")
         return [SyncEnvironment(client=self, **env) for env in response_data]
+
+    def iter_environments(self, page_size: int = 100, prefetch: bool = True) -> Iterator[SyncEnvironment]:
+        """Streams all environments page by page (limit/offset), prefetching the next page."""
+        def fetch_page(offset, limit):
+            return self._request("GET", "environment", params={"limit": limit, "offset": offset})
+
+        for env in iter_pages(fetch_page, page_size, prefetch=prefetch):
+            yield SyncEnvironment(client=self, **env)
     
     def get_environment(self, id: str=None, name: str=None) -> SyncEnvironment:
         """Retrieves an environment by name or id."""
-
-        if id is None and name is None:
-            raise ValueError("Either id or name must be provided")
-        
-        if id:
-            response_data = self._request("GET", "environment", params={"id": id})
-        else:
-            response_data = self._request("GET", "environment", params={"name": name})
+        response_data = self._get_metadata("environment", self._lookup_params(id, name))
         return SyncEnvironment(client=self, **response_data)
     
-    def create_ontology(self, name: str, schemas: List[Type[BaseModel]], description: str=None) -> SyncOntology:
+    def create_ontology(self, name: str, schemas: List[Type["BaseModel"]], description: str=None) -> SyncOntology:
         """Creates an ontology."""
-        if not name:
-            raise ValueError("Ontology name is required")
-        
-        if not schemas:
-            raise ValueError("At least one schema is required")
-        
-        if not isinstance(schemas, list):
-            raise ValueError("Schemas must be a list")
-        
-        json_schema = TypeAdapter(Union[tuple(schemas)]).json_schema()
+        self._check_ontology_args(name, schemas)
+        json_schema = ontology_json_schema(schemas, cache=self.metadata_cache)
         response_data = self._request("POST", "ontology", json_data={"name": name, "description": description, "schemas": json_schema})
+        self._remember_metadata("ontology", response_data)
         return SyncOntology(client=self, **response_data)
         
     
     def get_ontology(self, id: str=None, name: str=None) -> SyncOntology:
         """Retrieves an ontology by name or id."""
-
-        if id is None and name is None:
-            raise ValueError("Either id or name must be provided")
-        
-        if id:
-            response_data = self._request("GET", "ontology", params={"id": id})
-        else:
-            response_data = self._request("GET", "ontology", params={"name": name})
+        response_data = self._get_metadata("ontology", self._lookup_params(id, name))
         return SyncOntology(client=self, **response_data)
     
     def get_ontologies(self) -> List[SyncOntology]:
@@ -157,8 +295,9 @@ class SyncClient:
         return [SyncOntology(client=self, **ontology) for ontology in response_data]
 
     def close(self) -> None:
-        """Closes the underlying httpx client."""
-        self._http_client.close()
+        """Closes the underlying httpx client unless it is shared or was passed in by the caller."""
+        if self._owns_http_client:
+            self._http_client.close()
 
     def __enter__(self) -> 'SyncClient':
         return self
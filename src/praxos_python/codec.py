@@ -0,0 +1,113 @@
+import json
+import importlib.util
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, Tuple, Union
+
+import httpx
+
+class JSONCodec:
+    """
+    Serializer/deserializer pair for request and response bodies.
+
+    encode turns a payload into UTF-8 JSON bytes, decode turns response bytes back into Python
+    objects. Use get_json_codec() to pick the fastest installed backend.
+    """
+    def __init__(self, name: str, encode: Callable[[Any], bytes], decode: Callable[[bytes], Any]):
+        self.name = name
+        self.encode = encode
+        self.decode = decode
+
+    def __repr__(self) -> str:
+        return f"<JSONCodec name={self.name}>"
+
+
+def _stdlib_encode(value: Any) -> bytes:
+    # Same output as httpx's own json= encoding.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+def _with_stdlib_fallback(encode: Callable[[Any], bytes]) -> Callable[[Any], bytes]:
+    # Fast encoders reject some payloads the stdlib (and so httpx's json=) accepts, e.g. integers
+    # beyond 64 bits or keys they cannot stringify; those are encoded with the stdlib instead.
+    def encode_or_fallback(value: Any) -> bytes:
+        try:
+            return encode(value)
+        except TypeError:
+            return _stdlib_encode(value)
+    return encode_or_fallback
+
+def _stdlib_codec() -> JSONCodec:
+    return JSONCodec("json", _stdlib_encode, json.loads)
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+    # Non-str keys (ints, floats, bools, None) are stringified as json.dumps does.
+    def encode(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return JSONCodec("orjson", _with_stdlib_fallback(encode), orjson.loads)
+
+def _msgspec_codec() -> JSONCodec:
+    import msgspec
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JSONCodec("msgspec", _with_stdlib_fallback(encoder.encode), decoder.decode)
+
+_CODEC_FACTORIES = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+_codecs = {}
+
+def get_json_codec(name: Optional[str] = "auto") -> JSONCodec:
+    """
+    Returns a JSON codec by name: "orjson", "msgspec", "json" (stdlib) or "auto", which picks the
+    first of these that is installed. Naming a backend that is not installed raises ImportError.
+    """
+    if name is None or name == "auto":
+        for candidate in _CODEC_FACTORIES:
+            try:
+                return get_json_codec(candidate)
+            except ImportError:
+                continue
+    if name not in _CODEC_FACTORIES:
+        raise ValueError(f"Unknown JSON codec '{name}', expected one of: auto, {', '.join(_CODEC_FACTORIES)}")
+
+    codec = _codecs.get(name)
+    if codec is None:
+        codec = _codecs[name] = _CODEC_FACTORIES[name]()
+    return codec
+
+
+# Preferred first; br and zstd need the optional brotli/zstandard packages on the httpx side.
+_COMPRESSION_ORDER = ("zstd", "br", "gzip", "deflate")
+
+def _installed(*modules: str) -> bool:
+    return any(importlib.util.find_spec(module) is not None for module in modules)
+
+@lru_cache(maxsize=None)
+def supported_encodings() -> Tuple[str, ...]:
+    """Content encodings httpx can decode in this environment."""
+    available = {"gzip", "deflate"}
+    if _installed("brotli", "brotlicffi"):
+        available.add("br")
+    # httpx decodes zstd from 0.27.1 on.
+    httpx_version = tuple(int(part) for part in httpx.__version__.split(".")[:3] if part.isdigit())
+    if httpx_version >= (0, 27, 1) and _installed("zstandard"):
+        available.add("zstd")
+    return tuple(encoding for encoding in _COMPRESSION_ORDER if encoding in available)
+
+def accept_encoding_header(compression: Union[bool, str, Iterable[str]]) -> str:
+    """
+    Builds the Accept-Encoding header for a compression setting: True advertises every encoding
+    that can be decoded here, False asks for uncompressed responses, and a name or list of names
+    is narrowed to the ones that can actually be decoded (falling back to identity).
+    """
+    if compression is True:
+        encodings = supported_encodings()
+    elif not compression:
+        encodings = ()
+    else:
+        requested = [compression] if isinstance(compression, str) else list(compression)
+        available = supported_encodings()
+        encodings = tuple(encoding for encoding in requested if encoding in available)
+    return ", ".join(encodings) if encodings else "identity"
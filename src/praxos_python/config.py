@@ -1,6 +1,13 @@
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Iterable, Union
 import httpx
 import sys
+import hashlib
+import threading
+
+from .retry import RetryPolicy, CircuitBreaker, get_circuit_breaker
+from .codec import JSONCodec, get_json_codec, accept_encoding_header
+from .instrumentation import Instrumentation
+from .ratelimit import RateLimiter, get_rate_limiter
 
 try:
     if sys.version_info >= (3, 8):
@@ -14,6 +21,10 @@ except PackageNotFoundError:
 
 DEFAULT_BASE_URL = "https://api.praxos.ai/"
 
+# Process-wide memo of (base_url, key digest) pairs the API has already accepted.
+_validated_api_keys = set()
+_validated_api_keys_lock = threading.Lock()
+
 class ClientConfig:
     """Configuration settings for API clients."""
     def __init__(
@@ -22,7 +33,23 @@ class ClientConfig:
         base_url: Optional[str] = None,
         timeout: float = 10.0,
         params: Optional[Dict[str, Any]] = None,
-        httpx_settings: Optional[Dict[str, Any]] = None
+        httpx_settings: Optional[Dict[str, Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[bool, CircuitBreaker] = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        upload_timeout: Optional[float] = 300.0,
+        transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None,
+        json_codec: Union[str, JSONCodec, None] = "auto",
+        compression: Union[bool, str, Iterable[str]] = True,
+        instrumentation: Optional[Instrumentation] = None,
+        rate_limit: Union[bool, RateLimiter, None] = None
     ):
         if not api_key:
             raise ValueError("API key is required.")
@@ -33,7 +60,76 @@ class ClientConfig:
         self.params = params or {}
         self.httpx_settings = httpx_settings or {}
 
+        # Connection pool. Per-phase timeouts fall back to `timeout` when not given.
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        phase_timeouts = {"connect": connect_timeout, "read": read_timeout, "write": write_timeout, "pool": pool_timeout}
+        self.timeouts = httpx.Timeout(timeout, **{phase: value for phase, value in phase_timeouts.items() if value is not None})
+        # File uploads stream large bodies, so their read/write phases get a longer budget.
+        self.upload_timeouts = httpx.Timeout(upload_timeout, connect=self.timeouts.connect, pool=self.timeouts.pool)
+        self.http2 = http2
+        self.transport = transport
+
+        # Transient failures of safe requests are retried by default; pass RetryPolicy(max_retries=0) to disable.
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        if circuit_breaker is True:
+            self.circuit_breaker = get_circuit_breaker(self.base_url.host)
+        else:
+            self.circuit_breaker = circuit_breaker or None
+
+        # Request/response bodies go through the fastest installed JSON backend unless one is named.
+        self.json_codec = json_codec if isinstance(json_codec, JSONCodec) else get_json_codec(json_codec)
+        self.compression = compression
+        # Hooks/metrics/tracing for every request; None keeps the request path free of instrumentation.
+        self.instrumentation = instrumentation
+        # Client-side throttling; True shares one adaptive limiter per API key across the process.
+        if rate_limit is True:
+            self.rate_limiter = get_rate_limiter(str(self.base_url), self.api_key)
+        else:
+            self.rate_limiter = rate_limit or None
+
         self.common_headers = {
             "api-key": f"{self.api_key}",
-            "User-Agent": f"Praxos Python SDK/{SDK_VERSION}"
-        }
\ No newline at end of file
+            "User-Agent": f"Praxos Python SDK/{SDK_VERSION}",
+            "Accept-Encoding": accept_encoding_header(compression)
+        }
+
+    def pool_settings(self) -> Dict[str, Any]:
+        """
+        Keyword arguments for an httpx.Client/AsyncClient carrying this config's connection pool
+        settings (timeouts, limits, HTTP/2, transport and httpx_settings), but no per-key headers.
+        """
+        settings = {"timeout": self.timeouts, "limits": self.limits, "http2": self.http2}
+        if self.transport is not None:
+            settings["transport"] = self.transport
+        settings.update(self.httpx_settings)
+        return settings
+
+    def pool_key(self) -> tuple:
+        """Hashable identity of the pool settings; clients with equal keys may share one pool."""
+        return (
+            repr(self.timeouts), repr(self.limits), self.http2, id(self.transport),
+            repr(sorted(self.httpx_settings.items(), key=lambda item: item[0]))
+        )
+
+    def url_for(self, endpoint: str) -> httpx.URL:
+        """Absolute URL of an API endpoint, so requests don't depend on the pool's base_url."""
+        base = str(self.base_url)
+        if not base.endswith('/'):
+            base += '/'
+        return httpx.URL(base).join(endpoint.lstrip('/'))
+
+    def _api_key_fingerprint(self) -> tuple:
+        return (str(self.base_url), hashlib.sha256(self.api_key.encode("utf-8")).hexdigest())
+
+    def is_api_key_validated(self) -> bool:
+        """Whether this key was already validated against this base URL in the current process."""
+        with _validated_api_keys_lock:
+            return self._api_key_fingerprint() in _validated_api_keys
+
+    def mark_api_key_validated(self) -> None:
+        with _validated_api_keys_lock:
+            _validated_api_keys.add(self._api_key_fingerprint())
\ No newline at end of file
@@ -18,3 +18,14 @@ class APIKeyInvalidError(APIError):
     def __str__(self):
         return f"APIKeyInvalidError: {self.message}"
 
+
+
+class CircuitOpenError(APIError):
+    """Exception raised without sending a request while the host's circuit breaker is open."""
+    def __init__(self, host: str = "", retry_in: float = 0.0, **kwargs):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(status_code=0, message=f"Circuit open for {host or 'host'}; retry in {retry_in:.1f}s", **kwargs)
+
+    def __str__(self):
+        return f"CircuitOpenError: {self.message}"
@@ -0,0 +1,223 @@
+import bisect
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Any, Callable, List, Optional, Union
+
+# Latency bucket upper bounds in seconds: 1ms doubling up to ~65s, plus an overflow bucket.
+_LATENCY_BUCKETS = tuple(0.001 * 2 ** i for i in range(17))
+
+class RequestEvent:
+    """
+    One API call as seen by instrumentation hooks. Request hooks receive it before it is sent,
+    with only method, endpoint and request_bytes set; response hooks receive it completed.
+    """
+    __slots__ = ("method", "endpoint", "request_bytes", "status_code", "retries", "http_time",
+                 "processing_time", "total_time", "response_bytes", "error", "span")
+
+    def __init__(self, method: str, endpoint: str, request_bytes: int = 0):
+        self.method = method
+        self.endpoint = endpoint
+        self.request_bytes = request_bytes
+        self.status_code = 0
+        self.retries = 0
+        self.http_time = 0.0
+        self.processing_time = 0.0
+        self.total_time = 0.0
+        self.response_bytes = 0
+        self.error = None
+        self.span = None
+
+    def __repr__(self) -> str:
+        return f"<RequestEvent {self.method} {self.endpoint} status_code={self.status_code} total_time={self.total_time:.3f}s>"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (seconds) with count, sum, min, max and bucketed quantiles."""
+    def __init__(self, buckets: tuple = _LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (the max for the overflow bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.buckets[index], self.max) if index < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _EndpointMetrics:
+    __slots__ = ("http", "processing", "total", "status_codes", "requests", "errors", "retries",
+                 "request_bytes", "response_bytes")
+
+    def __init__(self):
+        self.http = LatencyHistogram()
+        self.processing = LatencyHistogram()
+        self.total = LatencyHistogram()
+        self.status_codes = Counter()
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class Metrics:
+    """Thread-safe per-endpoint latency histograms (http, processing, total) and request counters."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointMetrics] = {}
+
+    def __repr__(self) -> str:
+        return f"<Metrics endpoints={len(self._endpoints)}>"
+
+    def record(self, event: RequestEvent) -> None:
+        key = f"{event.method} /{event.endpoint.strip('/')}"
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = _EndpointMetrics()
+            metrics.requests += 1
+            metrics.errors += event.error is not None
+            metrics.retries += event.retries
+            metrics.request_bytes += event.request_bytes
+            metrics.response_bytes += event.response_bytes
+            metrics.status_codes[event.status_code] += 1
+            metrics.total.record(event.total_time)
+            if event.status_code:
+                metrics.http.record(event.http_time)
+                metrics.processing.record(event.processing_time)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint summary, keyed by "METHOD /endpoint"."""
+        with self._lock:
+            return {
+                key: {
+                    "requests": metrics.requests,
+                    "errors": metrics.errors,
+                    "retries": metrics.retries,
+                    "request_bytes": metrics.request_bytes,
+                    "response_bytes": metrics.response_bytes,
+                    "status_codes": dict(metrics.status_codes),
+                    "http_time": metrics.http.to_dict(),
+                    "processing_time": metrics.processing.to_dict(),
+                    "total_time": metrics.total.to_dict(),
+                }
+                for key, metrics in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+class Instrumentation:
+    """
+    Request/response hooks, per-endpoint metrics and optional OpenTelemetry spans for SDK calls.
+
+    Pass one to a client (instrumentation=...). Clients without instrumentation skip all of this
+    with a single None check per request.
+
+    Args:
+        metrics: True to collect a new Metrics, a Metrics instance to share one, or False
+        tracing: Emit an OpenTelemetry client span per request (requires opentelemetry-api)
+        tracer: Tracer to use instead of the global one when tracing
+    """
+    def __init__(self, metrics: Union[bool, Metrics] = True, tracing: bool = False, tracer: Any = None):
+        self.metrics = Metrics() if metrics is True else (metrics or None)
+        self._request_hooks: List[Callable[[RequestEvent], None]] = []
+        self._response_hooks: List[Callable[[RequestEvent], None]] = []
+
+        self._tracer = None
+        if tracing or tracer is not None:
+            if tracer is None:
+                try:
+                    from opentelemetry import trace
+                except ImportError as e:
+                    raise ImportError("tracing=True requires the opentelemetry-api package") from e
+                from .config import SDK_VERSION
+                tracer = trace.get_tracer("praxos_python", SDK_VERSION)
+            self._tracer = tracer
+
+    def __repr__(self) -> str:
+        return f"<Instrumentation metrics={self.metrics is not None} tracing={self._tracer is not None}>"
+
+    def on_request(self, hook: Callable[[RequestEvent], None]) -> Callable[[RequestEvent], None]:
+        """Registers a hook called before every request; usable as a decorator."""
+        self._request_hooks.append(hook)
+        return hook
+
+    def on_response(self, hook: Callable[[RequestEvent], None]) -> Callable[[RequestEvent], None]:
+        """Registers a hook called after every request, successful or not; usable as a decorator."""
+        self._response_hooks.append(hook)
+        return hook
+
+    def start(self, method: str, endpoint: str, request_bytes: int = 0) -> RequestEvent:
+        event = RequestEvent(method, endpoint, request_bytes)
+        if self._tracer is not None:
+            event.span = self._tracer.start_span(
+                f"praxos {method} /{endpoint.strip('/')}",
+                attributes={"http.request.method": method, "praxos.endpoint": endpoint, "praxos.request_bytes": request_bytes}
+            )
+        self._call_hooks(self._request_hooks, event)
+        return event
+
+    def finish(self, event: RequestEvent) -> None:
+        if self.metrics is not None:
+            self.metrics.record(event)
+        if event.span is not None:
+            self._end_span(event)
+        self._call_hooks(self._response_hooks, event)
+
+    def _end_span(self, event: RequestEvent) -> None:
+        span = event.span
+        span.set_attribute("http.response.status_code", event.status_code)
+        span.set_attribute("praxos.retries", event.retries)
+        span.set_attribute("praxos.response_bytes", event.response_bytes)
+        span.set_attribute("praxos.http_time", event.http_time)
+        span.set_attribute("praxos.processing_time", event.processing_time)
+        if event.error is not None:
+            span.record_exception(event.error)
+            try:
+                from opentelemetry.trace import Status, StatusCode
+            except ImportError:
+                pass
+            else:
+                span.set_status(Status(StatusCode.ERROR, str(event.error)))
+        span.end()
+
+    @staticmethod
+    def _call_hooks(hooks: List[Callable[[RequestEvent], None]], event: RequestEvent) -> None:
+        # A failing hook must not fail the API call it observes.
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception:
+                logging.getLogger(__name__).warning("PRAXOS-PYTHON: instrumentation hook %r failed", hook, exc_info=True)
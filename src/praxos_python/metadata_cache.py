@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import typing
+import hashlib
+import inspect
+import threading
+from typing import Dict, Any, List, Optional, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from .config import ClientConfig
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "praxos")
+
+
+class MetadataEntry:
+    """A cached value with its ETag and whether it is still within the TTL."""
+    __slots__ = ("value", "etag", "fresh")
+
+    def __init__(self, value: Any, etag: Optional[str], fresh: bool):
+        self.value = value
+        self.etag = etag
+        self.fresh = fresh
+
+
+class MetadataCache:
+    """
+    On-disk (sqlite) cache for environment/ontology metadata and generated ontology JSON schemas,
+    shared by every process using the same directory.
+
+    Entries younger than ttl are used without a request. Older ones are revalidated with
+    If-None-Match when the API sent an ETag, and refetched otherwise. Keys include the base URL
+    and a digest of the API key, so different accounts never see each other's entries.
+
+    Args:
+        directory: Where the cache file lives; defaults to $PRAXOS_CACHE_DIR or ~/.cache/praxos
+        ttl: Seconds an entry is trusted without revalidation
+    """
+    def __init__(self, directory: Optional[str] = None, ttl: float = 3600.0):
+        self.directory = directory or os.environ.get("PRAXOS_CACHE_DIR") or DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, "metadata.sqlite3")
+
+        import sqlite3
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=10.0)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, etag TEXT, stored_at REAL NOT NULL)"
+            )
+
+    def __repr__(self) -> str:
+        return f"<MetadataCache path='{self.path}' ttl={self.ttl}>"
+
+    @staticmethod
+    def make_key(config: "ClientConfig", kind: str, params: Dict[str, Any]) -> str:
+        """Key for a lookup, scoped to the client's base URL and API key."""
+        scope = hashlib.sha256(f"{config.base_url}|{config.api_key}".encode("utf-8")).hexdigest()[:16]
+        return f"{scope}:{kind}:{json.dumps(params, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> Optional[MetadataEntry]:
+        with self._lock:
+            row = self._connection.execute("SELECT value, etag, stored_at FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, etag, stored_at = row
+        return MetadataEntry(json.loads(value), etag, time.time() - stored_at < self.ttl)
+
+    def set(self, key: str, value: Any, etag: Optional[str] = None) -> None:
+        blob = json.dumps(value, separators=(",", ":"), default=str)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, etag, stored_at) VALUES (?, ?, ?, ?)",
+                (key, blob, etag, time.time())
+            )
+
+    def touch(self, key: str) -> None:
+        """Marks an entry fresh again after the API confirmed it is unchanged (304)."""
+        with self._lock, self._connection:
+            self._connection.execute("UPDATE entries SET stored_at = ? WHERE key = ?", (time.time(), key))
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _nested_models(annotation: Any, found: Dict[str, type]) -> None:
+    from pydantic import BaseModel
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        name = f"{annotation.__module__}.{annotation.__qualname__}"
+        if name not in found:
+            found[name] = annotation
+            for field in annotation.model_fields.values():
+                _nested_models(field.annotation, found)
+        return
+    for argument in typing.get_args(annotation):
+        _nested_models(argument, found)
+
+
+def _schema_fingerprint(schemas: tuple) -> Optional[str]:
+    """
+    Digest of the source of the given models and every model they reference, so an edited model
+    never matches a schema generated from its old definition. None if some source is unavailable.
+    """
+    import pydantic
+
+    models: Dict[str, type] = {}
+    for schema in schemas:
+        _nested_models(schema, models)
+    digest = hashlib.sha256(pydantic.VERSION.encode("utf-8"))
+    for name in sorted(models):
+        try:
+            source = inspect.getsource(models[name])
+        except (OSError, TypeError):
+            return None
+        digest.update(name.encode("utf-8"))
+        digest.update(source.encode("utf-8"))
+    return digest.hexdigest()
+
+
+_schema_memo: Dict[tuple, Dict[str, Any]] = {}
+_schema_memo_lock = threading.Lock()
+
+def ontology_json_schema(schemas: List[Type["BaseModel"]], cache: Optional[MetadataCache] = None) -> Dict[str, Any]:
+    """
+    JSON schema of Union[schemas] as sent by create_ontology. Memoized per process for the same
+    model classes, and persisted in cache (when given) keyed on the models' source code.
+    """
+    key = tuple(schemas)
+    with _schema_memo_lock:
+        schema = _schema_memo.get(key)
+    if schema is not None:
+        return schema
+
+    fingerprint = _schema_fingerprint(key) if cache is not None else None
+    entry = cache.get(f"schema:{fingerprint}") if fingerprint else None
+    if entry is not None:
+        schema = entry.value
+    else:
+        from pydantic import TypeAdapter
+        schema = TypeAdapter(typing.Union[key]).json_schema()
+        if fingerprint:
+            cache.set(f"schema:{fingerprint}", schema)
+
+    with _schema_memo_lock:
+        _schema_memo[key] = schema
+    return schema
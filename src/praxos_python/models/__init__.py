@@ -1,10 +1,27 @@
 # my_api_sdk/models/__init__.py
-from .environment import SyncEnvironment
-from .source import SyncSource
-from .ontology import SyncOntology
+from .environment import SyncEnvironment, AsyncEnvironment
+from .source import SyncSource, AsyncSource
+from .ontology import SyncOntology, AsyncOntology
+from .search import SearchHit, SearchResults
+from .context_builder import ContextBundle
+from .fusion import LexicalReranker, fuse_results
+from .local import LocalEnvironment
+from .traversal import GraphTraversal, AsyncGraphTraversal, TraversalNode
 
 __all__ = [
     'SyncEnvironment',
     'SyncSource',
-    'SyncOntology'
+    'SyncOntology',
+    'AsyncEnvironment',
+    'AsyncSource',
+    'AsyncOntology',
+    'LocalEnvironment',
+    'SearchHit',
+    'SearchResults',
+    'ContextBundle',
+    'LexicalReranker',
+    'fuse_results',
+    'GraphTraversal',
+    'AsyncGraphTraversal',
+    'TraversalNode'
 ]
\ No newline at end of file
@@ -2,6 +2,8 @@ from typing import Dict, Any
 
 class Context:
     """A context object."""
+    __slots__ = ("score", "data", "sentence")
+
     def __init__(self, score: float, data: Dict[str, Any], sentence: str):
         self.score = score
         self.data = data
@@ -0,0 +1,115 @@
+import re
+import json
+from typing import Dict, Any, Callable, List, Optional
+
+from .context import Context
+from .search import hit_node_id
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+def approximate_tokens(text: str) -> int:
+    """Cheap token estimate (about four characters per token for English text)."""
+    return len(text) // 4 + 1
+
+def _words(text: str) -> frozenset:
+    return frozenset(_NON_WORD.sub(" ", text.lower()).split())
+
+
+class ContextBundle:
+    """
+    Prompt-ready context packed into a budget.
+
+    text is the rendered context; contexts are the packed hits in order, and provenance holds
+    one dict per packed line (index, score, node_id, source_id and the size it used).
+    """
+    __slots__ = ("text", "contexts", "provenance", "used", "budget", "requests", "candidates")
+
+    def __init__(self, text: str, contexts: List[Context], provenance: List[Dict[str, Any]], used: int,
+                 budget: int, requests: int, candidates: int):
+        self.text = text
+        self.contexts = contexts
+        self.provenance = provenance
+        self.used = used
+        self.budget = budget
+        self.requests = requests
+        self.candidates = candidates
+
+    def __repr__(self) -> str:
+        return f"<ContextBundle items={len(self.contexts)} used={self.used}/{self.budget} requests={self.requests}>"
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class ContextPacker:
+    """
+    Packs ranked vec_edge hits into a token (or character) budget, dropping near-duplicates.
+
+    Hits are offered in rank order across progressively larger searches; already seen hits are
+    skipped, sentences whose word sets overlap a packed one by at least dedupe_threshold (Jaccard)
+    are dropped, and each remaining line is packed if it still fits.
+    """
+    def __init__(self, budget: int, count: Optional[Callable[[str], int]] = None, dedupe_threshold: float = 0.85,
+                 separator: str = "\n", numbered: bool = True):
+        if budget < 1:
+            raise ValueError("budget must be at least 1")
+        self.budget = budget
+        self.count = count or approximate_tokens
+        self.dedupe_threshold = dedupe_threshold
+        self.separator = separator
+        self.numbered = numbered
+
+        self.used = 0
+        self.candidates = 0
+        self._seen = 0
+        self._lines: List[str] = []
+        self._contexts: List[Context] = []
+        self._provenance: List[Dict[str, Any]] = []
+        self._word_sets: List[frozenset] = []
+        self._separator_cost = self.count(separator) if separator else 0
+
+    @property
+    def full(self) -> bool:
+        # Nothing useful fits in what is left once less than a separator plus a short line remains.
+        return self.budget - self.used <= self._separator_cost + 8
+
+    def _is_duplicate(self, words: frozenset) -> bool:
+        for packed in self._word_sets:
+            union = len(words | packed)
+            if union and len(words & packed) / union >= self.dedupe_threshold:
+                return True
+        return False
+
+    def offer(self, hits: List[Dict[str, Any]]) -> None:
+        """Considers hits beyond those already seen; a bigger search returns the earlier ones again first."""
+        new_hits = hits[self._seen:]
+        self._seen = max(self._seen, len(hits))
+        for hit in new_hits:
+            self.candidates += 1
+            if self.full:
+                return
+            data = hit.get("data")
+            sentence = hit.get("sentence") or ""
+            body = sentence or json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+            words = _words(body)
+            if not words or self._is_duplicate(words):
+                continue
+
+            line = f"[{len(self._lines) + 1}] {body}" if self.numbered else body
+            cost = self.count(line) + (self._separator_cost if self._lines else 0)
+            if self.used + cost > self.budget:
+                continue
+
+            self.used += cost
+            self._lines.append(line)
+            self._word_sets.append(words)
+            self._contexts.append(Context(score=hit.get("score", 0.0), data=data, sentence=sentence))
+            source_id = data.get("source_id") if isinstance(data, dict) else None
+            self._provenance.append({
+                "index": len(self._lines), "score": hit.get("score", 0.0), "node_id": hit_node_id(hit),
+                "source_id": source_id, "size": cost,
+            })
+
+    def bundle(self, requests: int) -> ContextBundle:
+        return ContextBundle(self.separator.join(self._lines), self._contexts, self._provenance, self.used,
+                             self.budget, requests, self.candidates)
@@ -1,18 +1,641 @@
 import os
+import itertools
+import uuid
+import glob
 import time
+import httpx
+import asyncio
 import logging
-from typing import List, Dict, Any, Type, Union
-from pydantic import BaseModel
-from .source import SyncSource
+import functools
+import inspect
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterable, Iterator, List, Dict, Any, Optional, Sequence, Tuple, Type, Union
+from .source import SyncSource, AsyncSource, is_terminal_status, _sleep_time
 from ..exceptions import APIError
+from ..codec import JSONCodec
+from ..utils import run_concurrently, gather_bounded, map_concurrently, gather_until, iter_concurrently, aiter_concurrently, iter_pages, aiter_pages
 from .context import Context
-from ..types.message import Message
+from .context_builder import ContextBundle, ContextPacker, approximate_tokens
+from .search import SearchResults
+from .fusion import HYBRID_MODALITIES, DEFAULT_HYBRID_MODALITIES, LexicalReranker, fuse_results, rerank_hits
+from .loader import NodeLoader, AsyncNodeLoader
+from .local import LocalEnvironment, SnapshotWriter
+from .traversal import GraphTraversal, AsyncGraphTraversal
+
+if TYPE_CHECKING:
+    # pydantic is only imported once a conversation is ingested, keeping `import praxos_python` cheap.
+    from pydantic import BaseModel
+    from ..types.message import Message
 
 ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE = {
     "pdf": "application/pdf",
     "json": "application/json",
 }
 
+# Optional search filters that are only sent when set (truthy).
+_SEARCH_FILTER_KEYS = (
+    "source_id", "target_type", "source_type", "target_label", "source_label",
+    "target_type_oid", "source_type_oid", "relationship_type", "relationship_label",
+    "node_type", "node_label", "node_kind", "temporal_filter",
+)
+
+
+def _build_search_payload(environment_id: str, query: str, top_k: int, search_modality: str,
+                          include_graph_context: bool = True, has_sentence: bool = None,
+                          known_anchors: List[Dict[str, Any]] = None, anchor_max_hops: int = 2,
+                          **filters: Any) -> Dict[str, Any]:
+    """Builds the JSON body for POST /search, shared by the sync and async environments."""
+    payload = {
+        "query": query,
+        "environment_id": environment_id,
+        "search_modality": search_modality,
+        "top_k": top_k,
+        "include_graph_context": include_graph_context
+    }
+
+    for key in _SEARCH_FILTER_KEYS:
+        if filters.get(key):
+            payload[key] = filters[key]
+    if has_sentence is not None:
+        payload["has_sentence"] = has_sentence
+
+    if known_anchors:
+        payload["known_anchors"] = known_anchors
+        payload["anchor_max_hops"] = anchor_max_hops
+
+    return payload
+
+
+def _build_extract_items_payload(environment_id: str, schema: Union[str, Type["BaseModel"]],
+                                 source_id: str = None, page_idx: str = None) -> Dict[str, Any]:
+    """Builds the JSON body for an entity extraction."""
+    schema_name = schema if isinstance(schema, str) else schema.__name__
+
+    payload = {
+        "extraction_type": "entities",
+        "label": schema_name,
+        "environment_id": environment_id
+    }
+
+    if source_id:
+        payload["source_id"] = source_id
+    if page_idx:
+        payload["page_idx"] = page_idx
+    return payload
+
+
+def _build_extract_literals_payload(environment_id: str, literal_type: str, mode: str,
+                                    source_id: str = None, page_idx: str = None) -> Dict[str, Any]:
+    """Builds the JSON body for a literal extraction."""
+    if mode not in ["literals_only", "full_entities"]:
+        raise ValueError("mode must be 'literals_only' or 'full_entities'")
+
+    payload = {
+        "extraction_type": "literals",
+        "literal_type": literal_type,
+        "mode": mode,
+        "environment_id": environment_id
+    }
+
+    if source_id:
+        payload["source_id"] = source_id
+    if page_idx:
+        payload["page_idx"] = page_idx
+    return payload
+
+
+def _paged(payload: Dict[str, Any], offset: int, limit: int) -> Dict[str, Any]:
+    """Adds limit/offset paging to a request body or query params."""
+    return {**payload, "limit": limit, "offset": offset}
+
+
+def _extracted_list(response_data: Any) -> List[Any]:
+    """The list of extracted records in an /extract response, whichever key the mode uses."""
+    if isinstance(response_data, list):
+        return response_data
+    for key in ("items", "literals", "entities", "results"):
+        if isinstance(response_data.get(key), list):
+            return response_data[key]
+    return []
+
+
+def _build_conversation_payload(messages: List[Union["Message", Dict[str, str]]], name: str = None,
+                                description: str = None) -> Dict[str, Any]:
+    """Builds the JSON body for a conversation source."""
+    if len(messages) == 0:
+        raise ValueError("Messages must be a non-empty list")
+
+    from ..types.message import Message
+
+    messages = [Message.from_dict(message) if isinstance(message, dict) else message for message in messages]
+
+    payload = {
+        "messages": [message.to_dict() for message in messages],
+        "description": description
+    }
+
+    if name:
+        payload["name"] = name
+    return payload
+
+
+def _resolve_file_upload(path: str, name: str = None) -> Tuple[str, str]:
+    """Validates a file source path and returns its (name, content_type)."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
+
+    file_extension = path.split('.')[-1]
+    if file_extension not in ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE:
+        raise ValueError(f"File extension {file_extension} is not supported. Supported extensions are: {', '.join(ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE.keys())}")
+
+    if name is None:
+        name = '.'.join(os.path.basename(path).split('.')[:-1])
+    return name, ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE[file_extension]
+
+
+def _expand_source_paths(paths: Union[str, List[str]], recursive: bool = False) -> List[str]:
+    """
+    Expands file paths, directories and glob patterns into a de-duplicated list of file paths.
+    Directory and glob matches are filtered to supported extensions; explicit paths are kept
+    as given so add_file can report why they are rejected.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    expanded = []
+    for path in paths:
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            pattern = os.path.join(path, "**", "*") if recursive else os.path.join(path, "*")
+        elif any(char in path for char in "*?["):
+            pattern = path
+        else:
+            expanded.append(path)
+            continue
+        expanded.extend(
+            match for match in sorted(glob.glob(pattern, recursive=recursive))
+            if os.path.isfile(match) and match.split('.')[-1] in ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE
+        )
+    return list(dict.fromkeys(expanded))
+
+
+class _UploadReader:
+    """
+    File wrapper handed to httpx for multipart uploads. httpx streams it in chunks (the file is
+    never read into memory as a whole) and seeks back to 0 before each attempt, which is what
+    lets a failed upload be replayed. Reports (bytes_sent, total_bytes) to an optional callback.
+    """
+    def __init__(self, file, progress: Callable[[int, int], None] = None):
+        self._file = file
+        self._progress = progress
+        self._sent = 0
+        self.total = os.fstat(file.fileno()).st_size
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        if chunk and self._progress is not None:
+            self._sent += len(chunk)
+            self._progress(self._sent, self.total)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        position = self._file.seek(offset, whence)
+        self._sent = position
+        return position
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+
+def _check_networkx_graph(graph):
+    """Imports networkx on demand, checks graph is a NetworkX graph and returns the module."""
+    try:
+        import networkx as nx
+    except ImportError:
+        raise ImportError("NetworkX is required for graph ingestion. Install with: pip install networkx")
+
+    if not isinstance(graph, (nx.MultiDiGraph, nx.DiGraph, nx.Graph, nx.MultiGraph)):
+        raise ValueError("Graph must be a NetworkX graph object")
+    return nx
+
+
+def _build_networkx_graph_payload(graph, name: str = None, description: str = None,
+                                  metadata: Dict[str, Any] = None,
+                                  processing_config: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Validates a NetworkX graph and builds the JSON body for a graph source."""
+    nx = _check_networkx_graph(graph)
+
+    # Convert to node-link format for API transmission
+    graph_data = nx.node_link_data(graph)
+
+    return {
+        "graph_data": graph_data,
+        "name": name,
+        "description": description,
+        "metadata": metadata or {},
+        "processing_config": processing_config or {}
+    }
+
+
+def _build_business_data_payload(data: Dict[str, Any], name: str = None, description: str = None,
+                                 root_entity_type: str = "schema:Thing", metadata: Dict[str, Any] = None,
+                                 processing_config: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Builds the JSON body for a business data source."""
+    return {
+        "data": data,
+        "name": name,
+        "description": description,
+        "root_entity_type": root_entity_type,
+        "metadata": metadata or {},
+        "processing_config": processing_config or {}
+    }
+
+
+def _message_dict(message: Union["Message", Dict[str, str]]) -> Dict[str, Any]:
+    """Validates a message and returns its wire form."""
+    from ..types.message import Message
+
+    if isinstance(message, dict):
+        message = Message.from_dict(message)
+    return message.to_dict()
+
+
+def _iter_encoded_batches(items: Iterable[Any], encode: Callable[[Any], bytes],
+                          max_batch_bytes: int) -> Iterator[Union[List[bytes], Exception]]:
+    """
+    Encodes items one at a time and groups them into batches whose encoded size stays within
+    max_batch_bytes. Only the current batch is held in memory; an item larger than the bound
+    is sent in a batch of its own. An item that cannot be encoded fails the batch it belongs
+    to: the exception is yielded in that batch's place and the next items start a new batch.
+    """
+    if max_batch_bytes < 1:
+        raise ValueError("max_batch_bytes must be at least 1")
+
+    batch, size = [], 0
+    for item in items:
+        try:
+            encoded = encode(item)
+        except Exception as e:
+            yield e
+            batch, size = [], 0
+            continue
+        if batch and size + len(encoded) + 1 > max_batch_bytes:
+            yield batch
+            batch, size = [], 0
+        batch.append(encoded)
+        size += len(encoded) + 1
+    if batch:
+        yield batch
+
+
+def _json_array(encoded_items: List[bytes]) -> bytes:
+    return b"[" + b",".join(encoded_items) + b"]"
+
+
+def _json_object_with_raw(payload: Dict[str, Any], raw_fields: Dict[str, bytes],
+                          encode: Callable[[Any], bytes]) -> bytes:
+    """Serializes payload plus extra fields whose values are already-encoded JSON, with encode (compact output)."""
+    parts = [encode(payload)[:-1]]
+    for key, raw in raw_fields.items():
+        if len(parts) > 1 or payload:
+            parts.append(b",")
+        parts.extend((encode(key), b":", raw))
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+class _GraphEncoder:
+    """
+    Encodes graph nodes and edges one at a time for chunked graph ingestion.
+
+    "node_link" emits the same shape as networkx.node_link_data. "columnar" interns attribute
+    keys: the batch carries an attr_keys table and each element is a flat array,
+    [id, key_index, value, ...] for nodes and [source, target, edge_key, key_index, value, ...]
+    for links, so attribute names are not repeated per element. Elements are encoded with
+    encode, the client's JSON codec.
+    """
+    WIRE_FORMATS = ("node_link", "columnar")
+
+    def __init__(self, encode: Callable[[Any], bytes], wire_format: str = "node_link", directed: bool = True,
+                 multigraph: bool = True):
+        if wire_format not in self.WIRE_FORMATS:
+            raise ValueError(f"wire_format must be one of: {', '.join(self.WIRE_FORMATS)}")
+        self.encode = encode
+        self.wire_format = wire_format
+        self.directed = directed
+        self.multigraph = multigraph
+        self._attr_key_index: Dict[str, int] = {}
+
+    def _intern(self, attrs: Dict[str, Any]) -> List[Any]:
+        flat = []
+        for key, value in attrs.items():
+            index = self._attr_key_index.get(key)
+            if index is None:
+                index = self._attr_key_index[key] = len(self._attr_key_index)
+            flat.extend((index, value))
+        return flat
+
+    def encode_node(self, node: Any) -> bytes:
+        # A node is either a bare id or an (id, attributes) pair.
+        if isinstance(node, tuple) and len(node) == 2 and isinstance(node[1], dict):
+            node_id, attrs = node
+        else:
+            node_id, attrs = node, {}
+        if self.wire_format == "columnar":
+            return self.encode([node_id, *self._intern(attrs)])
+        return self.encode({**attrs, "id": node_id})
+
+    def encode_edge(self, edge: Tuple) -> bytes:
+        # An edge is (u, v), (u, v, attributes), (u, v, key) or (u, v, key, attributes).
+        if len(edge) == 2:
+            (source, target), key, attrs = edge, None, {}
+        elif len(edge) == 3 and isinstance(edge[2], dict):
+            source, target, attrs = edge
+            key = None
+        elif len(edge) == 3:
+            source, target, key = edge
+            attrs = {}
+        else:
+            source, target, key, attrs = edge
+        if self.wire_format == "columnar":
+            return self.encode([source, target, key, *self._intern(attrs)])
+        link = {**attrs, "source": source, "target": target}
+        if self.multigraph and key is not None:
+            link["key"] = key
+        return self.encode(link)
+
+    def document(self, nodes: List[bytes], links: List[bytes], graph_attrs: Dict[str, Any] = None) -> bytes:
+        """Assembles one batch into a graph_data document."""
+        header = {"directed": self.directed, "multigraph": self.multigraph, "graph": graph_attrs or {}}
+        if self.wire_format == "columnar":
+            header["format"] = "columnar"
+            header["attr_keys"] = list(self._attr_key_index)
+        return _json_object_with_raw(header, {"nodes": _json_array(nodes), "links": _json_array(links)}, self.encode)
+
+
+def _iter_graph_batches(encoder: _GraphEncoder, nodes: Iterable[Any], edges: Iterable[Tuple],
+                        max_batch_bytes: int, graph_attrs: Dict[str, Any] = None) -> Iterator[Union[bytes, Exception]]:
+    """
+    Streams nodes, then edges, into encoded graph_data documents bounded by max_batch_bytes.
+    Documents are assembled here, on the consuming thread, so the encoder's key table is
+    never read while it is being extended. As in _iter_encoded_batches, an element that cannot
+    be encoded fails its batch.
+    """
+    if max_batch_bytes < 1:
+        raise ValueError("max_batch_bytes must be at least 1")
+
+    node_batch, link_batch, size = [], [], 0
+    tagged = itertools.chain(
+        ((node_batch, encoder.encode_node, node) for node in nodes or ()),
+        ((link_batch, encoder.encode_edge, edge) for edge in edges or ()),
+    )
+    for target, encode, item in tagged:
+        try:
+            encoded = encode(item)
+        except Exception as e:
+            yield e
+            node_batch.clear()
+            link_batch.clear()
+            size = 0
+            continue
+        if (node_batch or link_batch) and size + len(encoded) + 1 > max_batch_bytes:
+            yield encoder.document(node_batch, link_batch, graph_attrs)
+            node_batch.clear()
+            link_batch.clear()
+            size = 0
+        target.append(encoded)
+        size += len(encoded) + 1
+    if node_batch or link_batch:
+        yield encoder.document(node_batch, link_batch, graph_attrs)
+
+
+def _batch_name(name: str, index: int) -> str:
+    return f"{name} (part {index + 1})" if name else None
+
+
+def _merge_by_score(result_lists: List[List[Dict[str, Any]]], top_k: int,
+                    codec: Optional[JSONCodec] = None) -> Union[List[Dict[str, Any]], SearchResults]:
+    """
+    Concatenates per-filter search results, sorts by score and keeps the top_k; wrapped in a
+    SearchResults compacted with codec when one is given (as_results).
+    """
+    all_results = []
+    for results in result_lists:
+        all_results.extend(results)
+
+    # Sort by score and limit results
+    all_results.sort(key=lambda x: x.get("score", 0), reverse=True)
+    return SearchResults(all_results[:top_k], codec=codec) if codec is not None else all_results[:top_k]
+
+
+def _parse_contexts(response_data: Dict[str, Any], top_k: int) -> Context|List[Context]:
+    """Wraps vec_edge search hits in Context objects."""
+    contexts = []
+    for context in response_data["hits"]:
+        sentence = context.get("sentence", "")
+        contexts.append(Context(score=context["score"], data=context["data"], sentence=sentence))
+
+    if top_k == 1:
+        return contexts[0]
+    else:
+        return contexts
+
+
+def _hybrid_queries(query: str, candidates: int, modalities: Sequence[Union[str, Dict[str, Any]]],
+                    filters: Dict[str, Any]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Names and search() keyword arguments for each modality of a hybrid search."""
+    names, queries = [], []
+    for index, modality in enumerate(modalities):
+        if isinstance(modality, str):
+            if modality not in HYBRID_MODALITIES:
+                raise ValueError(f"Unknown modality '{modality}'; expected one of {sorted(HYBRID_MODALITIES)} or a dict of search() arguments")
+            name, options = modality, HYBRID_MODALITIES[modality]
+        else:
+            name, options = f"custom_{index}", modality
+        names.append(name)
+        queries.append({**filters, **options, "query": query, "top_k": candidates})
+    return names, queries
+
+
+def _fuse_hybrid(query: str, names: List[str], responses: List[Any], top_k: int, fusion: str, rrf_k: int,
+                 weights: Optional[Dict[str, float]], rerank: Union[bool, Callable], rerank_weight: float) -> List[Dict[str, Any]]:
+    """Fuses per-modality results; failed modalities are skipped unless all of them failed."""
+    result_lists = {}
+    errors = []
+    for name, response in zip(names, responses):
+        if isinstance(response, Exception):
+            errors.append(response)
+            logging.getLogger(__name__).warning("PRAXOS-PYTHON: Hybrid search modality %s failed: %s", name, response)
+        else:
+            result_lists[name] = response
+    if errors and not result_lists:
+        raise errors[0]
+
+    # Rerank a deeper pool than top_k, so the reranker can promote hits fusion ranked just below the cut.
+    hits = fuse_results(result_lists, top_k=top_k * 2 if rerank else top_k, method=fusion, rrf_k=rrf_k, weights=weights)
+    if rerank:
+        reranker = LexicalReranker() if rerank is True else rerank
+        hits = rerank_hits(query, hits, reranker, weight=rerank_weight)[:top_k]
+    return hits
+
+def _snapshot_writer(environment: "BaseEnvironmentAttributes", path: str, schemas: Sequence[Union[str, Type["BaseModel"]]],
+                     literal_types: Sequence[str], literal_mode: str) -> SnapshotWriter:
+    """Opens a new snapshot for an environment, recording what is exported so it can be synced later."""
+    writer = SnapshotWriter(path, environment={
+        "id": environment.id, "name": environment.name,
+        "created_at": environment.created_at, "description": environment.description,
+    })
+    writer.set_meta("export.schemas", [schema if isinstance(schema, str) else schema.__name__ for schema in schemas])
+    writer.set_meta("export.literal_types", [[literal_type, literal_mode] for literal_type in literal_types])
+    return writer
+
+
+def _record_export_sources(writer: SnapshotWriter, sources: List[Union[SyncSource, AsyncSource]]) -> None:
+    """
+    Records the sources listed before a full export. Ready ones count as synced, since their
+    contents are in the export; the rest are picked up by the next sync once they are ready.
+    """
+    writer.set_sources((source.id, source.created_at, source.status, source.is_ready) for source in sources)
+    writer.set_meta("sync.synced_at", time.time())
+
+
+def _open_sync_writer(environment: "BaseEnvironmentAttributes", path: str, schemas: Sequence[Union[str, Type["BaseModel"]]],
+                      literal_types: Sequence[str], literal_mode: str) -> Tuple[SnapshotWriter, List[str], List[Tuple[str, str]], List[str], List[Tuple[str, str]]]:
+    """
+    Opens an existing snapshot for an in-place sync. Returns the writer, every exported schema
+    and (literal type, mode) pair, and those among them that are newly requested.
+    """
+    writer = SnapshotWriter(path, replace=False)
+    snapshot_id = writer.get_meta("environment.id")
+    if snapshot_id != environment.id:
+        writer.abort()
+        raise ValueError(f"Snapshot {path} belongs to environment {snapshot_id}, not {environment.id}")
+
+    all_schemas = writer.get_meta("export.schemas", [])
+    all_literals = [tuple(pair) for pair in writer.get_meta("export.literal_types", [])]
+    new_schemas = [name for name in dict.fromkeys(schema if isinstance(schema, str) else schema.__name__ for schema in schemas)
+                   if name not in all_schemas]
+    new_literals = [pair for pair in dict.fromkeys((literal_type, literal_mode) for literal_type in literal_types)
+                    if pair not in all_literals]
+    all_schemas = all_schemas + new_schemas
+    all_literals = all_literals + new_literals
+    writer.set_meta("export.schemas", all_schemas)
+    writer.set_meta("export.literal_types", [list(pair) for pair in all_literals])
+    return writer, all_schemas, all_literals, new_schemas, new_literals
+
+
+def _plan_sync(known: Dict[str, Tuple[Optional[str], Optional[str], bool]],
+               sources: List[Union[SyncSource, AsyncSource]]) -> Tuple[List[Union[SyncSource, AsyncSource]], List[str]]:
+    """
+    Sources whose contents need fetching and ids of deleted sources. A ready source is fetched
+    if it is new, was never synced, or its created_at or status differ from the recorded ones
+    (e.g. it was reprocessed, or replaced under the same id).
+    """
+    listed = {source.id for source in sources}
+    to_fetch = []
+    for source in sources:
+        previous = known.get(source.id)
+        if source.is_ready and (previous is None or not previous[2] or previous[:2] != (source.created_at, source.status)):
+            to_fetch.append(source)
+    removed = [source_id for source_id in known if source_id not in listed]
+    return to_fetch, removed
+
+
+def _apply_source_contents(writer: SnapshotWriter, source: Union[SyncSource, AsyncSource], contents: Any,
+                           report: Dict[str, Any]) -> bool:
+    """
+    Writes one source's fetched entities and literals, replacing what the snapshot held for it;
+    returns whether the source is now synced.
+    """
+    if isinstance(contents, Exception):
+        report["errors"][source.id] = str(contents)
+        logging.getLogger(__name__).warning("PRAXOS-PYTHON: Sync of source %s failed, will retry next sync: %s", source.id, contents)
+        return False
+    items, literals = contents
+    # Start the source over, so records it no longer contains go (unless another source still has them).
+    writer.detach_source(source.id)
+    for schema, records in items:
+        report["items"] += writer.add_items(schema, records, source_id=source.id)
+    for (literal_type, mode), records in literals:
+        report["literals"] += writer.add_literals(literal_type, mode, records, source_id=source.id)
+    return True
+
+
+def _finish_sync(writer: SnapshotWriter, known: Dict[str, Tuple[Optional[str], Optional[str], bool]],
+                 sources: List[Union[SyncSource, AsyncSource]], to_fetch: List[Union[SyncSource, AsyncSource]],
+                 synced: set, removed: List[str], report: Dict[str, Any]) -> Dict[str, Any]:
+    """Records source states and drops deleted sources."""
+    for source_id in removed:
+        report["removed_records"] += writer.remove_source(source_id)
+    attempted = {source.id for source in to_fetch}
+    rows = []
+    for source in sources:
+        previous = known.get(source.id)
+        # A changed source whose re-fetch failed is left unsynced, so the next sync retries it.
+        is_synced = source.id in synced or bool(previous and previous[2] and source.id not in attempted)
+        rows.append((source.id, source.created_at, source.status, is_synced))
+        if source.id in synced:
+            report["sources_updated" if previous else "sources_new"] += 1
+        elif not is_synced:
+            report["sources_pending"] += 1
+    writer.set_sources(rows)
+
+    report["sources_removed"] = len(removed)
+    writer.set_meta("sync.synced_at", time.time())
+    return report
+
+
+def _empty_sync_report(full_export: bool = False) -> Dict[str, Any]:
+    return {"full_export": full_export, "sources_new": 0, "sources_updated": 0, "sources_removed": 0, "sources_pending": 0,
+            "items": 0, "literals": 0, "removed_records": 0, "errors": {}}
+
+
+def _full_export_report(local: LocalEnvironment) -> Dict[str, Any]:
+    """Sync report for a snapshot that was just exported in full; closes it."""
+    with local:
+        stats = local.stats()
+    report = _empty_sync_report(full_export=True)
+    report.update(sources_new=stats["sources"], items=sum(stats["items"].values()),
+                  literals=sum(stats["literals"].values()))
+    return report
+
+async def _awrite_pages(records: AsyncIterator[Any], write: Callable[[List[Any]], int], page_size: int) -> int:
+    """Drains an async record stream into write() in pages of page_size; returns the total written."""
+    written = 0
+    page = []
+    async for record in records:
+        page.append(record)
+        if len(page) >= page_size:
+            written += write(page)
+            page = []
+    if page:
+        written += write(page)
+    return written
+
+def _call_with(func: Callable[..., Any], item: Any) -> Any:
+    """Calls func with a map_concurrent input: dicts are keyword arguments, tuples positional ones."""
+    if isinstance(item, dict):
+        return func(**item)
+    if isinstance(item, tuple):
+        return func(*item)
+    return func(item)
+
+def _context_packer(budget: int, unit: str, count: Optional[Callable[[str], int]], dedupe_threshold: float,
+                    numbered: bool) -> ContextPacker:
+    if count is None:
+        if unit not in ("tokens", "chars"):
+            raise ValueError("unit must be 'tokens' or 'chars'")
+        count = approximate_tokens if unit == "tokens" else len
+    return ContextPacker(budget, count=count, dedupe_threshold=dedupe_threshold, numbered=numbered)
+
+
+def _next_context_top_k(top_k: int, packer: ContextPacker, max_top_k: int) -> int:
+    """Grows the search size at least twofold, or to what the fill rate so far suggests the budget needs."""
+    estimate = -(-top_k * packer.budget // max(packer.used, 1))
+    return min(max_top_k, max(top_k * 2, estimate))
+
 class BaseEnvironmentAttributes:
     """
     Base attributes for an Environment resource.
@@ -35,19 +658,49 @@ class SyncEnvironment(BaseEnvironmentAttributes):
 
     def get_context(self, query: str, top_k: int = 1) -> Context|List[Context]:
         """Gets context for an LLM using vec_edge search modality."""
-        response_data = self._client._request(
-            "POST", f"/search", json_data={"query": query, "top_k": top_k, "environment_id": self.id, "search_modality": "vec_edge"}
+        response_data = self._client._cached_request(
+            "/search", {"query": query, "top_k": top_k, "environment_id": self.id, "search_modality": "vec_edge"}
         )
 
-        contexts = []
-        for context in response_data["hits"]:
-            sentence = context.get("sentence", "")
-            contexts.append(Context(score=context["score"], data=context["data"], sentence=sentence))
+        return _parse_contexts(response_data, top_k)
 
-        if top_k == 1:
-            return contexts[0]
-        else:
-            return contexts
+    def build_context(self, query: str, budget: int = 1000, unit: str = "tokens",
+                      count: Optional[Callable[[str], int]] = None, initial_top_k: int = 8, max_top_k: int = 64,
+                      dedupe_threshold: float = 0.85, numbered: bool = True) -> ContextBundle:
+        """
+        Assembles prompt-ready context for a query within a token (or character) budget.
+        
+        Runs vec_edge searches of growing size, starting at initial_top_k, until the budget is
+        filled, the environment has no more hits or max_top_k is reached. Hits are packed in rank
+        order, skipping near-duplicate sentences and anything that no longer fits, so callers
+        need not over-fetch with a large top_k and trim afterwards.
+        
+        Args:
+            query: Query to gather context for
+            budget: Maximum size of the rendered context, in `unit`
+            unit: "tokens" (estimated as about four characters per token) or "chars"
+            count: Custom size function, e.g. a tokenizer's len(encode(text)); overrides unit
+            initial_top_k: Hits requested by the first search
+            max_top_k: Largest search size
+            dedupe_threshold: Word-set (Jaccard) similarity at which a sentence counts as a duplicate
+            numbered: Prefix lines with [n] so provenance indexes can be cited
+        
+        Returns:
+            A ContextBundle: text (use it or str(bundle) in the prompt), contexts, provenance, used size
+        """
+        packer = _context_packer(budget, unit, count, dedupe_threshold, numbered)
+        top_k = max(1, min(initial_top_k, max_top_k))
+        requests = 0
+        while True:
+            response_data = self._client._cached_request(
+                "/search", {"query": query, "top_k": top_k, "environment_id": self.id, "search_modality": "vec_edge"}
+            )
+            requests += 1
+            hits = response_data.get("hits", [])
+            packer.offer(hits)
+            if packer.full or len(hits) < top_k or top_k >= max_top_k:
+                return packer.bundle(requests)
+            top_k = _next_context_top_k(top_k, packer, max_top_k)
     
     def search(self, query: str, top_k: int = 10, search_modality: str = "fast", 
                source_id: str = None, target_type: str = None, source_type: str = None,
@@ -61,7 +714,8 @@ class SyncEnvironment(BaseEnvironmentAttributes):
                temporal_filter: Dict[str, Any] = None,
                # Anchor-based filtering
                known_anchors: List[Dict[str, Any]] = None, 
-               anchor_max_hops: int = 2) -> List[Dict[str, Any]]:
+               anchor_max_hops: int = 2,
+               as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
         """
         Advanced search with multiple modalities.
         
@@ -99,68 +753,38 @@ class SyncEnvironment(BaseEnvironmentAttributes):
                           - value: Node value (for literals)
                           - kind: Node kind ("entity", "literal")
             anchor_max_hops: Maximum graph distance from any anchor point (default: 2)
+            
+            as_results: Return a SearchResults of slotted SearchHit objects instead of raw dicts;
+                        their nested data/graph_context are held as compact encoded JSON
+                        (re-encoded once here, decoded again on access)
         
         Returns:
             List of search results with scores and data
         """
-        payload = {
-            "query": query,
-            "environment_id": self.id,
-            "search_modality": search_modality,
-            "top_k": top_k,
-            "include_graph_context": include_graph_context
-        }
-        
-        # Legacy edge-based filters (for backward compatibility)
-        if source_id:
-            payload["source_id"] = source_id
-        if target_type:
-            payload["target_type"] = target_type
-        if source_type:
-            payload["source_type"] = source_type
-        if target_label:
-            payload["target_label"] = target_label
-        if source_label:
-            payload["source_label"] = source_label
-        if target_type_oid:
-            payload["target_type_oid"] = target_type_oid
-        if source_type_oid:
-            payload["source_type_oid"] = source_type_oid
-        if relationship_type:
-            payload["relationship_type"] = relationship_type
-        if relationship_label:
-            payload["relationship_label"] = relationship_label
-        
-        # New node-based filters
-        if node_type:
-            payload["node_type"] = node_type
-        if node_label:
-            payload["node_label"] = node_label
-        if node_kind:
-            payload["node_kind"] = node_kind
-        if has_sentence is not None:
-            payload["has_sentence"] = has_sentence
-        if temporal_filter:
-            payload["temporal_filter"] = temporal_filter
-        
-        # Add anchor-based filtering if provided
-        if known_anchors:
-            payload["known_anchors"] = known_anchors
-            payload["anchor_max_hops"] = anchor_max_hops
+        payload = _build_search_payload(
+            environment_id=self.id, query=query, top_k=top_k, search_modality=search_modality,
+            source_id=source_id, target_type=target_type, source_type=source_type,
+            target_label=target_label, source_label=source_label,
+            target_type_oid=target_type_oid, source_type_oid=source_type_oid,
+            relationship_type=relationship_type, relationship_label=relationship_label,
+            node_type=node_type, node_label=node_label, node_kind=node_kind,
+            has_sentence=has_sentence, include_graph_context=include_graph_context,
+            temporal_filter=temporal_filter, known_anchors=known_anchors, anchor_max_hops=anchor_max_hops
+        )
         
         logger = logging.getLogger(__name__)
-        search_start = time.time()
+        search_start = time.perf_counter()
         
-        logger.info(f"PRAXOS-PYTHON: Starting search - query='{query[:50]}...', modality={search_modality}, top_k={top_k}")
+        logger.debug("PRAXOS-PYTHON: Starting search - query='%.50s...', modality=%s, top_k=%s", query, search_modality, top_k)
         
-        response_data = self._client._request("POST", "/search", json_data=payload)
+        response_data = self._client._cached_request("/search", payload)
         
-        search_time = time.time() - search_start
+        search_time = time.perf_counter() - search_start
         results = response_data.get("hits", [])
         
-        logger.info(f"PRAXOS-PYTHON: Search completed in {search_time:.3f}s, returned {len(results)} results")
+        logger.debug("PRAXOS-PYTHON: Search completed in %.3fs, returned %d results", search_time, len(results))
         
-        return results
+        return SearchResults(results, codec=self._client.config.json_codec) if as_results else results
     
     def search_fast(self, query: str, top_k: int = 10, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -193,7 +817,7 @@ class SyncEnvironment(BaseEnvironmentAttributes):
         kwargs.setdefault('include_graph_context', True)
         return self.search(query=query, top_k=top_k, search_modality="node_vec", **kwargs)
 
-    def search_with_types(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+    def search_with_types(self, query: str, top_k: int = 10, as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
         """
         Search with automatic type inference using AI classification.
         Uses the type_vec modality to automatically infer source and target types.
@@ -201,14 +825,15 @@ class SyncEnvironment(BaseEnvironmentAttributes):
         Args:
             query: Natural language search query
             top_k: Number of results to return
+            as_results: Return a SearchResults instead of raw dicts, as in search
         
         Returns:
             List of search results with type classification metadata
         """
-        return self.search(query=query, top_k=top_k, search_modality="type_vec")
+        return self.search(query=query, top_k=top_k, search_modality="type_vec", as_results=as_results)
     
     def search_entities(self, query: str, entity_types: List[str] = None, top_k: int = 10, 
-                       include_temporal: bool = False) -> List[Dict[str, Any]]:
+                       include_temporal: bool = False, as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
         """
         Entity-centric search focusing on entities with generated sentences.
         
@@ -217,15 +842,15 @@ class SyncEnvironment(BaseEnvironmentAttributes):
             entity_types: Optional list of entity types to filter by
             top_k: Number of results to return
             include_temporal: Include temporal context in results
+            as_results: Return a SearchResults instead of raw dicts, as in search
         
         Returns:
             List of entity search results with comprehensive context
         """
         if entity_types:
             # Search each entity type and combine results
-            all_results = []
-            for entity_type in entity_types:
-                results = self.search(
+            return _merge_by_score([
+                self.search(
                     query=query,
                     search_modality="node_vec",
                     node_kind="entity",
@@ -234,11 +859,8 @@ class SyncEnvironment(BaseEnvironmentAttributes):
                     top_k=top_k,
                     include_graph_context=True
                 )
-                all_results.extend(results)
-            
-            # Sort by score and limit results
-            all_results.sort(key=lambda x: x.get("score", 0), reverse=True)
-            return all_results[:top_k]
+                for entity_type in entity_types
+            ], top_k, self._client.config.json_codec if as_results else None)
         else:
             return self.search(
                 query=query,
@@ -246,11 +868,12 @@ class SyncEnvironment(BaseEnvironmentAttributes):
                 node_kind="entity",
                 has_sentence=True,
                 top_k=top_k,
-                include_graph_context=True
+                include_graph_context=True,
+                as_results=as_results
             )
     
     def search_temporal(self, query: str, timepoint_type: str = None, time_period: str = None, 
-                       top_k: int = 10) -> List[Dict[str, Any]]:
+                       top_k: int = 10, as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
         """
         Temporal-aware search using TimePoint nodes for filtering.
         
@@ -259,6 +882,7 @@ class SyncEnvironment(BaseEnvironmentAttributes):
             timepoint_type: Type of TimePoint to filter by (e.g., "Quarter", "Month")
             time_period: Specific time period (e.g., "2023-Q4", "January")
             top_k: Number of results to return
+            as_results: Return a SearchResults instead of raw dicts, as in search
         
         Returns:
             List of search results filtered by temporal criteria
@@ -274,11 +898,12 @@ class SyncEnvironment(BaseEnvironmentAttributes):
             search_modality="node_vec",
             temporal_filter=temporal_filter if temporal_filter else None,
             top_k=top_k,
-            include_graph_context=True
+            include_graph_context=True,
+            as_results=as_results
         )
     
     def search_sentences(self, query: str, sentence_types: List[str] = None, 
-                        top_k: int = 10) -> List[Dict[str, Any]]:
+                        top_k: int = 10, as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
         """
         Search within generated sentences across different node types.
         
@@ -286,6 +911,7 @@ class SyncEnvironment(BaseEnvironmentAttributes):
             query: Search query text
             sentence_types: Node kinds to search within (default: ["entity", "edge_sentence"])
             top_k: Number of results to return
+            as_results: Return a SearchResults instead of raw dicts, as in search
         
         Returns:
             List of sentence-based search results
@@ -293,9 +919,8 @@ class SyncEnvironment(BaseEnvironmentAttributes):
         if not sentence_types:
             sentence_types = ["entity", "edge_sentence"]
         
-        all_results = []
-        for sentence_type in sentence_types:
-            results = self.search(
+        return _merge_by_score([
+            self.search(
                 query=query,
                 search_modality="node_vec",
                 node_kind=sentence_type,
@@ -303,11 +928,8 @@ class SyncEnvironment(BaseEnvironmentAttributes):
                 top_k=top_k,
                 include_graph_context=True
             )
-            all_results.extend(results)
-        
-        # Sort by score and limit results
-        all_results.sort(key=lambda x: x.get("score", 0), reverse=True)
-        return all_results[:top_k]
+            for sentence_type in sentence_types
+        ], top_k, self._client.config.json_codec if as_results else None)
     
     def search_from_anchors(self, anchors: List[Dict[str, Any]], query: str, max_hops: int = 2, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -386,6 +1008,120 @@ class SyncEnvironment(BaseEnvironmentAttributes):
             **kwargs
         )
     
+    def traverse(self, seeds: Iterable[Union[str, Dict[str, Any]]], query: str = "related entities",
+                 max_depth: int = 2, **options: Any) -> GraphTraversal:
+        """
+        Breadth-first, multi-hop exploration from many seeds, expanded one hop at a time on the client.
+        
+        Every hop runs batched search_from_anchors calls over the current frontier in parallel,
+        skips nodes already reached, and yields new nodes as their batch returns, so wide
+        frontiers cost a bounded number of requests instead of one search per anchor.
+        
+        Args:
+            seeds: Node IDs or anchor dicts (as for search_from_anchors) to start from
+            query: Semantic query used at every hop
+            max_depth: Number of hops to expand
+            **options: GraphTraversal options: hop_top_k, max_frontier, anchors_per_request,
+                       max_nodes, max_requests, time_budget (seconds), max_concurrency,
+                       expand (predicate deciding which reached nodes are expanded further),
+                       fetch_nodes (attach full nodes via node_loader), plus extra search parameters
+        
+        Returns:
+            A GraphTraversal; iterate it for TraversalNode results, then check its stop_reason,
+            requests and elapsed attributes
+        """
+        return GraphTraversal(self, seeds, query, max_depth=max_depth, **options)
+
+    def search_many(self, queries: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Union[List[Dict[str, Any]], Exception]]:
+        """
+        Runs several searches at once over the client's shared connection pool.
+        
+        The API has no batch search endpoint, so the queries are fanned out as
+        individual /search requests with at most max_concurrency in flight.
+        
+        Args:
+            queries: List of keyword-argument dicts for search(), e.g.
+                     [{"query": "acme", "node_type": "schema:Organization"},
+                      {"query": "calls", "known_anchors": [{"id": "n1"}], "search_modality": "node_vec"}]
+            max_concurrency: Maximum number of searches in flight at once
+        
+        Returns:
+            One entry per query, in input order: the list of hits, or the exception
+            (usually an APIError) raised by that query. A failing query does not
+            abort the rest of the batch.
+        """
+        return run_concurrently(lambda query: self.search(**query), queries, max_workers=max_concurrency)
+
+    def map_concurrent(self, method: Union[str, Callable[..., Any]], inputs: Iterable[Any], max_concurrency: int = 8,
+                       timeout: float = None, return_exceptions: bool = True) -> List[Any]:
+        """
+        Runs a method over many inputs on a bounded thread pool, sharing this client.
+        
+        Examples:
+            env.map_concurrent("search", [{"query": q, "top_k": 5} for q in queries])
+            env.map_concurrent("extract_items", ["Person", "Organization"])
+            env.map_concurrent(lambda source: source.get_status(), sources)
+        
+        Args:
+            method: Name of a SyncEnvironment method, or any callable (e.g. a source method)
+            inputs: One entry per call: a dict is passed as keyword arguments, a tuple as
+                    positional arguments, anything else as the single argument (wrap a dict
+                    argument in a tuple, e.g. (data,))
+            max_concurrency: Maximum number of calls in flight at once
+            timeout: Overall deadline in seconds. Calls not yet started when it expires are
+                     cancelled; calls already running cannot be interrupted and finish in the
+                     background, bounded by the request timeouts
+            return_exceptions: Return each call's exception in its slot (the default, as in
+                               search_many) instead of raising the first one
+        
+        Returns:
+            One result per input, in input order. Failed calls hold their exception, and calls
+            that did not finish before the timeout hold a TimeoutError.
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        return map_concurrently(lambda item: _call_with(func, item), inputs, max_workers=max_concurrency,
+                                timeout=timeout, return_exceptions=return_exceptions)
+
+    def hybrid_search(self, query: str, top_k: int = 10,
+                      modalities: Sequence[Union[str, Dict[str, Any]]] = DEFAULT_HYBRID_MODALITIES,
+                      fusion: str = "rrf", rrf_k: int = 60, weights: Dict[str, float] = None,
+                      rerank: Union[bool, Callable[[str, Sequence[Dict[str, Any]]], Sequence[float]]] = False,
+                      rerank_weight: float = 0.3, candidates: int = None, as_results: bool = False,
+                      **filters: Any) -> Union[List[Dict[str, Any]], SearchResults]:
+        """
+        Runs several search modalities concurrently and fuses them into one ranked, deduplicated list.
+        
+        Replaces calling search_fast, search_graph and search_sentences one after another and
+        merging by hand: the searches are in flight together, so this takes about as long as the
+        slowest one. Scores from different modalities are not comparable, so lists are fused by
+        rank (reciprocal-rank fusion) or by per-list normalized scores, and hits are deduplicated
+        by node id.
+        
+        Args:
+            query: Search query text
+            top_k: Number of fused results to return
+            modalities: Names from HYBRID_MODALITIES ("fast", "graph", "entities", "edge_sentences",
+                        "vec_edge", "types") or dicts of search() arguments
+            fusion: "rrf" (reciprocal-rank fusion) or "minmax" (sum of min-max normalized scores)
+            rrf_k: RRF damping constant; larger values flatten the advantage of top ranks
+            weights: Optional per-modality weights, keyed by modality name
+            rerank: True to rerank locally with LexicalReranker (BM25, NumPy-vectorized when
+                    available), or a callable (query, hits) -> scores such as a cross-encoder
+            rerank_weight: Share of the reranker score in the final score (0..1)
+            candidates: Hits requested per modality (default: 2 * top_k)
+            as_results: Return a SearchResults instead of raw dicts
+            **filters: search() filters applied to every modality, e.g. source_id
+        
+        Returns:
+            Fused hits, best first. score holds the fused (or reranked) score, modality_scores the
+            original score per modality and, when reranked, fused_score the pre-rerank score.
+            Modalities that fail are logged and skipped; if all fail, the first error is raised.
+        """
+        names, queries = _hybrid_queries(query, candidates or top_k * 2, modalities, filters)
+        responses = self.search_many(queries, max_concurrency=len(queries))
+        hits = _fuse_hybrid(query, names, responses, top_k, fusion, rrf_k, weights, rerank, rerank_weight)
+        return SearchResults(hits, codec=self._client.config.json_codec) if as_results else hits
+    
     def fetch_graph_nodes(self, node_ids: List[str]) -> List[Dict[str, Any]]:
         """
         Fetch nodes from Neo4j graph by their node IDs.
@@ -403,8 +1139,35 @@ class SyncEnvironment(BaseEnvironmentAttributes):
         
         response_data = self._client._request("POST", "/fetch-graph-nodes", json_data=payload)
         return response_data.get("results", [])
+
+    @property
+    def node_loader(self) -> NodeLoader:
+        """
+        Batching, deduplicating and caching loader in front of fetch_graph_nodes, shared by every
+        SyncEnvironment object of this environment on the same client. Its cache is cleared
+        whenever data is added to the environment. Tune it through its attributes, e.g.
+        env.node_loader.max_batch_size = 500.
+        """
+        loaders = self._client._node_loaders
+        loader = loaders.get(self.id)
+        if loader is None:
+            loader = loaders.setdefault(self.id, NodeLoader(self.fetch_graph_nodes))
+        return loader
+
+    def load_nodes(self, node_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Fetches graph nodes through node_loader: ids already cached or in flight are not requested
+        again, and concurrent calls from several threads are coalesced into chunked requests.
+        
+        Args:
+            node_ids: Node IDs to load, in any number and possibly repeated
+        
+        Returns:
+            Nodes in the order of node_ids, with None for ids the graph does not contain
+        """
+        return self.node_loader.load_many(node_ids)
     
-    def extract_items(self, schema: Union[str, Type[BaseModel]], source_id: str = None, page_idx: str = None):
+    def extract_items(self, schema: Union[str, Type["BaseModel"]], source_id: str = None, page_idx: str = None):
         """
         Extracts entities from a schema/label.
         
@@ -416,19 +1179,7 @@ class SyncEnvironment(BaseEnvironmentAttributes):
         Returns:
             List of extracted entity items
         """
-        schema_name = schema if isinstance(schema, str) else schema.__name__
-
-        payload = {
-            "extraction_type": "entities",
-            "label": schema_name,
-            "environment_id": self.id
-        }
-        
-        if source_id:
-            payload["source_id"] = source_id
-        if page_idx:
-            payload["page_idx"] = page_idx
-
+        payload = _build_extract_items_payload(self.id, schema, source_id=source_id, page_idx=page_idx)
         response_data = self._client._request("POST", f"/extract", json_data=payload)
         return response_data.get("items", [])
     
@@ -446,100 +1197,349 @@ class SyncEnvironment(BaseEnvironmentAttributes):
         Returns:
             Dictionary with extraction results based on mode
         """
-        if mode not in ["literals_only", "full_entities"]:
-            raise ValueError("mode must be 'literals_only' or 'full_entities'")
-        
-        payload = {
-            "extraction_type": "literals",
-            "literal_type": literal_type,
-            "mode": mode,
-            "environment_id": self.id
-        }
-        
-        if source_id:
-            payload["source_id"] = source_id
-        if page_idx:
-            payload["page_idx"] = page_idx
-        
+        payload = _build_extract_literals_payload(self.id, literal_type, mode, source_id=source_id, page_idx=page_idx)
         response_data = self._client._request("POST", "/extract", json_data=payload)
         return response_data
-    
 
-    def add_conversation(self, messages: List[Message|Dict[str, str]], name: str=None, description: str=None) -> SyncSource:
-        """Adds a conversation source."""
-        if len(messages) == 0:
-            raise ValueError("Messages must be a non-empty list")
+    def iter_items(self, schema: Union[str, Type["BaseModel"]], source_id: str = None, page_idx: str = None,
+                   page_size: int = 500, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Streams extracted entities page by page instead of loading them all at once.
         
-        messages = [Message.from_dict(message) if isinstance(message, dict) else message for message in messages]
+        Pages are requested with limit/offset; while one page is being consumed the next is
+        fetched in the background, so memory stays bounded by about two pages.
         
-        payload = {
-            "messages": [message.to_dict() for message in messages],
-            "description": description
-        }
+        Args:
+            schema: Schema name or Pydantic model class
+            source_id: Optional source ID filter
+            page_idx: Optional page index filter
+            page_size: Number of items requested per page
+            prefetch: Fetch the next page while the current one is consumed
+        
+        Yields:
+            Extracted entity items
+        """
+        payload = _build_extract_items_payload(self.id, schema, source_id=source_id, page_idx=page_idx)
 
-        if name:
-            payload["name"] = name
+        def fetch_page(offset, limit):
+            response_data = self._client._request("POST", "/extract", json_data=_paged(payload, offset, limit))
+            return response_data.get("items", [])
 
-        response_data = self._client._request("POST", f"/sources", params={"type": "conversation", "environment_id": self.id}, json_data=payload)
-        return SyncSource(client=self._client, **response_data)
+        return iter_pages(fetch_page, page_size, prefetch=prefetch)
 
-    def add_file(self, path: str, name: str=None, description: str=None) -> SyncSource:
-        """Adds a file source."""
-        global ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE
+    def iter_literals(self, literal_type: str, mode: str = "literals_only", source_id: str = None,
+                      page_idx: str = None, page_size: int = 500, prefetch: bool = True) -> Iterator[Any]:
+        """
+        Streams extracted literals (or entities with literals, in "full_entities" mode) page by page.
+        Paging works as in iter_items.
+        """
+        payload = _build_extract_literals_payload(self.id, literal_type, mode, source_id=source_id, page_idx=page_idx)
 
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"File not found: {path}")
+        def fetch_page(offset, limit):
+            return _extracted_list(self._client._request("POST", "/extract", json_data=_paged(payload, offset, limit)))
 
-        file_extension = path.split('.')[-1]
-        if file_extension not in ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE:
-            raise ValueError(f"File extension {file_extension} is not supported. Supported extensions are: {', '.join(ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE.keys())}")
-        
-        if name is None:
-            name = '.'.join(os.path.basename(path).split('.')[:-1])
+        return iter_pages(fetch_page, page_size, prefetch=prefetch)
 
-        try:
-            with open(path, 'rb') as f:
-                files = {'file': (name, f, ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE[file_extension])}
-                form_data = {"type": "file", "name": name, "description": description}
-                response_data = self._client._request(
-                    "POST", f"sources", params={"environment_id": self.id}, data=form_data, files=files
-                )
-            return SyncSource(client=self._client, **response_data)
-        except FileNotFoundError:
-            raise ValueError(f"File not found: {path}")
-        except Exception as e:
-            raise APIError(status_code=0, message=f"Sync file upload failed: {str(e)}") from e
-        
-    def add_business_data(self, data: Dict[str, Any], name: str=None, description: str=None, 
-                         root_entity_type: str="schema:Thing", metadata: Dict[str, Any]=None,
-                         processing_config: Dict[str, Any]=None) -> SyncSource:
+    def export_snapshot(self, path: str, schemas: Sequence[Union[str, Type["BaseModel"]]] = (),
+                        literal_types: Sequence[str] = (), literal_mode: str = "literals_only",
+                        page_size: int = 500) -> LocalEnvironment:
         """
-        Adds business data source with enhanced JSON processing.
+        Exports entities and literals into a local snapshot file for offline use.
+        
+        Pages through extract_items for every schema and extract_literals for every literal
+        type (bounded memory), and writes them into a single indexed file: entity type,
+        normalized label, literal value and a full-text index. The file replaces any existing
+        snapshot at path only once the export has completed.
         
         Args:
-            data: JSON data to process
-            name: Optional source name
-            description: Optional description
-            root_entity_type: Root entity type for JSON processing (default: "schema:Thing")
-            metadata: Additional metadata for processing
-            processing_config: Custom processing configuration
-            
+            path: Snapshot file to write
+            schemas: Schema names or Pydantic model classes to export entities of
+            literal_types: Literal types to export (e.g. "EmailType")
+            literal_mode: "literals_only" or "full_entities", as in extract_literals
+            page_size: Records requested per page
+        
         Returns:
-            SyncSource object
+            A LocalEnvironment over the new snapshot, answering search_entities, extract_items,
+            extract_literals and label/literal lookups without API calls
         """
-        payload = {
-            "data": data,
-            "name": name,
-            "description": description,
-            "root_entity_type": root_entity_type,
-            "metadata": metadata or {},
-            "processing_config": processing_config or {}
-        }
+        with _snapshot_writer(self, path, schemas, literal_types, literal_mode) as writer:
+            # Listed first, so a source finishing mid-export is fetched again by the next sync rather than missed.
+            _record_export_sources(writer, list(self.iter_sources()))
+            for schema in schemas:
+                writer.add_items(schema, self.iter_items(schema, page_size=page_size))
+            for literal_type in literal_types:
+                writer.add_literals(literal_type, literal_mode, self.iter_literals(literal_type, literal_mode, page_size=page_size))
+        return LocalEnvironment(path)
 
-        response_data = self._client._request("POST", f"/sources", params={"environment_id": self.id}, json_data=payload)
-        return SyncSource(client=self._client, **response_data)
-    
-    def add_networkx_graph(self, graph, name: str=None, description: str=None,
+    def sync_snapshot(self, path: str, schemas: Sequence[Union[str, Type["BaseModel"]]] = (),
+                      literal_types: Sequence[str] = (), literal_mode: str = "literals_only",
+                      page_size: int = 500, max_concurrency: int = 4, remove_deleted: bool = True) -> Dict[str, Any]:
+        """
+        Brings a snapshot written by export_snapshot up to date, fetching only what changed.
+        
+        The snapshot records every source it has seen with its created_at and status. A sync
+        lists the sources (metadata only) and compares them with that record: entities and
+        literals are extracted, filtered by source_id, only for ready sources that are new, were
+        not synced yet, or whose created_at or status changed. A changed source's records replace
+        the ones the snapshot held for it. Refresh cost therefore scales with churn, not with
+        environment size; the API offers no change feed, so the sync is driven by the listed set
+        of sources rather than a cursor. Sources that are still processing are retried on the
+        next sync, as are sources whose extraction failed. Deleted sources are dropped along with
+        the records only they contained; records from the initial full export are only linked to
+        a source if the API returned their source_id.
+        
+        If no snapshot exists at path, a full export_snapshot is done instead. Schemas and
+        literal types not in the snapshot yet are exported in full and then synced from then on.
+        
+        Args:
+            path: Snapshot file
+            schemas: Additional schemas to include
+            literal_types: Additional literal types to include
+            literal_mode: Mode for the additional literal types
+            page_size: Records requested per page
+            max_concurrency: Sources fetched at once
+            remove_deleted: Drop records of sources that no longer exist
+        
+        Returns:
+            A report dict: sources_new, sources_updated, sources_removed, sources_pending, items
+            and literals written, removed_records and errors (source id -> message)
+        """
+        if not os.path.exists(path):
+            return _full_export_report(self.export_snapshot(path, schemas, literal_types, literal_mode, page_size))
+
+        report = _empty_sync_report()
+        writer, all_schemas, all_literals, new_schemas, new_literals = _open_sync_writer(self, path, schemas, literal_types, literal_mode)
+        with writer:
+            for schema in new_schemas:
+                report["items"] += writer.add_items(schema, self.iter_items(schema, page_size=page_size))
+            for literal_type, mode in new_literals:
+                report["literals"] += writer.add_literals(literal_type, mode, self.iter_literals(literal_type, mode, page_size=page_size))
+
+            sources = list(self.iter_sources())
+            known = writer.known_sources()
+            to_fetch, removed = _plan_sync(known, sources)
+
+            def fetch_source(source):
+                items = [(schema, list(self.iter_items(schema, source_id=source.id, page_size=page_size, prefetch=False)))
+                         for schema in all_schemas]
+                literals = [((literal_type, mode), list(self.iter_literals(literal_type, mode, source_id=source.id, page_size=page_size, prefetch=False)))
+                            for literal_type, mode in all_literals]
+                return items, literals
+
+            synced = set()
+            for source, contents in zip(to_fetch, iter_concurrently(fetch_source, to_fetch, max_workers=max_concurrency)):
+                if _apply_source_contents(writer, source, contents, report):
+                    synced.add(source.id)
+            return _finish_sync(writer, known, sources, to_fetch, synced, removed if remove_deleted else [], report)
+
+    def add_conversation(self, messages: List[Union["Message", Dict[str, str]]], name: str=None, description: str=None) -> SyncSource:
+        """Adds a conversation source."""
+        payload = _build_conversation_payload(messages, name=name, description=description)
+        response_data = self._client._request("POST", f"/sources", params={"type": "conversation", "environment_id": self.id}, json_data=payload)
+        self._client._invalidate_cache(self.id)
+        return SyncSource(client=self._client, **response_data)
+
+    def add_file(self, path: str, name: str=None, description: str=None,
+                 progress: Callable[[int, int], None]=None, retry_upload: bool=False,
+                 timeout: float=None) -> SyncSource:
+        """
+        Adds a file source.
+        
+        The file is streamed from disk in chunks, so memory use does not grow with file size.
+        
+        Args:
+            path: Path of a supported file (see ACCEPTABLE_SOURCE_EXTENSIONS_TO_CONTENT_TYPE)
+            name: Optional source name (default: file name without extension)
+            description: Optional description
+            progress: Optional callback(bytes_sent, total_bytes) invoked as chunks are sent
+            retry_upload: Re-send the file from its first byte on transient failures, following the
+                          client's retry policy. Off by default: the API has no resumable or
+                          idempotent upload, so a retry after the server already stored the first
+                          attempt creates a duplicate source.
+            timeout: Read/write timeout in seconds for this upload (default: the client's upload_timeout)
+        
+        Returns:
+            SyncSource object
+        """
+        name, content_type = _resolve_file_upload(path, name)
+        upload_timeout = self._client.config.upload_timeouts
+        if timeout is not None:
+            upload_timeout = httpx.Timeout(timeout, connect=upload_timeout.connect, pool=upload_timeout.pool)
+
+        try:
+            with open(path, 'rb') as f:
+                files = {'file': (name, _UploadReader(f, progress), content_type)}
+                form_data = {"type": "file", "name": name, "description": description}
+                response_data = self._client._request(
+                    "POST", f"sources", params={"environment_id": self.id}, data=form_data, files=files,
+                    timeout=upload_timeout, retryable=retry_upload or None
+                )
+            self._client._invalidate_cache(self.id)
+            return SyncSource(client=self._client, **response_data)
+        except FileNotFoundError:
+            raise ValueError(f"File not found: {path}")
+        except APIError:
+            raise
+        except Exception as e:
+            raise APIError(status_code=0, message=f"Sync file upload failed: {str(e)}") from e
+
+    def add_files(self, paths: Union[str, List[str]], description: str=None, max_concurrency: int=4,
+                  recursive: bool=False, progress: Callable[[str, int, int], None]=None,
+                  retry_upload: bool=False, timeout: float=None) -> Dict[str, Union[SyncSource, Exception]]:
+        """
+        Uploads many files concurrently through a bounded worker pool.
+        
+        Args:
+            paths: A path or list of paths; each may be a file, a directory or a glob pattern
+                   (e.g. "exports/**/*.pdf"). Directories and patterns only pick up files with a
+                   supported extension.
+            description: Optional description applied to every source
+            max_concurrency: Maximum number of uploads in flight at once
+            recursive: Descend into subdirectories of directories; enables "**" in patterns
+            progress: Optional callback(path, bytes_sent, total_bytes)
+            retry_upload: See add_file
+            timeout: See add_file
+        
+        Returns:
+            Dict mapping each expanded path, in order, to its SyncSource or to the exception
+            raised for that file. One failing file does not stop the others.
+        """
+        expanded = _expand_source_paths(paths, recursive=recursive)
+
+        def upload(path):
+            file_progress = functools.partial(progress, path) if progress is not None else None
+            return self.add_file(path, description=description, progress=file_progress,
+                                 retry_upload=retry_upload, timeout=timeout)
+
+        results = run_concurrently(upload, expanded, max_workers=max_concurrency)
+        return dict(zip(expanded, results))
+        
+    def add_business_data(self, data: Dict[str, Any], name: str=None, description: str=None, 
+                         root_entity_type: str="schema:Thing", metadata: Dict[str, Any]=None,
+                         processing_config: Dict[str, Any]=None) -> SyncSource:
+        """
+        Adds business data source with enhanced JSON processing.
+        
+        Args:
+            data: JSON data to process
+            name: Optional source name
+            description: Optional description
+            root_entity_type: Root entity type for JSON processing (default: "schema:Thing")
+            metadata: Additional metadata for processing
+            processing_config: Custom processing configuration
+            
+        Returns:
+            SyncSource object
+        """
+        payload = _build_business_data_payload(
+            data, name=name, description=description, root_entity_type=root_entity_type,
+            metadata=metadata, processing_config=processing_config
+        )
+
+        response_data = self._client._request("POST", f"/sources", params={"environment_id": self.id}, json_data=payload)
+        self._client._invalidate_cache(self.id)
+        return SyncSource(client=self._client, **response_data)
+    
+    def add_business_data_chunked(self, records: Iterable[Any], name: str=None, description: str=None,
+                                  root_entity_type: str="schema:Thing", metadata: Dict[str, Any]=None,
+                                  processing_config: Dict[str, Any]=None, max_batch_bytes: int=4 * 1024 * 1024,
+                                  max_concurrency: int=4) -> List[Union[SyncSource, Exception]]:
+        """
+        Adds business data too large for a single request, as a series of size-bounded batches.
+        
+        Records are pulled from the iterable and serialized one at a time, so a generator over a
+        multi-GB export (e.g. utils.iter_json_lines) is never held in memory. Each batch becomes
+        one source whose data is the list of its records. Batches share a "batch_id" and carry
+        their "batch_index" in metadata, and are named "<name> (part N)".
+        
+        Args:
+            records: Iterable of JSON-serializable records
+            name: Optional base name for the batch sources
+            description: Optional description
+            root_entity_type: Root entity type for JSON processing (default: "schema:Thing")
+            metadata: Additional metadata, copied into every batch
+            processing_config: Custom processing configuration
+            max_batch_bytes: Upper bound on the serialized records per batch
+            max_concurrency: Maximum number of batches uploading at once
+        
+        Returns:
+            One SyncSource per batch in input order, or the exception raised for that batch
+            (a record that cannot be encoded fails its batch; the next records start a new one)
+        """
+        batch_id = str(uuid.uuid4())
+        # Records are encoded with the client's JSON codec, as _request encodes json_data.
+        encode = self._client.config.json_codec.encode
+
+        def upload(indexed_batch):
+            index, batch = indexed_batch
+            if isinstance(batch, Exception):
+                raise batch
+            payload = {
+                "name": _batch_name(name, index),
+                "description": description,
+                "root_entity_type": root_entity_type,
+                "metadata": {**(metadata or {}), "batch_id": batch_id, "batch_index": index},
+                "processing_config": processing_config or {}
+            }
+            response_data = self._client._request(
+                "POST", f"/sources", params={"environment_id": self.id},
+                content=_json_object_with_raw(payload, {"data": _json_array(batch)}, encode)
+            )
+            return SyncSource(client=self._client, **response_data)
+
+        batches = enumerate(_iter_encoded_batches(records, encode, max_batch_bytes))
+        try:
+            results = list(iter_concurrently(upload, batches, max_workers=max_concurrency))
+        finally:
+            # Batches uploaded before a failure have changed the environment all the same.
+            self._client._invalidate_cache(self.id)
+        return results
+
+    def add_conversation_chunked(self, messages: Iterable[Union["Message", Dict[str, str]]], name: str=None,
+                                 description: str=None, max_batch_bytes: int=4 * 1024 * 1024,
+                                 max_concurrency: int=4) -> List[Union[SyncSource, Exception]]:
+        """
+        Adds a long conversation as a series of size-bounded conversation sources.
+        
+        Messages are validated and serialized one at a time from the iterable. Each batch of
+        consecutive messages becomes one source named "<name> (part N)".
+        
+        Args:
+            messages: Iterable of Message objects or message dicts, in conversation order
+            name: Optional base name for the batch sources
+            description: Optional description
+            max_batch_bytes: Upper bound on the serialized messages per batch
+            max_concurrency: Maximum number of batches uploading at once
+        
+        Returns:
+            One SyncSource per batch in conversation order, or the exception raised for that batch
+            (an invalid message fails its batch, as in add_business_data_chunked)
+        """
+        encode = self._client.config.json_codec.encode
+
+        def upload(indexed_batch):
+            index, batch = indexed_batch
+            if isinstance(batch, Exception):
+                raise batch
+            payload = {"description": description}
+            if name:
+                payload["name"] = _batch_name(name, index)
+            response_data = self._client._request(
+                "POST", f"/sources", params={"type": "conversation", "environment_id": self.id},
+                content=_json_object_with_raw(payload, {"messages": _json_array(batch)}, encode)
+            )
+            return SyncSource(client=self._client, **response_data)
+
+        batches = enumerate(_iter_encoded_batches(messages, lambda message: encode(_message_dict(message)), max_batch_bytes))
+        try:
+            results = list(iter_concurrently(upload, batches, max_workers=max_concurrency))
+        finally:
+            self._client._invalidate_cache(self.id)
+        if not results:
+            raise ValueError("Messages must be a non-empty iterable")
+        return results
+    
+    def add_networkx_graph(self, graph, name: str=None, description: str=None,
                           metadata: Dict[str, Any]=None, processing_config: Dict[str, Any]=None) -> SyncSource:
         """
         Adds a NetworkX graph as a source for processing.
@@ -567,24 +1567,9 @@ class SyncEnvironment(BaseEnvironmentAttributes):
                 processing_config={"generate_sentences": True, "generate_facts": False}
             )
         """
-        try:
-            import networkx as nx
-        except ImportError:
-            raise ImportError("NetworkX is required for graph ingestion. Install with: pip install networkx")
-        
-        if not isinstance(graph, (nx.MultiDiGraph, nx.DiGraph, nx.Graph, nx.MultiGraph)):
-            raise ValueError("Graph must be a NetworkX graph object")
-        
-        # Convert to node-link format for API transmission
-        graph_data = nx.node_link_data(graph)
-        
-        payload = {
-            "graph_data": graph_data,
-            "name": name,
-            "description": description,
-            "metadata": metadata or {},
-            "processing_config": processing_config or {}
-        }
+        payload = _build_networkx_graph_payload(
+            graph, name=name, description=description, metadata=metadata, processing_config=processing_config
+        )
 
         response_data = self._client._request(
             "POST", 
@@ -592,13 +1577,145 @@ class SyncEnvironment(BaseEnvironmentAttributes):
             params={"environment_id": self.id, "type": "networkx_graph"}, 
             json_data=payload
         )
+        self._client._invalidate_cache(self.id)
         return SyncSource(client=self._client, **response_data)
     
+    def add_graph_chunked(self, edges: Iterable[Tuple]=None, nodes: Iterable[Any]=None, name: str=None,
+                          description: str=None, metadata: Dict[str, Any]=None,
+                          processing_config: Dict[str, Any]=None, directed: bool=True, multigraph: bool=True,
+                          graph_attrs: Dict[str, Any]=None, wire_format: str="node_link",
+                          max_batch_bytes: int=4 * 1024 * 1024, max_concurrency: int=4) -> List[Union[SyncSource, Exception]]:
+        """
+        Adds a large graph as a series of size-bounded graph sources, without building it in memory.
+        
+        Nodes and then edges are pulled from the iterables and encoded one at a time into batches
+        of at most max_batch_bytes, which are uploaded concurrently as networkx_graph sources
+        named "<name> (part N)" and tagged with a shared "batch_id" and their "batch_index".
+        A plain edge-list iterator is enough; nodes only need to be given to attach attributes
+        or to include isolated nodes.
+        
+        Args:
+            edges: Iterable of (u, v), (u, v, attributes), (u, v, key) or (u, v, key, attributes)
+            nodes: Optional iterable of node ids or (node_id, attributes) pairs
+            name: Optional base name for the batch sources
+            description: Optional description
+            metadata: Additional metadata, copied into every batch
+            processing_config: Custom processing configuration
+            directed: Whether the graph is directed
+            multigraph: Whether parallel edges are distinguished by key
+            graph_attrs: Graph-level attributes, sent with every batch
+            wire_format: "node_link" (same shape as networkx.node_link_data) or "columnar"
+                         (attribute keys interned once per batch; needs server-side support)
+            max_batch_bytes: Upper bound on the encoded elements per batch
+            max_concurrency: Maximum number of batches uploading at once
+        
+        Returns:
+            One SyncSource per batch in order, or the exception raised for that batch
+            (an element that cannot be encoded fails its batch, as in add_business_data_chunked)
+        """
+        encoder = _GraphEncoder(self._client.config.json_codec.encode, wire_format=wire_format, directed=directed, multigraph=multigraph)
+        batch_id = str(uuid.uuid4())
+
+        def upload(indexed_batch):
+            index, graph_document = indexed_batch
+            if isinstance(graph_document, Exception):
+                raise graph_document
+            payload = {
+                "name": _batch_name(name, index),
+                "description": description,
+                "metadata": {**(metadata or {}), "batch_id": batch_id, "batch_index": index},
+                "processing_config": processing_config or {}
+            }
+            response_data = self._client._request(
+                "POST", f"/sources", params={"environment_id": self.id, "type": "networkx_graph"},
+                content=_json_object_with_raw(payload, {"graph_data": graph_document}, encoder.encode)
+            )
+            return SyncSource(client=self._client, **response_data)
+
+        batches = enumerate(_iter_graph_batches(encoder, nodes, edges, max_batch_bytes, graph_attrs))
+        try:
+            results = list(iter_concurrently(upload, batches, max_workers=max_concurrency))
+        finally:
+            self._client._invalidate_cache(self.id)
+        return results
+
+    def add_networkx_graph_chunked(self, graph, name: str=None, description: str=None,
+                                   metadata: Dict[str, Any]=None, processing_config: Dict[str, Any]=None,
+                                   wire_format: str="node_link", max_batch_bytes: int=4 * 1024 * 1024,
+                                   max_concurrency: int=4) -> List[Union[SyncSource, Exception]]:
+        """
+        Streaming counterpart of add_networkx_graph for very large graphs.
+        
+        Walks graph.nodes and graph.edges incrementally instead of materializing
+        networkx.node_link_data(graph); see add_graph_chunked for batching and return value.
+        """
+        _check_networkx_graph(graph)
+        edges = graph.edges(keys=True, data=True) if graph.is_multigraph() else graph.edges(data=True)
+        return self.add_graph_chunked(
+            edges=edges, nodes=graph.nodes(data=True), name=name, description=description,
+            metadata=metadata, processing_config=processing_config, directed=graph.is_directed(),
+            multigraph=graph.is_multigraph(), graph_attrs=dict(graph.graph), wire_format=wire_format,
+            max_batch_bytes=max_batch_bytes, max_concurrency=max_concurrency
+        )
+
     def get_sources(self) -> List[SyncSource]:
         """Gets all sources for the environment."""
         response_data = self._client._request("GET", f"/sources", params={"environment_id": self.id})
         return [SyncSource(client=self._client, **source) for source in response_data]
 
+    def iter_sources(self, page_size: int = 100, prefetch: bool = True) -> Iterator[SyncSource]:
+        """Streams the environment's sources page by page; see iter_items."""
+        def fetch_page(offset, limit):
+            return self._client._request("GET", "/sources", params=_paged({"environment_id": self.id}, offset, limit))
+
+        for source in iter_pages(fetch_page, page_size, prefetch=prefetch):
+            yield SyncSource(client=self._client, **source)
+
+    def wait_for_sources(self, sources: List[SyncSource], timeout: float = 3600.0, poll_interval: float = 2.0,
+                         max_poll_interval: float = 30.0, backoff: float = 1.5) -> Iterator[SyncSource]:
+        """
+        Waits for many sources at once, yielding each one as soon as its processing finishes.
+        
+        Every tick checks all pending sources with a single get_sources listing instead of one
+        request per source. The interval resets to poll_interval whenever a source finishes and
+        otherwise grows by backoff up to max_poll_interval.
+        
+        Args:
+            sources: Sources of this environment to wait for
+            timeout: Maximum number of seconds to wait for all of them
+            poll_interval: Initial seconds between listings
+            max_poll_interval: Upper bound on the seconds between listings
+            backoff: Factor applied to the interval after a tick where nothing finished
+        
+        Yields:
+            Sources in completion order, with status updated (check is_ready / is_failed)
+        
+        Raises:
+            TimeoutError: If sources are still processing after timeout seconds
+        """
+        pending = {source.id: source for source in sources}
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        while pending:
+            listing = self._client._request("GET", f"/sources", params={"environment_id": self.id})
+            statuses = {entry.get("id"): entry.get("status", "unknown") for entry in listing}
+
+            finished = []
+            for source_id, source in pending.items():
+                if source_id in statuses:
+                    source.status = statuses[source_id]
+                if is_terminal_status(source.status):
+                    finished.append(source_id)
+            for source_id in finished:
+                yield pending.pop(source_id)
+
+            if not pending:
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{len(pending)} source(s) still processing after {timeout}s: {', '.join(pending)}")
+            interval = poll_interval if finished else min(interval * backoff, max_poll_interval)
+            time.sleep(_sleep_time(interval, deadline))
+
     def get_source(self, id: str=None, name: str=None) -> SyncSource:
         """Gets a source for the environment."""
         if id is None and name is None:
@@ -610,3 +1727,590 @@ class SyncEnvironment(BaseEnvironmentAttributes):
             response_data = self._client._request("GET", f"/sources", params={"environment_id": self.id, "name": name})
 
         return SyncSource(client=self._client, **response_data)
+
+
+class AsyncEnvironment(BaseEnvironmentAttributes):
+    """
+    Represents an asynchronous Environment resource.
+    Mirrors SyncEnvironment; every network call is a coroutine on the owning AsyncClient.
+    """
+    def __init__(self, client, id: str, name: str, created_at: str, description: str, **data: Any):
+        super().__init__(id=id, name=name, created_at=created_at, description=description, **data)
+        self._client = client
+
+    def __repr__(self) -> str:
+        return f"<AsyncEnvironment id='{self.id}' name='{self.name}'>"
+
+    async def get_context(self, query: str, top_k: int = 1) -> Context|List[Context]:
+        """Gets context for an LLM using vec_edge search modality."""
+        response_data = await self._client._cached_request(
+            "/search", {"query": query, "top_k": top_k, "environment_id": self.id, "search_modality": "vec_edge"}
+        )
+
+        return _parse_contexts(response_data, top_k)
+
+    async def build_context(self, query: str, budget: int = 1000, unit: str = "tokens",
+                      count: Optional[Callable[[str], int]] = None, initial_top_k: int = 8, max_top_k: int = 64,
+                      dedupe_threshold: float = 0.85, numbered: bool = True) -> ContextBundle:
+        """Assembles prompt-ready context within a token budget; see SyncEnvironment.build_context."""
+        packer = _context_packer(budget, unit, count, dedupe_threshold, numbered)
+        top_k = max(1, min(initial_top_k, max_top_k))
+        requests = 0
+        while True:
+            response_data = await self._client._cached_request(
+                "/search", {"query": query, "top_k": top_k, "environment_id": self.id, "search_modality": "vec_edge"}
+            )
+            requests += 1
+            hits = response_data.get("hits", [])
+            packer.offer(hits)
+            if packer.full or len(hits) < top_k or top_k >= max_top_k:
+                return packer.bundle(requests)
+            top_k = _next_context_top_k(top_k, packer, max_top_k)
+
+    async def search(self, query: str, top_k: int = 10, search_modality: str = "fast",
+                     source_id: str = None, target_type: str = None, source_type: str = None,
+                     target_label: str = None, source_label: str = None,
+                     target_type_oid: str = None, source_type_oid: str = None,
+                     relationship_type: str = None, relationship_label: str = None,
+                     node_type: str = None, node_label: str = None, node_kind: str = None,
+                     has_sentence: bool = None, include_graph_context: bool = True,
+                     temporal_filter: Dict[str, Any] = None,
+                     known_anchors: List[Dict[str, Any]] = None,
+                     anchor_max_hops: int = 2,
+                     as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
+        """
+        Advanced search with multiple modalities.
+
+        Accepts the same arguments as SyncEnvironment.search, including as_results.
+
+        Returns:
+            List of search results with scores and data
+        """
+        payload = _build_search_payload(
+            environment_id=self.id, query=query, top_k=top_k, search_modality=search_modality,
+            source_id=source_id, target_type=target_type, source_type=source_type,
+            target_label=target_label, source_label=source_label,
+            target_type_oid=target_type_oid, source_type_oid=source_type_oid,
+            relationship_type=relationship_type, relationship_label=relationship_label,
+            node_type=node_type, node_label=node_label, node_kind=node_kind,
+            has_sentence=has_sentence, include_graph_context=include_graph_context,
+            temporal_filter=temporal_filter, known_anchors=known_anchors, anchor_max_hops=anchor_max_hops
+        )
+
+        logger = logging.getLogger(__name__)
+        search_start = time.perf_counter()
+
+        logger.debug("PRAXOS-PYTHON: Starting async search - query='%.50s...', modality=%s, top_k=%s", query, search_modality, top_k)
+
+        response_data = await self._client._cached_request("/search", payload)
+
+        search_time = time.perf_counter() - search_start
+        results = response_data.get("hits", [])
+
+        logger.debug("PRAXOS-PYTHON: Async search completed in %.3fs, returned %d results", search_time, len(results))
+
+        return SearchResults(results, codec=self._client.config.json_codec) if as_results else results
+
+    async def search_fast(self, query: str, top_k: int = 10, **kwargs) -> List[Dict[str, Any]]:
+        """Fast Qdrant-based search with basic filtering."""
+        return await self.search(query=query, top_k=top_k, search_modality="fast", **kwargs)
+
+    async def search_graph(self, query: str, top_k: int = 10, **kwargs) -> List[Dict[str, Any]]:
+        """Neo4j graph-aware search with relationship traversal."""
+        kwargs.setdefault('include_graph_context', True)
+        return await self.search(query=query, top_k=top_k, search_modality="node_vec", **kwargs)
+
+    async def search_with_types(self, query: str, top_k: int = 10, as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
+        """Search with automatic type inference using the type_vec modality; as_results as in search."""
+        return await self.search(query=query, top_k=top_k, search_modality="type_vec", as_results=as_results)
+
+    async def search_entities(self, query: str, entity_types: List[str] = None, top_k: int = 10,
+                              include_temporal: bool = False, as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
+        """
+        Entity-centric search focusing on entities with generated sentences.
+        When several entity types are given, the per-type searches run concurrently.
+        as_results returns a SearchResults instead of raw dicts, as in search.
+        """
+        if entity_types:
+            return _merge_by_score(await asyncio.gather(*[
+                self.search(
+                    query=query,
+                    search_modality="node_vec",
+                    node_kind="entity",
+                    node_type=entity_type,
+                    has_sentence=True,
+                    top_k=top_k,
+                    include_graph_context=True
+                )
+                for entity_type in entity_types
+            ]), top_k, self._client.config.json_codec if as_results else None)
+        else:
+            return await self.search(
+                query=query,
+                search_modality="node_vec",
+                node_kind="entity",
+                has_sentence=True,
+                top_k=top_k,
+                include_graph_context=True,
+                as_results=as_results
+            )
+
+    async def search_temporal(self, query: str, timepoint_type: str = None, time_period: str = None,
+                              top_k: int = 10, as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
+        """Temporal-aware search using TimePoint nodes for filtering; as_results as in search."""
+        temporal_filter = {}
+        if timepoint_type:
+            temporal_filter["timepoint_type"] = timepoint_type
+        if time_period:
+            temporal_filter["time_period"] = time_period
+
+        return await self.search(
+            query=query,
+            search_modality="node_vec",
+            temporal_filter=temporal_filter if temporal_filter else None,
+            top_k=top_k,
+            include_graph_context=True,
+            as_results=as_results
+        )
+
+    async def search_sentences(self, query: str, sentence_types: List[str] = None,
+                               top_k: int = 10, as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
+        """
+        Search within generated sentences across different node types.
+        The per-kind searches run concurrently. as_results returns a SearchResults instead of
+        raw dicts, as in search.
+        """
+        if not sentence_types:
+            sentence_types = ["entity", "edge_sentence"]
+
+        return _merge_by_score(await asyncio.gather(*[
+            self.search(
+                query=query,
+                search_modality="node_vec",
+                node_kind=sentence_type,
+                has_sentence=True,
+                top_k=top_k,
+                include_graph_context=True
+            )
+            for sentence_type in sentence_types
+        ]), top_k, self._client.config.json_codec if as_results else None)
+
+    async def search_from_anchors(self, anchors: List[Dict[str, Any]], query: str, max_hops: int = 2, **kwargs) -> List[Dict[str, Any]]:
+        """Search entities within k-hops of specified anchor points."""
+        kwargs.setdefault('search_modality', 'node_vec')  # Force graph search
+        return await self.search(
+            query=query,
+            known_anchors=anchors,
+            anchor_max_hops=max_hops,
+            **kwargs
+        )
+
+    async def search_from_element(self, element_id: str, query: str, max_hops: int = 2, **kwargs) -> List[Dict[str, Any]]:
+        """Search entities connected to a specific element ID."""
+        return await self.search_from_anchors(
+            anchors=[{"id": element_id}],
+            query=query,
+            max_hops=max_hops,
+            **kwargs
+        )
+
+    async def search_from_phone(self, phone: str, query: str = "related entities", **kwargs) -> List[Dict[str, Any]]:
+        """Search entities connected to a phone number."""
+        return await self.search_from_anchors(
+            anchors=[{"value": phone, "type": "PhoneType"}],
+            query=query,
+            **kwargs
+        )
+
+    async def search_from_email(self, email: str, query: str = "related entities", **kwargs) -> List[Dict[str, Any]]:
+        """Search entities connected to an email address."""
+        return await self.search_from_anchors(
+            anchors=[{"value": email, "type": "EmailType"}],
+            query=query,
+            **kwargs
+        )
+
+    def traverse(self, seeds: Iterable[Union[str, Dict[str, Any]]], query: str = "related entities",
+                 max_depth: int = 2, **options: Any) -> AsyncGraphTraversal:
+        """Breadth-first, multi-hop exploration from many seeds (use with async for); see SyncEnvironment.traverse."""
+        return AsyncGraphTraversal(self, seeds, query, max_depth=max_depth, **options)
+
+    async def search_many(self, queries: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Union[List[Dict[str, Any]], Exception]]:
+        """
+        Runs several searches concurrently, with at most max_concurrency in flight.
+        See SyncEnvironment.search_many; results and per-query exceptions come back in input order.
+        """
+        return await gather_bounded(lambda query: self.search(**query), queries, max_concurrency=max_concurrency)
+
+    async def map_concurrent(self, method: Union[str, Callable[..., Any]], inputs: Iterable[Any], max_concurrency: int = 8,
+                             timeout: float = None, return_exceptions: bool = True) -> List[Any]:
+        """
+        Runs a method (or any sync or async callable) over many inputs with at most max_concurrency
+        in flight; see SyncEnvironment.map_concurrent. On timeout the unfinished calls are cancelled.
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+
+        async def call(item):
+            result = _call_with(func, item)
+            return await result if inspect.isawaitable(result) else result
+
+        return await gather_until(call, inputs, max_concurrency=max_concurrency, timeout=timeout,
+                                  return_exceptions=return_exceptions)
+
+    async def hybrid_search(self, query: str, top_k: int = 10,
+                            modalities: Sequence[Union[str, Dict[str, Any]]] = DEFAULT_HYBRID_MODALITIES,
+                            fusion: str = "rrf", rrf_k: int = 60, weights: Dict[str, float] = None,
+                            rerank: Union[bool, Callable[[str, Sequence[Dict[str, Any]]], Sequence[float]]] = False,
+                            rerank_weight: float = 0.3, candidates: int = None, as_results: bool = False,
+                            **filters: Any) -> Union[List[Dict[str, Any]], SearchResults]:
+        """Runs several search modalities concurrently and fuses the results; see SyncEnvironment.hybrid_search."""
+        names, queries = _hybrid_queries(query, candidates or top_k * 2, modalities, filters)
+        responses = await self.search_many(queries, max_concurrency=len(queries))
+        hits = _fuse_hybrid(query, names, responses, top_k, fusion, rrf_k, weights, rerank, rerank_weight)
+        return SearchResults(hits, codec=self._client.config.json_codec) if as_results else hits
+
+    async def fetch_graph_nodes(self, node_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch nodes from Neo4j graph by their node IDs."""
+        payload = {
+            "node_ids": node_ids,
+            "environment_id": self.id
+        }
+
+        response_data = await self._client._request("POST", "/fetch-graph-nodes", json_data=payload)
+        return response_data.get("results", [])
+
+    @property
+    def node_loader(self) -> AsyncNodeLoader:
+        """Batching, caching loader in front of fetch_graph_nodes; see SyncEnvironment.node_loader."""
+        loaders = self._client._node_loaders
+        loader = loaders.get(self.id)
+        if loader is None:
+            loader = loaders.setdefault(self.id, AsyncNodeLoader(self.fetch_graph_nodes))
+        return loader
+
+    async def load_nodes(self, node_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Fetches graph nodes through node_loader, coalescing concurrent calls from several tasks."""
+        return await self.node_loader.load_many(node_ids)
+
+    async def extract_items(self, schema: Union[str, Type["BaseModel"]], source_id: str = None, page_idx: str = None):
+        """Extracts entities from a schema/label."""
+        payload = _build_extract_items_payload(self.id, schema, source_id=source_id, page_idx=page_idx)
+        response_data = await self._client._request("POST", f"/extract", json_data=payload)
+        return response_data.get("items", [])
+
+    async def extract_literals(self, literal_type: str, mode: str = "literals_only",
+                               source_id: str = None, page_idx: str = None) -> Dict[str, Any]:
+        """Extract literals of a specific type from the graph."""
+        payload = _build_extract_literals_payload(self.id, literal_type, mode, source_id=source_id, page_idx=page_idx)
+        response_data = await self._client._request("POST", "/extract", json_data=payload)
+        return response_data
+
+    def iter_items(self, schema: Union[str, Type["BaseModel"]], source_id: str = None, page_idx: str = None,
+                   page_size: int = 500, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """Streams extracted entities page by page (use with async for); see SyncEnvironment.iter_items."""
+        payload = _build_extract_items_payload(self.id, schema, source_id=source_id, page_idx=page_idx)
+
+        async def fetch_page(offset, limit):
+            response_data = await self._client._request("POST", "/extract", json_data=_paged(payload, offset, limit))
+            return response_data.get("items", [])
+
+        return aiter_pages(fetch_page, page_size, prefetch=prefetch)
+
+    def iter_literals(self, literal_type: str, mode: str = "literals_only", source_id: str = None,
+                      page_idx: str = None, page_size: int = 500, prefetch: bool = True) -> AsyncIterator[Any]:
+        """Streams extracted literals page by page (use with async for)."""
+        payload = _build_extract_literals_payload(self.id, literal_type, mode, source_id=source_id, page_idx=page_idx)
+
+        async def fetch_page(offset, limit):
+            return _extracted_list(await self._client._request("POST", "/extract", json_data=_paged(payload, offset, limit)))
+
+        return aiter_pages(fetch_page, page_size, prefetch=prefetch)
+
+    async def export_snapshot(self, path: str, schemas: Sequence[Union[str, Type["BaseModel"]]] = (),
+                              literal_types: Sequence[str] = (), literal_mode: str = "literals_only",
+                              page_size: int = 500) -> LocalEnvironment:
+        """Exports entities and literals into a local snapshot file; see SyncEnvironment.export_snapshot."""
+        with _snapshot_writer(self, path, schemas, literal_types, literal_mode) as writer:
+            _record_export_sources(writer, [source async for source in self.iter_sources()])
+            for schema in schemas:
+                await _awrite_pages(self.iter_items(schema, page_size=page_size),
+                                    lambda page: writer.add_items(schema, page), page_size)
+            for literal_type in literal_types:
+                await _awrite_pages(self.iter_literals(literal_type, literal_mode, page_size=page_size),
+                                    lambda page: writer.add_literals(literal_type, literal_mode, page), page_size)
+        return LocalEnvironment(path)
+
+    async def sync_snapshot(self, path: str, schemas: Sequence[Union[str, Type["BaseModel"]]] = (),
+                            literal_types: Sequence[str] = (), literal_mode: str = "literals_only",
+                            page_size: int = 500, max_concurrency: int = 4, remove_deleted: bool = True) -> Dict[str, Any]:
+        """Brings a snapshot up to date, fetching only new or changed sources; see SyncEnvironment.sync_snapshot."""
+        if not os.path.exists(path):
+            return _full_export_report(await self.export_snapshot(path, schemas, literal_types, literal_mode, page_size))
+
+        report = _empty_sync_report()
+        writer, all_schemas, all_literals, new_schemas, new_literals = _open_sync_writer(self, path, schemas, literal_types, literal_mode)
+        with writer:
+            for schema in new_schemas:
+                report["items"] += await _awrite_pages(self.iter_items(schema, page_size=page_size),
+                                                       lambda page: writer.add_items(schema, page), page_size)
+            for literal_type, mode in new_literals:
+                report["literals"] += await _awrite_pages(self.iter_literals(literal_type, mode, page_size=page_size),
+                                                          lambda page: writer.add_literals(literal_type, mode, page), page_size)
+
+            sources = [source async for source in self.iter_sources()]
+            known = writer.known_sources()
+            to_fetch, removed = _plan_sync(known, sources)
+
+            async def fetch_source(source):
+                items = [(schema, [item async for item in self.iter_items(schema, source_id=source.id, page_size=page_size, prefetch=False)])
+                         for schema in all_schemas]
+                literals = [((literal_type, mode), [record async for record in self.iter_literals(literal_type, mode, source_id=source.id, page_size=page_size, prefetch=False)])
+                            for literal_type, mode in all_literals]
+                return items, literals
+
+            synced = set()
+            index = 0
+            async for contents in aiter_concurrently(fetch_source, to_fetch, max_concurrency=max_concurrency):
+                if _apply_source_contents(writer, to_fetch[index], contents, report):
+                    synced.add(to_fetch[index].id)
+                index += 1
+            return _finish_sync(writer, known, sources, to_fetch, synced, removed if remove_deleted else [], report)
+
+    async def add_conversation(self, messages: List[Union["Message", Dict[str, str]]], name: str=None, description: str=None) -> AsyncSource:
+        """Adds a conversation source."""
+        payload = _build_conversation_payload(messages, name=name, description=description)
+        response_data = await self._client._request("POST", f"/sources", params={"type": "conversation", "environment_id": self.id}, json_data=payload)
+        self._client._invalidate_cache(self.id)
+        return AsyncSource(client=self._client, **response_data)
+
+    async def add_file(self, path: str, name: str=None, description: str=None,
+                       progress: Callable[[int, int], None]=None, retry_upload: bool=False,
+                       timeout: float=None) -> AsyncSource:
+        """Adds a file source, streamed from disk in chunks. See SyncEnvironment.add_file."""
+        name, content_type = _resolve_file_upload(path, name)
+        upload_timeout = self._client.config.upload_timeouts
+        if timeout is not None:
+            upload_timeout = httpx.Timeout(timeout, connect=upload_timeout.connect, pool=upload_timeout.pool)
+
+        try:
+            with open(path, 'rb') as f:
+                files = {'file': (name, _UploadReader(f, progress), content_type)}
+                form_data = {"type": "file", "name": name, "description": description}
+                response_data = await self._client._request(
+                    "POST", f"sources", params={"environment_id": self.id}, data=form_data, files=files,
+                    timeout=upload_timeout, retryable=retry_upload or None
+                )
+            self._client._invalidate_cache(self.id)
+            return AsyncSource(client=self._client, **response_data)
+        except FileNotFoundError:
+            raise ValueError(f"File not found: {path}")
+        except APIError:
+            raise
+        except Exception as e:
+            raise APIError(status_code=0, message=f"Async file upload failed: {str(e)}") from e
+
+    async def add_files(self, paths: Union[str, List[str]], description: str=None, max_concurrency: int=4,
+                        recursive: bool=False, progress: Callable[[str, int, int], None]=None,
+                        retry_upload: bool=False, timeout: float=None) -> Dict[str, Union[AsyncSource, Exception]]:
+        """
+        Uploads many files concurrently, at most max_concurrency at a time.
+        See SyncEnvironment.add_files for how paths are expanded and results reported.
+        """
+        expanded = _expand_source_paths(paths, recursive=recursive)
+
+        def upload(path):
+            file_progress = functools.partial(progress, path) if progress is not None else None
+            return self.add_file(path, description=description, progress=file_progress,
+                                 retry_upload=retry_upload, timeout=timeout)
+
+        results = await gather_bounded(upload, expanded, max_concurrency=max_concurrency)
+        return dict(zip(expanded, results))
+
+    async def add_business_data(self, data: Dict[str, Any], name: str=None, description: str=None,
+                                root_entity_type: str="schema:Thing", metadata: Dict[str, Any]=None,
+                                processing_config: Dict[str, Any]=None) -> AsyncSource:
+        """Adds business data source with enhanced JSON processing."""
+        payload = _build_business_data_payload(
+            data, name=name, description=description, root_entity_type=root_entity_type,
+            metadata=metadata, processing_config=processing_config
+        )
+
+        response_data = await self._client._request("POST", f"/sources", params={"environment_id": self.id}, json_data=payload)
+        self._client._invalidate_cache(self.id)
+        return AsyncSource(client=self._client, **response_data)
+
+    async def add_business_data_chunked(self, records: Iterable[Any], name: str=None, description: str=None,
+                                        root_entity_type: str="schema:Thing", metadata: Dict[str, Any]=None,
+                                        processing_config: Dict[str, Any]=None, max_batch_bytes: int=4 * 1024 * 1024,
+                                        max_concurrency: int=4) -> List[Union[AsyncSource, Exception]]:
+        """Adds business data as size-bounded batches. See SyncEnvironment.add_business_data_chunked."""
+        batch_id = str(uuid.uuid4())
+        encode = self._client.config.json_codec.encode
+
+        async def upload(indexed_batch):
+            index, batch = indexed_batch
+            if isinstance(batch, Exception):
+                raise batch
+            payload = {
+                "name": _batch_name(name, index),
+                "description": description,
+                "root_entity_type": root_entity_type,
+                "metadata": {**(metadata or {}), "batch_id": batch_id, "batch_index": index},
+                "processing_config": processing_config or {}
+            }
+            response_data = await self._client._request(
+                "POST", f"/sources", params={"environment_id": self.id},
+                content=_json_object_with_raw(payload, {"data": _json_array(batch)}, encode)
+            )
+            return AsyncSource(client=self._client, **response_data)
+
+        batches = enumerate(_iter_encoded_batches(records, encode, max_batch_bytes))
+        try:
+            results = [result async for result in aiter_concurrently(upload, batches, max_concurrency=max_concurrency)]
+        finally:
+            self._client._invalidate_cache(self.id)
+        return results
+
+    async def add_conversation_chunked(self, messages: Iterable[Union["Message", Dict[str, str]]], name: str=None,
+                                       description: str=None, max_batch_bytes: int=4 * 1024 * 1024,
+                                       max_concurrency: int=4) -> List[Union[AsyncSource, Exception]]:
+        """Adds a long conversation as size-bounded sources. See SyncEnvironment.add_conversation_chunked."""
+        encode = self._client.config.json_codec.encode
+
+        async def upload(indexed_batch):
+            index, batch = indexed_batch
+            if isinstance(batch, Exception):
+                raise batch
+            payload = {"description": description}
+            if name:
+                payload["name"] = _batch_name(name, index)
+            response_data = await self._client._request(
+                "POST", f"/sources", params={"type": "conversation", "environment_id": self.id},
+                content=_json_object_with_raw(payload, {"messages": _json_array(batch)}, encode)
+            )
+            return AsyncSource(client=self._client, **response_data)
+
+        batches = enumerate(_iter_encoded_batches(messages, lambda message: encode(_message_dict(message)), max_batch_bytes))
+        try:
+            results = [result async for result in aiter_concurrently(upload, batches, max_concurrency=max_concurrency)]
+        finally:
+            self._client._invalidate_cache(self.id)
+        if not results:
+            raise ValueError("Messages must be a non-empty iterable")
+        return results
+
+    async def add_networkx_graph(self, graph, name: str=None, description: str=None,
+                                 metadata: Dict[str, Any]=None, processing_config: Dict[str, Any]=None) -> AsyncSource:
+        """Adds a NetworkX graph as a source for processing."""
+        payload = _build_networkx_graph_payload(
+            graph, name=name, description=description, metadata=metadata, processing_config=processing_config
+        )
+
+        response_data = await self._client._request(
+            "POST",
+            f"/sources",
+            params={"environment_id": self.id, "type": "networkx_graph"},
+            json_data=payload
+        )
+        self._client._invalidate_cache(self.id)
+        return AsyncSource(client=self._client, **response_data)
+
+    async def add_graph_chunked(self, edges: Iterable[Tuple]=None, nodes: Iterable[Any]=None, name: str=None,
+                                description: str=None, metadata: Dict[str, Any]=None,
+                                processing_config: Dict[str, Any]=None, directed: bool=True, multigraph: bool=True,
+                                graph_attrs: Dict[str, Any]=None, wire_format: str="node_link",
+                                max_batch_bytes: int=4 * 1024 * 1024, max_concurrency: int=4) -> List[Union[AsyncSource, Exception]]:
+        """Adds a large graph as size-bounded batches. See SyncEnvironment.add_graph_chunked."""
+        encoder = _GraphEncoder(self._client.config.json_codec.encode, wire_format=wire_format, directed=directed, multigraph=multigraph)
+        batch_id = str(uuid.uuid4())
+
+        async def upload(indexed_batch):
+            index, graph_document = indexed_batch
+            if isinstance(graph_document, Exception):
+                raise graph_document
+            payload = {
+                "name": _batch_name(name, index),
+                "description": description,
+                "metadata": {**(metadata or {}), "batch_id": batch_id, "batch_index": index},
+                "processing_config": processing_config or {}
+            }
+            response_data = await self._client._request(
+                "POST", f"/sources", params={"environment_id": self.id, "type": "networkx_graph"},
+                content=_json_object_with_raw(payload, {"graph_data": graph_document}, encoder.encode)
+            )
+            return AsyncSource(client=self._client, **response_data)
+
+        batches = enumerate(_iter_graph_batches(encoder, nodes, edges, max_batch_bytes, graph_attrs))
+        try:
+            results = [result async for result in aiter_concurrently(upload, batches, max_concurrency=max_concurrency)]
+        finally:
+            self._client._invalidate_cache(self.id)
+        return results
+
+    async def add_networkx_graph_chunked(self, graph, name: str=None, description: str=None,
+                                         metadata: Dict[str, Any]=None, processing_config: Dict[str, Any]=None,
+                                         wire_format: str="node_link", max_batch_bytes: int=4 * 1024 * 1024,
+                                         max_concurrency: int=4) -> List[Union[AsyncSource, Exception]]:
+        """Streaming counterpart of add_networkx_graph. See SyncEnvironment.add_networkx_graph_chunked."""
+        _check_networkx_graph(graph)
+        edges = graph.edges(keys=True, data=True) if graph.is_multigraph() else graph.edges(data=True)
+        return await self.add_graph_chunked(
+            edges=edges, nodes=graph.nodes(data=True), name=name, description=description,
+            metadata=metadata, processing_config=processing_config, directed=graph.is_directed(),
+            multigraph=graph.is_multigraph(), graph_attrs=dict(graph.graph), wire_format=wire_format,
+            max_batch_bytes=max_batch_bytes, max_concurrency=max_concurrency
+        )
+
+    async def get_sources(self) -> List[AsyncSource]:
+        """Gets all sources for the environment."""
+        response_data = await self._client._request("GET", f"/sources", params={"environment_id": self.id})
+        return [AsyncSource(client=self._client, **source) for source in response_data]
+
+    async def iter_sources(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[AsyncSource]:
+        """Streams the environment's sources page by page."""
+        async def fetch_page(offset, limit):
+            return await self._client._request("GET", "/sources", params=_paged({"environment_id": self.id}, offset, limit))
+
+        async for source in aiter_pages(fetch_page, page_size, prefetch=prefetch):
+            yield AsyncSource(client=self._client, **source)
+
+    async def wait_for_sources(self, sources: List[AsyncSource], timeout: float = 3600.0, poll_interval: float = 2.0,
+                               max_poll_interval: float = 30.0, backoff: float = 1.5) -> AsyncIterator[AsyncSource]:
+        """
+        Waits for many sources with one listing per tick, yielding each as soon as it finishes.
+        See SyncEnvironment.wait_for_sources.
+        """
+        pending = {source.id: source for source in sources}
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        while pending:
+            listing = await self._client._request("GET", f"/sources", params={"environment_id": self.id})
+            statuses = {entry.get("id"): entry.get("status", "unknown") for entry in listing}
+
+            finished = []
+            for source_id, source in pending.items():
+                if source_id in statuses:
+                    source.status = statuses[source_id]
+                if is_terminal_status(source.status):
+                    finished.append(source_id)
+            for source_id in finished:
+                yield pending.pop(source_id)
+
+            if not pending:
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{len(pending)} source(s) still processing after {timeout}s: {', '.join(pending)}")
+            interval = poll_interval if finished else min(interval * backoff, max_poll_interval)
+            await asyncio.sleep(_sleep_time(interval, deadline))
+
+    async def get_source(self, id: str=None, name: str=None) -> AsyncSource:
+        """Gets a source for the environment."""
+        if id is None and name is None:
+            raise ValueError("Either id or name must be provided")
+
+        if id:
+            response_data = await self._client._request("GET", f"/sources", params={"environment_id": self.id, "id": id})
+        else:
+            response_data = await self._client._request("GET", f"/sources", params={"environment_id": self.id, "name": name})
+
+        return AsyncSource(client=self._client, **response_data)
@@ -0,0 +1,184 @@
+import re
+import json
+import math
+from typing import Dict, Any, Callable, List, Optional, Sequence
+
+from .search import hit_node_id
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_TOKEN = re.compile(r"\w+")
+
+# Named modalities for hybrid_search, as search() keyword arguments.
+HYBRID_MODALITIES: Dict[str, Dict[str, Any]] = {
+    "fast": {"search_modality": "fast"},
+    "graph": {"search_modality": "node_vec", "include_graph_context": True},
+    "entities": {"search_modality": "node_vec", "node_kind": "entity", "has_sentence": True},
+    "edge_sentences": {"search_modality": "node_vec", "node_kind": "edge_sentence", "has_sentence": True},
+    "vec_edge": {"search_modality": "vec_edge"},
+    "types": {"search_modality": "type_vec"},
+}
+
+DEFAULT_HYBRID_MODALITIES = ("fast", "graph", "entities", "edge_sentences")
+
+
+def _hit_key(hit: Dict[str, Any]) -> str:
+    """Dedupe key: the node id, else the sentence, else the encoded data."""
+    node_id = hit_node_id(hit)
+    if node_id is not None:
+        return f"id:{node_id}"
+    sentence = hit.get("sentence")
+    if sentence:
+        return f"sentence:{sentence}"
+    return "data:" + json.dumps(hit.get("data"), sort_keys=True, default=str)
+
+
+def hit_text(hit: Dict[str, Any]) -> str:
+    """Text a local reranker scores a hit on: its sentence, else its data's label/name, else the data itself."""
+    sentence = hit.get("sentence")
+    if sentence:
+        return sentence
+    data = hit.get("data")
+    if isinstance(data, dict):
+        label = data.get("label") or data.get("name")
+        if label:
+            return str(label)
+    return json.dumps(data, default=str) if data is not None else ""
+
+
+def _minmax(scores: List[float]) -> List[float]:
+    low, high = min(scores), max(scores)
+    if high == low:
+        return [1.0] * len(scores)
+    return [(score - low) / (high - low) for score in scores]
+
+
+def fuse_results(result_lists: Dict[str, List[Dict[str, Any]]], top_k: int = 10, method: str = "rrf",
+                 rrf_k: int = 60, weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+    """
+    Merges ranked hit lists from different modalities into one list, deduplicated by node id.
+
+    Raw scores are not comparable across modalities, so they are never compared directly:
+    "rrf" sums weight / (rrf_k + rank) over the lists a hit appears in (reciprocal-rank fusion),
+    and "minmax" sums each list's scores rescaled to [0, 1]. Every fused hit is a copy of its
+    best-ranked occurrence with score set to the fused score and modality_scores holding the
+    original score per modality.
+    """
+    if method not in ("rrf", "minmax"):
+        raise ValueError("method must be 'rrf' or 'minmax'")
+    weights = weights or {}
+
+    fused: Dict[str, Dict[str, Any]] = {}
+    best_rank: Dict[str, int] = {}
+    for modality, hits in result_lists.items():
+        if not hits:
+            continue
+        weight = weights.get(modality, 1.0)
+        if method == "rrf":
+            contributions = [weight / (rrf_k + rank) for rank in range(1, len(hits) + 1)]
+        else:
+            contributions = [weight * score for score in _minmax([hit.get("score", 0.0) for hit in hits])]
+
+        seen = set()
+        for rank, (hit, contribution) in enumerate(zip(hits, contributions)):
+            key = _hit_key(hit)
+            if key in seen:
+                continue
+            seen.add(key)
+            entry = fused.get(key)
+            if entry is None:
+                entry = fused[key] = {**hit, "score": 0.0, "modality_scores": {}}
+                best_rank[key] = rank
+            elif rank < best_rank[key]:
+                # Keep the payload of the best-ranked occurrence (e.g. the one with graph context).
+                entry.update({k: v for k, v in hit.items() if k != "score"})
+                best_rank[key] = rank
+            entry["score"] += contribution
+            entry["modality_scores"][modality] = hit.get("score", 0.0)
+
+    ranked = sorted(fused.values(), key=lambda entry: entry["score"], reverse=True)
+    return ranked[:top_k]
+
+
+class LexicalReranker:
+    """
+    Local reranker scoring hits by BM25 over the query terms, computed on the candidate set.
+
+    Scoring is vectorized with NumPy when it is installed and falls back to pure Python
+    (same scores) otherwise. Any callable (query, hits) -> scores can be used in its place,
+    e.g. a cross-encoder or an embedding similarity.
+    """
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def __repr__(self) -> str:
+        return f"<LexicalReranker k1={self.k1} b={self.b} numpy={np is not None}>"
+
+    def __call__(self, query: str, hits: Sequence[Dict[str, Any]]) -> List[float]:
+        terms = sorted(set(_TOKEN.findall(query.lower())))
+        if not hits or not terms:
+            return [0.0] * len(hits)
+        column = {term: j for j, term in enumerate(terms)}
+        counts = []
+        lengths = []
+        for hit in hits:
+            tokens = _TOKEN.findall(hit_text(hit).lower())
+            lengths.append(len(tokens))
+            row = [0] * len(terms)
+            for token in tokens:
+                j = column.get(token)
+                if j is not None:
+                    row[j] += 1
+            counts.append(row)
+
+        if np is not None:
+            return self._score_numpy(np.asarray(counts, dtype=float), np.asarray(lengths, dtype=float))
+        return self._score_python(counts, lengths)
+
+    def _score_numpy(self, tf, lengths) -> List[float]:
+        n = tf.shape[0]
+        df = (tf > 0).sum(axis=0)
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+        norm = self.k1 * (1 - self.b + self.b * lengths / max(lengths.mean(), 1.0))
+        return ((tf * (self.k1 + 1) / (tf + norm[:, None])) * idf).sum(axis=1).tolist()
+
+    def _score_python(self, counts: List[List[int]], lengths: List[int]) -> List[float]:
+        n = len(counts)
+        average = max(sum(lengths) / n, 1.0)
+        idf = []
+        for j in range(len(counts[0])):
+            df = sum(1 for row in counts if row[j])
+            idf.append(math.log1p((n - df + 0.5) / (df + 0.5)))
+        scores = []
+        for row, length in zip(counts, lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / average)
+            scores.append(sum(w * tf * (self.k1 + 1) / (tf + norm) for w, tf in zip(idf, row)))
+        return scores
+
+
+def rerank_hits(query: str, hits: List[Dict[str, Any]], reranker: Callable[[str, Sequence[Dict[str, Any]]], Sequence[float]],
+                weight: float = 0.3) -> List[Dict[str, Any]]:
+    """
+    Re-sorts fused hits by (1 - weight) * fused score + weight * reranker score, both rescaled
+    to [0, 1] over the candidates. The fused score stays in fused_score.
+    """
+    if not hits:
+        return hits
+    local = list(reranker(query, hits))
+    if len(local) != len(hits):
+        raise ValueError("reranker must return one score per hit")
+    fused = [hit["score"] for hit in hits]
+    if np is not None:
+        blended = ((1 - weight) * np.asarray(_minmax(fused)) + weight * np.asarray(_minmax(local))).tolist()
+    else:
+        blended = [(1 - weight) * f + weight * r for f, r in zip(_minmax(fused), _minmax(local))]
+
+    for hit, fused_score, score in zip(hits, fused, blended):
+        hit["fused_score"] = fused_score
+        hit["score"] = score
+    hits.sort(key=lambda hit: hit["score"], reverse=True)
+    return hits
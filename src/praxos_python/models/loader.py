@@ -0,0 +1,258 @@
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Any, Awaitable, Callable, Iterable, List, Optional
+
+from ..utils import run_concurrently, gather_bounded
+from .search import hit_node_id
+
+def _chunks(ids: List[str], size: int) -> List[List[str]]:
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+def _index_nodes(chunk: List[str], nodes: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Maps the requested ids of a chunk to the returned nodes; ids the server did not return are absent."""
+    by_id = {}
+    for node in nodes:
+        node_id = hit_node_id(node)
+        if node_id is not None:
+            by_id[str(node_id)] = node
+    return {node_id: by_id[node_id] for node_id in chunk if node_id in by_id}
+
+def _resolve_chunk(cache: "_NodeCache", generation: int, chunk: List[str], nodes: Any, futures: Dict[str, Any]) -> None:
+    """Settles the futures of one fetched chunk (nodes is the fetch result or its exception) and caches the nodes."""
+    if isinstance(nodes, BaseException):
+        for node_id in chunk:
+            futures[node_id].set_exception(nodes)
+        return
+    fetched = _index_nodes(chunk, nodes)
+    cache.put_many(fetched, generation)
+    for node_id in chunk:
+        futures[node_id].set_result(fetched.get(node_id))
+
+
+class _NodeCache:
+    """Thread-safe LRU of fetched nodes with a generation counter bumped on clear()."""
+    def __init__(self, max_entries: int):
+        if max_entries < 0:
+            raise ValueError("cache_size must be non-negative")
+        self.max_entries = max_entries
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._nodes: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get(self, node_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            node = self._nodes.get(node_id)
+            if node is None:
+                self.misses += 1
+                return None
+            self._nodes.move_to_end(node_id)
+            self.hits += 1
+            return node
+
+    def put_many(self, nodes: Dict[str, Dict[str, Any]], generation: Optional[int] = None) -> None:
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            for node_id, node in nodes.items():
+                self._nodes[node_id] = node
+                self._nodes.move_to_end(node_id)
+            while len(self._nodes) > self.max_entries:
+                self._nodes.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._nodes.clear()
+
+
+class NodeLoader:
+    """
+    DataLoader-style batching front end for fetch_graph_nodes.
+
+    Ids requested from any thread within batch_window seconds of each other are coalesced into one
+    dispatch, deduplicated against each other, the in-flight requests and an LRU cache of fetched
+    nodes, and sent in chunks of at most max_batch_size ids with up to max_concurrency chunks in
+    parallel. Returned nodes are shared with the cache and should be treated as read-only.
+    """
+    def __init__(self, fetch_chunk: Callable[[List[str]], List[Dict[str, Any]]], batch_window: float = 0.002,
+                 max_batch_size: int = 200, max_concurrency: int = 4, cache_size: int = 10000):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.fetch_chunk = fetch_chunk
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.requests = 0
+
+        self._cache = _NodeCache(cache_size)
+        self._lock = threading.Lock()
+        self._queue: Dict[str, Future] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._dispatch_scheduled = False
+
+    def __repr__(self) -> str:
+        return f"<NodeLoader cached={len(self._cache)} requests={self.requests}>"
+
+    def load(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Returns one node, or None if the server does not know the id."""
+        return self.load_many([node_id])[0]
+
+    def load_many(self, node_ids: Iterable[str]) -> List[Optional[Dict[str, Any]]]:
+        """Returns the nodes for node_ids in the same order, with None for unknown ids."""
+        node_ids = [str(node_id) for node_id in node_ids]
+        found = {}
+        waiting = {}
+        with self._lock:
+            for node_id in dict.fromkeys(node_ids):
+                node = self._cache.get(node_id)
+                if node is not None:
+                    found[node_id] = node
+                elif node_id in self._in_flight:
+                    waiting[node_id] = self._in_flight[node_id]
+                else:
+                    future = self._in_flight[node_id] = self._queue[node_id] = Future()
+                    waiting[node_id] = future
+            lead = bool(self._queue) and not self._dispatch_scheduled
+            if lead:
+                self._dispatch_scheduled = True
+
+        # The caller that opened the batch waits out the window, then dispatches for everyone.
+        if lead:
+            if self.batch_window > 0:
+                time.sleep(self.batch_window)
+            self._dispatch()
+
+        for node_id, future in waiting.items():
+            found[node_id] = future.result()
+        return [found.get(node_id) for node_id in node_ids]
+
+    def prime(self, nodes: Iterable[Dict[str, Any]]) -> None:
+        """Adds already known nodes (e.g. from search hits) to the cache."""
+        self._cache.put_many({str(hit_node_id(node)): node for node in nodes if hit_node_id(node) is not None})
+
+    def clear(self) -> None:
+        """Drops all cached nodes; called when the environment receives new data."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self._cache.hits, "misses": self._cache.misses, "requests": self.requests, "entries": len(self._cache)}
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            batch, self._queue = self._queue, {}
+            self._dispatch_scheduled = False
+        if not batch:
+            return
+
+        generation = self._cache.generation
+        chunks = _chunks(list(batch), self.max_batch_size)
+        with self._lock:
+            self.requests += len(chunks)
+        try:
+            results = run_concurrently(self.fetch_chunk, chunks, max_workers=self.max_concurrency)
+            for chunk, nodes in zip(chunks, results):
+                _resolve_chunk(self._cache, generation, chunk, nodes, batch)
+        except BaseException as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                for node_id in batch:
+                    self._in_flight.pop(node_id, None)
+
+
+class AsyncNodeLoader:
+    """Async counterpart of NodeLoader; coalesces load_many calls made from concurrent tasks."""
+    def __init__(self, fetch_chunk: Callable[[List[str]], Awaitable[List[Dict[str, Any]]]], batch_window: float = 0.002,
+                 max_batch_size: int = 200, max_concurrency: int = 4, cache_size: int = 10000):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.fetch_chunk = fetch_chunk
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.requests = 0
+
+        self._cache = _NodeCache(cache_size)
+        self._queue: Dict[str, asyncio.Future] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._dispatch_scheduled = False
+        self._dispatch_task = None
+
+    def __repr__(self) -> str:
+        return f"<AsyncNodeLoader cached={len(self._cache)} requests={self.requests}>"
+
+    async def load(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Returns one node, or None if the server does not know the id."""
+        return (await self.load_many([node_id]))[0]
+
+    async def load_many(self, node_ids: Iterable[str]) -> List[Optional[Dict[str, Any]]]:
+        """Returns the nodes for node_ids in the same order, with None for unknown ids."""
+        node_ids = [str(node_id) for node_id in node_ids]
+        loop = asyncio.get_running_loop()
+        found = {}
+        waiting = {}
+        for node_id in dict.fromkeys(node_ids):
+            node = self._cache.get(node_id)
+            if node is not None:
+                found[node_id] = node
+            elif node_id in self._in_flight:
+                waiting[node_id] = self._in_flight[node_id]
+            else:
+                future = self._in_flight[node_id] = self._queue[node_id] = loop.create_future()
+                waiting[node_id] = future
+
+        # The batch is dispatched by its own task, so cancelling any one caller cannot strand the others.
+        if self._queue and not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_later(self.batch_window, self._start_dispatch)
+
+        for node_id, future in waiting.items():
+            found[node_id] = await future
+        return [found.get(node_id) for node_id in node_ids]
+
+    def prime(self, nodes: Iterable[Dict[str, Any]]) -> None:
+        """Adds already known nodes (e.g. from search hits) to the cache."""
+        self._cache.put_many({str(hit_node_id(node)): node for node in nodes if hit_node_id(node) is not None})
+
+    def clear(self) -> None:
+        """Drops all cached nodes; called when the environment receives new data."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self._cache.hits, "misses": self._cache.misses, "requests": self.requests, "entries": len(self._cache)}
+
+    def _start_dispatch(self) -> None:
+        self._dispatch_task = asyncio.ensure_future(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        batch, self._queue = self._queue, {}
+        self._dispatch_scheduled = False
+        if not batch:
+            return
+
+        generation = self._cache.generation
+        chunks = _chunks(list(batch), self.max_batch_size)
+        self.requests += len(chunks)
+        try:
+            results = await gather_bounded(self.fetch_chunk, chunks, max_concurrency=self.max_concurrency)
+            for chunk, nodes in zip(chunks, results):
+                _resolve_chunk(self._cache, generation, chunk, nodes, batch)
+        except BaseException:
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+            raise
+        finally:
+            for node_id in batch:
+                self._in_flight.pop(node_id, None)
@@ -0,0 +1,475 @@
+import os
+import re
+import json
+import time
+import hashlib
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Type, Union, TYPE_CHECKING
+
+from .search import SearchResults, hit_node_id
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+SNAPSHOT_FORMAT = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY, schema TEXT NOT NULL, key TEXT NOT NULL, node_id TEXT, type TEXT,
+    label TEXT, label_norm TEXT, page_idx TEXT, created_at TEXT, text TEXT, data TEXT NOT NULL,
+    UNIQUE (schema, key)
+);
+CREATE INDEX IF NOT EXISTS items_type ON items (type);
+CREATE INDEX IF NOT EXISTS items_label ON items (label_norm);
+CREATE INDEX IF NOT EXISTS items_node ON items (node_id);
+CREATE TABLE IF NOT EXISTS literals (
+    id INTEGER PRIMARY KEY, literal_type TEXT NOT NULL, mode TEXT NOT NULL, key TEXT NOT NULL, value TEXT,
+    value_norm TEXT, node_id TEXT, page_idx TEXT, created_at TEXT, data TEXT NOT NULL,
+    UNIQUE (literal_type, mode, key)
+);
+CREATE INDEX IF NOT EXISTS literals_value ON literals (value_norm, literal_type);
+CREATE TABLE IF NOT EXISTS sources (id TEXT PRIMARY KEY, created_at TEXT, status TEXT, synced INTEGER NOT NULL DEFAULT 0);
+CREATE TABLE IF NOT EXISTS item_sources (
+    item_id INTEGER NOT NULL, source_id TEXT NOT NULL, PRIMARY KEY (item_id, source_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS item_sources_source ON item_sources (source_id, item_id);
+CREATE TABLE IF NOT EXISTS literal_sources (
+    literal_id INTEGER NOT NULL, source_id TEXT NOT NULL, PRIMARY KEY (literal_id, source_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS literal_sources_source ON literal_sources (source_id, literal_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5 (label, text, content='items', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS items_fts_insert AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts (rowid, label, text) VALUES (new.id, new.label, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS items_fts_delete AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, label, text) VALUES ('delete', old.id, old.label, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS items_fts_update AFTER UPDATE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, label, text) VALUES ('delete', old.id, old.label, old.text);
+    INSERT INTO items_fts (rowid, label, text) VALUES (new.id, new.label, new.text);
+END;
+"""
+
+_UPSERT_ITEM = """
+INSERT INTO items (schema, key, node_id, type, label, label_norm, page_idx, created_at, text, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (schema, key) DO UPDATE SET node_id = excluded.node_id, type = excluded.type, label = excluded.label,
+    label_norm = excluded.label_norm, page_idx = excluded.page_idx,
+    created_at = excluded.created_at, text = excluded.text, data = excluded.data
+"""
+
+_UPSERT_LITERAL = """
+INSERT INTO literals (literal_type, mode, key, value, value_norm, node_id, page_idx, created_at, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (literal_type, mode, key) DO UPDATE SET value = excluded.value, value_norm = excluded.value_norm,
+    node_id = excluded.node_id, page_idx = excluded.page_idx,
+    created_at = excluded.created_at, data = excluded.data
+"""
+
+# A record can come from several sources; each upsert links it to the source it was written for.
+# Rows are linked by their unique key: (schema, key) for items, (literal_type, mode, key) for literals.
+_LINK_ITEM = "INSERT OR IGNORE INTO item_sources (item_id, source_id) SELECT id, ? FROM items WHERE schema = ? AND key = ?"
+_LINK_LITERAL = """
+INSERT OR IGNORE INTO literal_sources (literal_id, source_id)
+SELECT id, ? FROM literals WHERE literal_type = ? AND mode = ? AND key = ?
+"""
+
+# Per record table: delete the records linked to a source and to no other, then the source's links.
+_DETACH = (
+    ("""DELETE FROM items WHERE id IN (
+        SELECT item_id FROM item_sources AS link WHERE link.source_id = ? AND NOT EXISTS (
+            SELECT 1 FROM item_sources AS other WHERE other.item_id = link.item_id AND other.source_id != link.source_id))""",
+     "DELETE FROM item_sources WHERE source_id = ?"),
+    ("""DELETE FROM literals WHERE id IN (
+        SELECT literal_id FROM literal_sources AS link WHERE link.source_id = ? AND NOT EXISTS (
+            SELECT 1 FROM literal_sources AS other WHERE other.literal_id = link.literal_id AND other.source_id != link.source_id))""",
+     "DELETE FROM literal_sources WHERE source_id = ?"),
+)
+
+_SPACE = re.compile(r"\s+")
+_TERM = re.compile(r"\w+")
+
+
+def normalize_label(value: Any) -> Optional[str]:
+    """Case- and whitespace-insensitive form used by the label and literal indexes."""
+    if value is None:
+        return None
+    return _SPACE.sub(" ", str(value)).strip().casefold()
+
+
+def _encode(record: Any) -> str:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _record_key(record: Any, encoded: str) -> str:
+    """Stable identity of an exported record: its node id, else a digest of its content."""
+    node_id = hit_node_id(record) if isinstance(record, dict) else None
+    return f"id:{node_id}" if node_id is not None else "sha1:" + hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def _field(record: Any, *names: str) -> Any:
+    if not isinstance(record, dict):
+        return None
+    for name in names:
+        value = record.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def _scalars(value: Any, out: List[str], depth: int = 0) -> None:
+    if isinstance(value, str):
+        out.append(value)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        out.append(str(value))
+    elif isinstance(value, dict) and depth < 3:
+        for nested in value.values():
+            _scalars(nested, out, depth + 1)
+    elif isinstance(value, list) and depth < 3:
+        for nested in value:
+            _scalars(nested, out, depth + 1)
+
+
+def _item_text(item: Dict[str, Any]) -> str:
+    """Full-text body of an entity: its sentence plus every string/number value in it."""
+    parts: List[str] = []
+    _scalars({k: v for k, v in item.items() if k not in ("id", "node_id", "created_at")}, parts)
+    return " ".join(parts)
+
+
+def _item_row(schema: str, item: Dict[str, Any], source_id: str = None) -> Tuple[Tuple, Optional[str]]:
+    """The items row of an entity, and the source to link it to."""
+    encoded = _encode(item)
+    label = _field(item, "label", "name")
+    return (
+        schema, _record_key(item, encoded), hit_node_id(item), _field(item, "type", "node_type"),
+        label, normalize_label(label), _field(item, "page_idx"), _field(item, "created_at"), _item_text(item), encoded,
+    ), _field(item, "source_id") or source_id
+
+
+def _literal_row(literal_type: str, mode: str, record: Any, source_id: str = None) -> Tuple[Tuple, Optional[str]]:
+    """The literals row of a record, and the source to link it to."""
+    encoded = _encode(record)
+    value = record if not isinstance(record, (dict, list)) else _field(record, "value", "literal", "label", "name")
+    return (
+        literal_type, mode, _record_key(record, encoded), None if value is None else str(value),
+        normalize_label(value), hit_node_id(record) if isinstance(record, dict) else None,
+        _field(record, "page_idx"), _field(record, "created_at"), encoded,
+    ), _field(record, "source_id") or source_id
+
+
+def _schema_name(schema: Union[str, Type["BaseModel"]]) -> str:
+    return schema if isinstance(schema, str) else schema.__name__
+
+
+class SnapshotWriter:
+    """
+    Writes extracted entities and literals into a snapshot file.
+
+    New snapshots are built in a temporary file and moved into place by close(), so readers
+    never see a half-written snapshot; with replace=False an existing snapshot is updated in
+    place, one transaction per batch. Records are upserted by node id (or content digest),
+    so writing the same record twice keeps a single copy; every source a record was written for
+    is linked to it, and it is only removed once no linked source remains.
+    """
+    def __init__(self, path: str, environment: Dict[str, Any] = None, replace: bool = True, batch_size: int = 1000):
+        import sqlite3
+
+        self.path = path
+        self.batch_size = batch_size
+        self.counts: Dict[str, int] = {}
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._target = f"{path}.tmp-{os.getpid()}" if replace else path
+        if replace and os.path.exists(self._target):
+            os.remove(self._target)
+
+        self._replace = replace
+        self._connection = sqlite3.connect(self._target, timeout=30.0)
+        if replace:
+            # Nothing reads the temporary file until it is complete, so skip journaling and fsyncs.
+            self._connection.execute("PRAGMA journal_mode = OFF")
+            self._connection.execute("PRAGMA synchronous = OFF")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            self.set_meta("format", SNAPSHOT_FORMAT)
+            for key, value in (environment or {}).items():
+                self.set_meta(f"environment.{key}", value)
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def set_meta(self, key: str, value: Any) -> None:
+        with self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value, default=str)))
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def _write(self, sql: str, link_sql: str, key_size: int, rows: Iterable[Tuple[Tuple, Optional[str]]], counter: str) -> int:
+        written = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._flush(sql, link_sql, key_size, batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            self._flush(sql, link_sql, key_size, batch)
+            written += len(batch)
+        self.counts[counter] = self.counts.get(counter, 0) + written
+        return written
+
+    def _flush(self, sql: str, link_sql: str, key_size: int, batch: List[Tuple[Tuple, Optional[str]]]) -> None:
+        # Upserts and source links of a batch are committed together.
+        links = [(source_id, *row[:key_size]) for row, source_id in batch if source_id is not None]
+        with self._connection:
+            self._connection.executemany(sql, [row for row, _ in batch])
+            if links:
+                self._connection.executemany(link_sql, links)
+
+    def add_items(self, schema: Union[str, Type["BaseModel"]], items: Iterable[Dict[str, Any]], source_id: str = None) -> int:
+        """
+        Upserts extracted entities of a schema; returns how many were written. Each item is
+        linked to its own source_id, else to source_id (e.g. when they were extracted per source).
+        """
+        name = _schema_name(schema)
+        return self._write(_UPSERT_ITEM, _LINK_ITEM, 2, (_item_row(name, item, source_id) for item in items),
+                           f"items:{name}")
+
+    def add_literals(self, literal_type: str, mode: str, records: Iterable[Any], source_id: str = None) -> int:
+        """Upserts extracted literals (or full entities, in that mode); returns how many were written."""
+        return self._write(_UPSERT_LITERAL, _LINK_LITERAL, 3,
+                           (_literal_row(literal_type, mode, record, source_id) for record in records),
+                           f"literals:{literal_type}:{mode}")
+
+    def known_sources(self) -> Dict[str, Tuple[Optional[str], Optional[str], bool]]:
+        """Recorded sources: id -> (created_at, status, whether their contents were synced)."""
+        return {source_id: (created_at, status, bool(synced)) for source_id, created_at, status, synced
+                in self._connection.execute("SELECT id, created_at, status, synced FROM sources")}
+
+    def set_sources(self, rows: Iterable[Tuple[str, Optional[str], Optional[str], bool]]) -> None:
+        """Records sources as (id, created_at, status, synced)."""
+        with self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO sources (id, created_at, status, synced) VALUES (?, ?, ?, ?)",
+                                         [(source_id, created_at, status, int(synced)) for source_id, created_at, status, synced in rows])
+
+    def _detach(self, source_id: str) -> int:
+        removed = 0
+        for delete_records, delete_links in _DETACH:
+            removed += self._connection.execute(delete_records, (source_id,)).rowcount
+            self._connection.execute(delete_links, (source_id,))
+        return removed
+
+    def detach_source(self, source_id: str) -> int:
+        """
+        Unlinks every record from a source, deleting those no other source is linked to (before
+        re-writing a changed source); returns how many records were deleted.
+        """
+        with self._connection:
+            return self._detach(source_id)
+
+    def remove_source(self, source_id: str) -> int:
+        """
+        Drops a deleted source and the records only it contained; records other sources also
+        contain are kept. Returns how many records were removed.
+        """
+        with self._connection:
+            removed = self._detach(source_id)
+            self._connection.execute("DELETE FROM sources WHERE id = ?", (source_id,))
+        return removed
+
+    def close(self) -> None:
+        if not self._replace:
+            self._connection.close()
+            return
+        self.set_meta("exported_at", time.time())
+        with self._connection:
+            # Merging the full-text index is proportional to its size, so only new snapshots get it.
+            self._connection.execute("INSERT INTO items_fts (items_fts) VALUES ('optimize')")
+        self._connection.execute("PRAGMA journal_mode = DELETE")
+        self._connection.close()
+        os.replace(self._target, self.path)
+
+    def abort(self) -> None:
+        self._connection.close()
+        if self._target != self.path and os.path.exists(self._target):
+            os.remove(self._target)
+
+
+class LocalEnvironment:
+    """
+    Offline, read-only view of an environment snapshot written by Environment.export_snapshot.
+
+    Offers the same search_entities / extract_items / extract_literals method shapes as
+    SyncEnvironment, answered from indexes in the snapshot (entity type, normalized label,
+    literal value and a full-text index) without any API call. The file is memory-mapped, and
+    the instance can be shared between threads.
+
+    Args:
+        path: Snapshot file
+        mmap_size: Bytes of the file to memory-map (0 disables mmap)
+    """
+    def __init__(self, path: str, mmap_size: int = 1 << 30):
+        import sqlite3
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self._connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._connection.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        self._connection.execute("PRAGMA query_only = ON")
+
+        meta = dict(self._connection.execute("SELECT key, value FROM meta").fetchall())
+        self.meta = {key: json.loads(value) for key, value in meta.items()}
+        if self.meta.get("format", SNAPSHOT_FORMAT) > SNAPSHOT_FORMAT:
+            raise ValueError(f"Snapshot format {self.meta['format']} is newer than this SDK supports")
+        self.id = self.meta.get("environment.id")
+        self.name = self.meta.get("environment.name")
+        self.created_at = self.meta.get("environment.created_at")
+        self.description = self.meta.get("environment.description")
+        self.exported_at = self.meta.get("exported_at")
+        self.synced_at = self.meta.get("sync.synced_at", self.exported_at)
+
+    def __repr__(self) -> str:
+        return f"<LocalEnvironment id='{self.id}' name='{self.name}' path='{self.path}'>"
+
+    def __enter__(self) -> "LocalEnvironment":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _rows(self, sql: str, params: Tuple = (), size: int = 500) -> Iterator[Tuple]:
+        cursor = self._connection.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(size)
+            if not rows:
+                return
+            yield from rows
+
+    def _filters(self, table: str, clauses: List[str], params: List[Any], source_id: str = None, page_idx: str = None) -> None:
+        if source_id:
+            link_table, link_column = ("item_sources", "item_id") if table == "items" else ("literal_sources", "literal_id")
+            clauses.append(f"id IN (SELECT {link_column} FROM {link_table} WHERE source_id = ?)")
+            params.append(source_id)
+        if page_idx:
+            clauses.append("page_idx = ?")
+            params.append(str(page_idx))
+
+    def stats(self) -> Dict[str, Any]:
+        """Record counts per schema and per literal type/mode."""
+        return {
+            "items": dict(self._connection.execute("SELECT schema, COUNT(*) FROM items GROUP BY schema").fetchall()),
+            "literals": {f"{literal_type}:{mode}": count for literal_type, mode, count in self._connection.execute(
+                "SELECT literal_type, mode, COUNT(*) FROM literals GROUP BY literal_type, mode").fetchall()},
+            "sources": self._connection.execute("SELECT COUNT(*) FROM sources").fetchone()[0],
+            "exported_at": self.exported_at,
+            "synced_at": self.meta.get("sync.synced_at"),
+        }
+
+    def extract_items(self, schema: Union[str, Type["BaseModel"]], source_id: str = None, page_idx: str = None) -> List[Dict[str, Any]]:
+        """Exported entities of a schema/label, in export order."""
+        return list(self.iter_items(schema, source_id=source_id, page_idx=page_idx))
+
+    def iter_items(self, schema: Union[str, Type["BaseModel"]], source_id: str = None, page_idx: str = None,
+                   page_size: int = 500, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """Streams exported entities of a schema/label; see SyncEnvironment.iter_items."""
+        clauses, params = ["schema = ?"], [_schema_name(schema)]
+        self._filters("items", clauses, params, source_id, page_idx)
+        sql = f"SELECT data FROM items WHERE {' AND '.join(clauses)} ORDER BY id"
+        return (json.loads(data) for (data,) in self._rows(sql, tuple(params), page_size))
+
+    def extract_literals(self, literal_type: str, mode: str = "literals_only",
+                         source_id: str = None, page_idx: str = None) -> Dict[str, Any]:
+        """
+        Exported literals of a type, shaped like the API response: records are under "literals"
+        (literals_only) or "entities" (full_entities).
+        """
+        key = "entities" if mode == "full_entities" else "literals"
+        return {key: list(self.iter_literals(literal_type, mode, source_id=source_id, page_idx=page_idx))}
+
+    def iter_literals(self, literal_type: str, mode: str = "literals_only", source_id: str = None,
+                      page_idx: str = None, page_size: int = 500, prefetch: bool = True) -> Iterator[Any]:
+        """Streams exported literals of a type; see SyncEnvironment.iter_literals."""
+        if mode not in ["literals_only", "full_entities"]:
+            raise ValueError("mode must be 'literals_only' or 'full_entities'")
+        clauses, params = ["literal_type = ?", "mode = ?"], [literal_type, mode]
+        self._filters("literals", clauses, params, source_id, page_idx)
+        sql = f"SELECT data FROM literals WHERE {' AND '.join(clauses)} ORDER BY id"
+        return (json.loads(data) for (data,) in self._rows(sql, tuple(params), page_size))
+
+    def find_by_label(self, label: str, types: List[str] = None) -> List[Dict[str, Any]]:
+        """Entities whose label matches exactly, ignoring case and whitespace, optionally of given types."""
+        clauses, params = ["label_norm = ?"], [normalize_label(label)]
+        if types:
+            clauses.append(f"(type IN ({','.join('?' * len(types))}) OR schema IN ({','.join('?' * len(types))}))")
+            params.extend(types)
+            params.extend(types)
+        sql = f"SELECT data FROM items WHERE {' AND '.join(clauses)} ORDER BY id"
+        return [json.loads(data) for (data,) in self._rows(sql, tuple(params))]
+
+    def find_literal(self, value: str, literal_type: str = None) -> List[Any]:
+        """Literal records whose value matches exactly, ignoring case and whitespace."""
+        clauses, params = ["value_norm = ?"], [normalize_label(value)]
+        if literal_type:
+            clauses.append("literal_type = ?")
+            params.append(literal_type)
+        sql = f"SELECT data FROM literals WHERE {' AND '.join(clauses)} ORDER BY id"
+        return [json.loads(data) for (data,) in self._rows(sql, tuple(params))]
+
+    def get_nodes(self, node_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Exported entities by node id, in the given order; unknown ids are skipped."""
+        node_ids = list(node_ids)
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(node_ids), 500):
+            chunk = node_ids[start:start + 500]
+            for node_id, data in self._connection.execute(
+                    f"SELECT node_id, data FROM items WHERE node_id IN ({','.join('?' * len(chunk))})", chunk):
+                found.setdefault(node_id, json.loads(data))
+        return [found[node_id] for node_id in node_ids if node_id in found]
+
+    def search_entities(self, query: str, entity_types: List[str] = None, top_k: int = 10,
+                        include_temporal: bool = False, as_results: bool = False) -> Union[List[Dict[str, Any]], SearchResults]:
+        """
+        Full-text (BM25) search over exported entities, optionally restricted to entity types.
+
+        Same shape as SyncEnvironment.search_entities; hits carry score, node_id, sentence (when
+        the entity has one) and data. Scores are lexical, so they are not comparable with API scores.
+        include_temporal is accepted for compatibility and ignored.
+        """
+        terms = _TERM.findall(query)
+        if not terms:
+            return SearchResults([]) if as_results else []
+        match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        clauses, params = ["items_fts MATCH ?"], [match]
+        if entity_types:
+            placeholders = ",".join("?" * len(entity_types))
+            clauses.append(f"(items.type IN ({placeholders}) OR items.schema IN ({placeholders}))")
+            params.extend(entity_types)
+            params.extend(entity_types)
+        sql = (
+            "SELECT items.node_id, items.data, bm25(items_fts, 4.0, 1.0) AS rank FROM items_fts "
+            f"JOIN items ON items.id = items_fts.rowid WHERE {' AND '.join(clauses)} ORDER BY rank LIMIT ?"
+        )
+        params.append(top_k)
+
+        hits = []
+        for node_id, data, rank in self._connection.execute(sql, params):
+            item = json.loads(data)
+            hit = {"score": -rank, "node_id": node_id, "data": item}
+            if isinstance(item, dict) and item.get("sentence"):
+                hit["sentence"] = item["sentence"]
+            hits.append(hit)
+        return SearchResults(hits) if as_results else hits
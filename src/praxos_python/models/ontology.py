@@ -17,4 +17,13 @@ class SyncOntology(BaseOntologyAttributes):
         self._client = client
 
     def __repr__(self) -> str:
-        return f"<Ontology id='{self.id}' name='{self.name}'>"
\ No newline at end of file
+        return f"<Ontology id='{self.id}' name='{self.name}'>"
+
+class AsyncOntology(BaseOntologyAttributes):
+    """Represents an Ontology resource owned by an AsyncClient."""
+    def __init__(self, client, id: str, name: str, description: str, **data: Any):
+        super().__init__(id=id, name=name, description=description, **data)
+        self._client = client
+
+    def __repr__(self) -> str:
+        return f"<AsyncOntology id='{self.id}' name='{self.name}'>"
@@ -0,0 +1,136 @@
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union
+
+from ..codec import JSONCodec, get_json_codec
+
+_MISSING = object()
+
+def hit_node_id(hit: Dict[str, Any]) -> Optional[str]:
+    """Best-effort node id of a raw search hit: its own id/node_id, else the id inside its data."""
+    node_id = hit.get("node_id") or hit.get("id")
+    if node_id is None:
+        data = hit.get("data")
+        if isinstance(data, dict):
+            node_id = data.get("node_id") or data.get("id")
+    return node_id
+
+def _compact(value: Any, codec: JSONCodec) -> Any:
+    if isinstance(value, (dict, list)):
+        return codec.encode(value)
+    return value
+
+class SearchHit(Mapping):
+    """
+    A single search hit.
+
+    Scalar fields are available as attributes (score, id, sentence). With compact=True the nested
+    data and graph_context payloads, already decoded from the response, are re-encoded to compact
+    JSON bytes on construction and decoded again on first access, with the given JSONCodec (by
+    default the fastest installed one). That costs one encode per hit up front and one decode per
+    accessed payload, in exchange for holding bytes instead of object trees, which pays off for
+    large result sets that are kept around and mostly accessed through scores, ids and sentences.
+    compact=False keeps the payloads as decoded. SearchHit is a read-only Mapping with the same
+    keys as the raw hit, so hit["score"] and hit.get("data") keep working.
+    """
+    __slots__ = ("score", "id", "_fields", "_data", "_graph_context", "_codec")
+
+    def __init__(self, hit: Dict[str, Any], compact: bool = True, codec: Optional[JSONCodec] = None):
+        fields = dict(hit)
+        data = fields.pop("data", _MISSING)
+        graph_context = fields.pop("graph_context", _MISSING)
+
+        self.score = fields.get("score", 0.0)
+        self.id = hit_node_id(hit)
+        self._fields = fields
+        if compact:
+            codec = codec or get_json_codec()
+            data = _compact(data, codec)
+            graph_context = _compact(graph_context, codec)
+        self._codec = codec
+        self._data = data
+        self._graph_context = graph_context
+
+    def __repr__(self) -> str:
+        return f"<SearchHit id={self.id!r} score={self.score}>"
+
+    @property
+    def sentence(self) -> Optional[str]:
+        return self._fields.get("sentence")
+
+    @property
+    def data(self) -> Any:
+        if isinstance(self._data, bytes):
+            self._data = self._codec.decode(self._data)
+        return None if self._data is _MISSING else self._data
+
+    @property
+    def graph_context(self) -> Any:
+        if isinstance(self._graph_context, bytes):
+            self._graph_context = self._codec.decode(self._graph_context)
+        return None if self._graph_context is _MISSING else self._graph_context
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "data" and self._data is not _MISSING:
+            return self.data
+        if key == "graph_context" and self._graph_context is not _MISSING:
+            return self.graph_context
+        return self._fields[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._fields
+        if self._data is not _MISSING:
+            yield "data"
+        if self._graph_context is not _MISSING:
+            yield "graph_context"
+
+    def __len__(self) -> int:
+        return len(self._fields) + (self._data is not _MISSING) + (self._graph_context is not _MISSING)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the hit as a plain dict, as search() returns it by default."""
+        return dict(self.items())
+
+class SearchResults(Sequence):
+    """
+    An ordered, read-only list of SearchHit objects with columnar accessors.
+
+    scores is an array('d'), ids and sentences are plain lists; to_dicts() converts back to the
+    list-of-dicts shape that search() returns without as_results=True.
+    """
+    __slots__ = ("_hits", "_scores")
+
+    def __init__(self, hits: Iterable[Union[Dict[str, Any], SearchHit]] = (), compact: bool = True,
+                 codec: Optional[JSONCodec] = None):
+        if compact and codec is None:
+            codec = get_json_codec()
+        self._hits = [hit if isinstance(hit, SearchHit) else SearchHit(hit, compact=compact, codec=codec) for hit in hits]
+        self._scores = None
+
+    def __repr__(self) -> str:
+        return f"<SearchResults hits={len(self._hits)}>"
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SearchResults(self._hits[index])
+        return self._hits[index]
+
+    def __len__(self) -> int:
+        return len(self._hits)
+
+    @property
+    def scores(self) -> array:
+        if self._scores is None:
+            self._scores = array("d", (float(hit.score or 0.0) for hit in self._hits))
+        return self._scores
+
+    @property
+    def ids(self) -> List[Optional[str]]:
+        return [hit.id for hit in self._hits]
+
+    @property
+    def sentences(self) -> List[Optional[str]]:
+        return [hit.sentence for hit in self._hits]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [hit.to_dict() for hit in self._hits]
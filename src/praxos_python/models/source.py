@@ -1,5 +1,20 @@
+import time
+import asyncio
 from typing import Dict, Any
 
+# Source statuses (compared case-insensitively) after which processing will not progress further.
+SOURCE_READY_STATUSES = frozenset({"completed", "complete", "processed", "ready", "success", "succeeded", "done"})
+SOURCE_FAILED_STATUSES = frozenset({"failed", "failure", "error", "errored", "cancelled", "canceled"})
+
+def is_terminal_status(status: str) -> bool:
+    """Whether a source status is final (ready or failed)."""
+    status = (status or "").lower()
+    return status in SOURCE_READY_STATUSES or status in SOURCE_FAILED_STATUSES
+
+def _sleep_time(interval: float, deadline: float) -> float:
+    """Seconds to sleep before the next poll, never past the deadline."""
+    return max(0.0, min(interval, deadline - time.monotonic()))
+
 class BaseSourceAttributes:
     """
     Base attributes for a Source resource.
@@ -11,6 +26,16 @@ class BaseSourceAttributes:
         self.created_at = created_at
         self._environment_id = environment_id
         self.description = description
+        # Last known processing status; refreshed by get_status() and the wait helpers.
+        self.status = kwargs.get("status", "unknown")
+
+    @property
+    def is_ready(self) -> bool:
+        return (self.status or "").lower() in SOURCE_READY_STATUSES
+
+    @property
+    def is_failed(self) -> bool:
+        return (self.status or "").lower() in SOURCE_FAILED_STATUSES
 
 
 class SyncSource(BaseSourceAttributes):
@@ -26,4 +51,66 @@ class SyncSource(BaseSourceAttributes):
     def get_status(self) -> str:
         """Gets the status of the source."""
         response_data = self._client._request("GET", f"/sources", params={"environment_id": self._environment_id, "id": self.id})
-        return response_data.get("status", "unknown")
\ No newline at end of file
+        self.status = response_data.get("status", "unknown")
+        return self.status
+
+    def wait_until_ready(self, timeout: float = 600.0, poll_interval: float = 1.0,
+                         max_poll_interval: float = 30.0, backoff: float = 1.5) -> str:
+        """
+        Polls the source until processing finishes.
+        
+        The wait between polls starts at poll_interval and grows by backoff up to max_poll_interval,
+        so long-running sources are polled less often.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+            poll_interval: Initial seconds between status checks
+            max_poll_interval: Upper bound on the seconds between status checks
+            backoff: Factor applied to the interval after each check
+        
+        Returns:
+            The final status; check is_ready / is_failed to tell success from failure
+        
+        Raises:
+            TimeoutError: If the source is still processing after timeout seconds
+        """
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            status = self.get_status()
+            if is_terminal_status(status):
+                return status
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Source {self.id} still '{status}' after {timeout}s")
+            time.sleep(_sleep_time(interval, deadline))
+            interval = min(interval * backoff, max_poll_interval)
+
+
+class AsyncSource(BaseSourceAttributes):
+    """Represents an asynchronous Source resource."""
+    def __init__(self, client, id: str, environment_id: str, name: str, created_at: str, description: str, **data: Any):
+        super().__init__(id=id, environment_id=environment_id, name=name, created_at=created_at, description=description, **data)
+        self._client = client
+
+    def __repr__(self) -> str:
+        return f"<AsyncSource id='{self.id}' name='{self.name}'>"
+
+    async def get_status(self) -> str:
+        """Gets the status of the source."""
+        response_data = await self._client._request("GET", f"/sources", params={"environment_id": self._environment_id, "id": self.id})
+        self.status = response_data.get("status", "unknown")
+        return self.status
+
+    async def wait_until_ready(self, timeout: float = 600.0, poll_interval: float = 1.0,
+                               max_poll_interval: float = 30.0, backoff: float = 1.5) -> str:
+        """Polls the source until processing finishes. See SyncSource.wait_until_ready."""
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            status = await self.get_status()
+            if is_terminal_status(status):
+                return status
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Source {self.id} still '{status}' after {timeout}s")
+            await asyncio.sleep(_sleep_time(interval, deadline))
+            interval = min(interval * backoff, max_poll_interval)
@@ -0,0 +1,199 @@
+import time
+from typing import Dict, Any, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Union
+
+from ..utils import iter_concurrently, aiter_concurrently
+from .search import hit_node_id
+
+class TraversalNode:
+    """A node reached by a traversal: its id, hop depth, search score and the raw hit (plus the fetched node, if requested)."""
+    __slots__ = ("id", "depth", "score", "hit", "node")
+
+    def __init__(self, id: str, depth: int, score: float, hit: Dict[str, Any], node: Optional[Dict[str, Any]] = None):
+        self.id = id
+        self.depth = depth
+        self.score = score
+        self.hit = hit
+        self.node = node
+
+    def __repr__(self) -> str:
+        return f"<TraversalNode id={self.id!r} depth={self.depth} score={self.score}>"
+
+
+class _Traversal:
+    """Frontier, visited index and budget bookkeeping shared by the sync and async traversals."""
+    def __init__(self, environment, seeds: Iterable[Union[str, Dict[str, Any]]], query: str, max_depth: int = 2,
+                 hop_top_k: int = 10, max_frontier: int = 100, anchors_per_request: int = 20,
+                 max_nodes: int = 1000, max_requests: int = 100, time_budget: Optional[float] = None,
+                 max_concurrency: int = 4, expand: Optional[Callable[[TraversalNode], bool]] = None,
+                 fetch_nodes: bool = False, **search_kwargs: Any):
+        if max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+        if anchors_per_request < 1:
+            raise ValueError("anchors_per_request must be at least 1")
+
+        self.environment = environment
+        self.query = query
+        self.max_depth = max_depth
+        self.hop_top_k = hop_top_k
+        self.max_frontier = max_frontier
+        self.anchors_per_request = anchors_per_request
+        self.max_nodes = max_nodes
+        self.max_requests = max_requests
+        self.time_budget = time_budget
+        self.max_concurrency = max_concurrency
+        self.expand = expand
+        self.fetch_nodes = fetch_nodes
+        self.search_kwargs = search_kwargs
+
+        # Seeds are anchors (dicts) or bare node ids; seed ids count as visited so they are not re-emitted.
+        self.frontier = [{"id": seed} if isinstance(seed, str) else seed for seed in seeds]
+        self.visited = {str(anchor["id"]) for anchor in self.frontier if anchor.get("id") is not None}
+        self.requests = 0
+        self.depth = 0
+        self.emitted = 0
+        self.stop_reason = None
+        self._deadline = None
+        self._started = None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} depth={self.depth} emitted={self.emitted} requests={self.requests} stop_reason={self.stop_reason}>"
+
+    @property
+    def elapsed(self) -> float:
+        return 0.0 if self._started is None else time.monotonic() - self._started
+
+    def _start(self) -> None:
+        self._started = time.monotonic()
+        if self.time_budget is not None:
+            self._deadline = self._started + self.time_budget
+
+    def _out_of_budget(self) -> bool:
+        """Records and reports an exhausted node or time budget."""
+        if self.stop_reason is None:
+            if self.emitted >= self.max_nodes:
+                self.stop_reason = "max_nodes"
+            elif self._deadline is not None and time.monotonic() >= self._deadline:
+                self.stop_reason = "time_budget"
+        return self.stop_reason is not None
+
+    def _anchor_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        # Pulled lazily by the concurrent runner, so budgets are checked right before each request.
+        # Requests already in flight when the request budget runs out are still consumed.
+        for start in range(0, len(self.frontier), self.anchors_per_request):
+            if self._out_of_budget():
+                return
+            if self.requests >= self.max_requests:
+                self.stop_reason = "max_requests"
+                return
+            self.requests += 1
+            yield self.frontier[start:start + self.anchors_per_request]
+
+    def _search_kwargs(self, anchors: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {"anchors": anchors, "query": self.query, "max_hops": 1, "top_k": self.hop_top_k, **self.search_kwargs}
+
+    def _accept(self, hits: List[Dict[str, Any]]) -> List[TraversalNode]:
+        """Dedupes a batch of hits against the visited index and wraps the new ones."""
+        reached = []
+        for hit in hits:
+            node_id = hit_node_id(hit)
+            if node_id is None:
+                continue
+            node_id = str(node_id)
+            if node_id in self.visited:
+                continue
+            if self.emitted + len(reached) >= self.max_nodes:
+                break
+            self.visited.add(node_id)
+            reached.append(TraversalNode(node_id, self.depth, hit.get("score", 0.0), hit))
+        return reached
+
+    def _next_frontier(self, reached: List[TraversalNode]) -> List[Dict[str, Any]]:
+        expandable = [node for node in reached if self.expand is None or self.expand(node)]
+        expandable.sort(key=lambda node: node.score or 0.0, reverse=True)
+        return [{"id": node.id} for node in expandable[:self.max_frontier]]
+
+
+class GraphTraversal(_Traversal):
+    """
+    Client-side breadth-first traversal built from anchored searches.
+
+    Each hop searches one hop out from the current frontier, anchors_per_request anchors per
+    search_from_anchors call with up to max_concurrency calls in flight. Newly reached nodes are
+    deduplicated against every node seen so far and yielded as soon as their batch returns. The
+    best-scoring max_frontier of them (optionally filtered by expand) seed the next hop. The walk
+    stops at max_depth or when the node, request or time budget runs out; stop_reason says which.
+    Node fetches (fetch_nodes=True) count towards max_requests, but only searches are held back
+    by it, so a finished batch still gets its nodes attached.
+    """
+    def __iter__(self) -> Iterator[TraversalNode]:
+        self._start()
+        environment = self.environment
+        while self.frontier and self.depth < self.max_depth:
+            self.depth += 1
+            next_reached = []
+            batches = iter_concurrently(
+                lambda anchors: environment.search_from_anchors(**self._search_kwargs(anchors)),
+                self._anchor_batches(), max_workers=self.max_concurrency
+            )
+            try:
+                for hits in batches:
+                    if isinstance(hits, Exception):
+                        raise hits
+                    reached = self._accept(hits)
+                    if self.fetch_nodes and reached:
+                        requests_before = environment.node_loader.requests
+                        nodes = environment.load_nodes([node.id for node in reached])
+                        self.requests += environment.node_loader.requests - requests_before
+                        for node, fetched in zip(reached, nodes):
+                            node.node = fetched
+                    for node in reached:
+                        self.emitted += 1
+                        yield node
+                    next_reached.extend(reached)
+                    if self._out_of_budget():
+                        return
+            finally:
+                batches.close()
+            if self.stop_reason is not None:
+                return
+            self.frontier = self._next_frontier(next_reached)
+        if self.stop_reason is None:
+            self.stop_reason = "max_depth" if self.frontier else "exhausted"
+
+
+class AsyncGraphTraversal(_Traversal):
+    """Async counterpart of GraphTraversal; iterate it with async for."""
+    async def __aiter__(self) -> AsyncIterator[TraversalNode]:
+        self._start()
+        environment = self.environment
+        while self.frontier and self.depth < self.max_depth:
+            self.depth += 1
+            next_reached = []
+            batches = aiter_concurrently(
+                lambda anchors: environment.search_from_anchors(**self._search_kwargs(anchors)),
+                self._anchor_batches(), max_concurrency=self.max_concurrency
+            )
+            try:
+                async for hits in batches:
+                    if isinstance(hits, Exception):
+                        raise hits
+                    reached = self._accept(hits)
+                    if self.fetch_nodes and reached:
+                        requests_before = environment.node_loader.requests
+                        nodes = await environment.load_nodes([node.id for node in reached])
+                        self.requests += environment.node_loader.requests - requests_before
+                        for node, fetched in zip(reached, nodes):
+                            node.node = fetched
+                    for node in reached:
+                        self.emitted += 1
+                        yield node
+                    next_reached.extend(reached)
+                    if self._out_of_budget():
+                        return
+            finally:
+                await batches.aclose()
+            if self.stop_reason is not None:
+                return
+            self.frontier = self._next_frontier(next_reached)
+        if self.stop_reason is None:
+            self.stop_reason = "max_depth" if self.frontier else "exhausted"
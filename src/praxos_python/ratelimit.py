@@ -0,0 +1,266 @@
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
+
+import httpx
+
+from .retry import parse_retry_after
+
+# Endpoint classes with separate budgets; anything not listed falls under "default".
+_ENDPOINT_CLASSES = {
+    ("POST", "search"): "search",
+    ("POST", "fetch-graph-nodes"): "search",
+    ("POST", "extract"): "extract",
+    ("POST", "sources"): "upload",
+}
+
+def endpoint_class(method: str, endpoint: str) -> str:
+    """Budget class of a request: "search", "extract", "upload" or "default"."""
+    return _ENDPOINT_CLASSES.get((method.upper(), endpoint.strip('/')), "default")
+
+
+class RateLimit:
+    """
+    Budget for one endpoint class: a token bucket refilled at rate requests/second holding up
+    to burst tokens, and at most max_in_flight concurrent requests.
+
+    When adaptive, the rate starts at rate, grows additively while requests succeed (up to
+    max_rate), and is halved (down to min_rate) on a burst of 429s, as is the in-flight limit.
+    """
+    def __init__(self, rate: float, burst: Optional[int] = None, max_in_flight: int = 8,
+                 max_rate: Optional[float] = None, min_rate: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.max_in_flight = max_in_flight
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+
+    def __repr__(self) -> str:
+        return f"<RateLimit rate={self.rate}/s burst={self.burst} max_in_flight={self.max_in_flight}>"
+
+
+DEFAULT_RATE_LIMITS = {
+    "search": RateLimit(rate=20.0, burst=20, max_in_flight=16),
+    "extract": RateLimit(rate=5.0, burst=5, max_in_flight=4),
+    "upload": RateLimit(rate=2.0, burst=4, max_in_flight=4),
+    "default": RateLimit(rate=10.0, burst=10, max_in_flight=8),
+}
+
+
+class _Budget:
+    """Live state of one endpoint class: token bucket, in-flight slots and adaptive tuning."""
+    def __init__(self, name: str, limit: RateLimit, adaptive: bool):
+        self.name = name
+        self.limit = limit
+        self.adaptive = adaptive
+
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self.rate = limit.rate
+        self.in_flight_limit = limit.max_in_flight
+        self.in_flight = 0
+        self._tokens = float(limit.burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._async_waiters: deque = deque()
+        self._successes = 0
+        self._next_decrease = 0.0
+
+        self.requests = 0
+        self.throttled = 0
+        self.wait_time = 0.0
+
+    # Token bucket. A reservation takes a token now, possibly going negative, and says how long
+    # to wait for it, so no lock is held while callers sleep.
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.limit.burst), self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            self._tokens -= 1.0
+            wait = max(0.0, -self._tokens / self.rate, self._paused_until - now)
+            self.requests += 1
+            self.wait_time += wait
+            return wait
+
+    # In-flight slots, usable from threads and from event loops at the same time. A slot freed
+    # while coroutines wait is handed directly to the oldest one.
+
+    def acquire_slot(self) -> None:
+        with self._lock:
+            while self.in_flight >= self.in_flight_limit:
+                self._slot_freed.wait()
+            self.in_flight += 1
+
+    async def acquire_slot_async(self) -> None:
+        with self._lock:
+            if self.in_flight < self.in_flight_limit and not self._async_waiters:
+                self.in_flight += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+            self._async_waiters.append((loop, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Cancelled just after being handed a slot: give it back.
+                self.release_slot()
+            raise
+
+    def _hand_over(self, waiter: asyncio.Future) -> None:
+        if waiter.cancelled():
+            self.release_slot()
+        else:
+            waiter.set_result(None)
+
+    def release_slot(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        """Gives free slots to waiting coroutines first, then wakes waiting threads. Lock held."""
+        while self._async_waiters and self.in_flight < self.in_flight_limit:
+            loop, waiter = self._async_waiters.popleft()
+            if waiter.cancelled():
+                continue
+            self.in_flight += 1
+            try:
+                loop.call_soon_threadsafe(self._hand_over, waiter)
+            except RuntimeError:
+                # The waiter's loop is closed; nobody will take this slot.
+                self.in_flight -= 1
+        if self.in_flight < self.in_flight_limit:
+            self._slot_freed.notify(self.in_flight_limit - self.in_flight)
+
+    # Adaptive tuning (additive increase, multiplicative decrease).
+
+    def record(self, status_code: int, retry_after: Optional[float]) -> None:
+        if not self.adaptive:
+            return
+        with self._lock:
+            if status_code == 429:
+                now = time.monotonic()
+                self.throttled += 1
+                self._successes = 0
+                if retry_after:
+                    # The server said when it will accept requests again: hold everyone until then.
+                    self._paused_until = max(self._paused_until, now + retry_after)
+                # A burst of requests sent at the old rate all come back 429; back off once per burst.
+                if now >= self._next_decrease:
+                    self._next_decrease = now + max(1.0, retry_after or 0.0)
+                    self.rate = max(self.limit.min_rate, self.rate / 2)
+                    self.in_flight_limit = max(1, self.in_flight_limit // 2)
+                    logging.getLogger(__name__).info(
+                        "PRAXOS-PYTHON: 429 on %s requests, throttling to %.2f req/s and %d in flight",
+                        self.name, self.rate, self.in_flight_limit
+                    )
+            elif status_code and status_code < 400:
+                self._successes += 1
+                # Probe upward gently: about +10% of the configured rate per in-flight-limit successes.
+                if self._successes >= self.in_flight_limit:
+                    self._successes = 0
+                    self.rate = min(self.limit.max_rate, self.rate + self.limit.rate * 0.1)
+                    if self.in_flight_limit < self.limit.max_in_flight:
+                        self.in_flight_limit += 1
+                        self._wake()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self.rate, "in_flight_limit": self.in_flight_limit, "in_flight": self.in_flight,
+                "requests": self.requests, "throttled": self.throttled, "wait_time": self.wait_time,
+            }
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter and concurrency governor.
+
+    Each endpoint class (search, extract, upload and default) has its own token bucket and
+    in-flight limit, so a burst of uploads cannot starve searches. Requests wait for a token and a
+    slot before being sent; retries go through the limiter again. When adaptive, a burst of 429s halves
+    the class's rate and concurrency and a Retry-After pauses the whole class until it expires,
+    instead of every thread hammering the API in turn; successes then raise the rate again. The
+    limiter therefore settles near the highest rate the API sustains.
+
+    One limiter can be shared by many clients and threads (ClientConfig(rate_limit=True) shares
+    one per API key in the process), and by sync and async clients at once.
+
+    Args:
+        limits: RateLimit per endpoint class, overriding DEFAULT_RATE_LIMITS
+        adaptive: Tune rate and concurrency from observed 429/Retry-After responses
+    """
+    def __init__(self, limits: Optional[Dict[str, RateLimit]] = None, adaptive: bool = True):
+        merged = {**DEFAULT_RATE_LIMITS, **(limits or {})}
+        self.adaptive = adaptive
+        self._budgets = {name: _Budget(name, limit, adaptive) for name, limit in merged.items()}
+
+    def __repr__(self) -> str:
+        return f"<RateLimiter classes={sorted(self._budgets)} adaptive={self.adaptive}>"
+
+    def budget(self, method: str, endpoint: str) -> _Budget:
+        name = endpoint_class(method, endpoint)
+        return self._budgets.get(name) or self._budgets["default"]
+
+    def acquire(self, method: str, endpoint: str) -> Tuple[_Budget, float]:
+        """Blocks until the request may be sent; returns its budget (pass it to release) and the time waited."""
+        budget = self.budget(method, endpoint)
+        start = time.perf_counter()
+        budget.acquire_slot()
+        try:
+            wait = budget.reserve()
+            if wait > 0:
+                time.sleep(wait)
+        except BaseException:
+            budget.release_slot()
+            raise
+        return budget, time.perf_counter() - start
+
+    async def acquire_async(self, method: str, endpoint: str) -> Tuple[_Budget, float]:
+        """Async counterpart of acquire."""
+        budget = self.budget(method, endpoint)
+        start = time.perf_counter()
+        await budget.acquire_slot_async()
+        try:
+            wait = budget.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            budget.release_slot()
+            raise
+        return budget, time.perf_counter() - start
+
+    def release(self, budget: _Budget, response: Optional[httpx.Response] = None) -> None:
+        """Frees the request's slot and feeds its outcome (None for a connection error) to adaptive tuning."""
+        budget.release_slot()
+        if response is not None:
+            retry_after = parse_retry_after(response) if response.status_code == 429 else None
+            budget.record(response.status_code, retry_after)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current rate, in-flight limit and counters per endpoint class."""
+        return {name: budget.stats() for name, budget in self._budgets.items()}
+
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(base_url: str, api_key: str) -> RateLimiter:
+    """Returns the process-wide limiter for an API key, shared by every client using it."""
+    key = (str(base_url), hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter()
+        return limiter
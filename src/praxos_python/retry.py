@@ -0,0 +1,174 @@
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import httpx
+
+from .exceptions import CircuitOpenError
+
+class RetryPolicy:
+    """
+    Decides which failed requests are replayed and how long to wait between attempts.
+
+    Only requests that are safe to repeat are retried: idempotent HTTP methods and POSTs to
+    read-only query endpoints (search, extract, graph node fetches). Uploads are never replayed.
+    Waits use exponential backoff with full jitter, or the server's Retry-After when present.
+    """
+    def __init__(
+        self,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 8.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = (429, 502, 503, 504),
+        retry_methods: Iterable[str] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+        retry_post_endpoints: Iterable[str] = ("search", "extract", "fetch-graph-nodes"),
+        respect_retry_after: bool = True,
+        max_retry_after: float = 30.0,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.retry_post_endpoints = frozenset(endpoint.strip('/') for endpoint in retry_post_endpoints)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def __repr__(self) -> str:
+        return f"<RetryPolicy max_retries={self.max_retries} backoff_factor={self.backoff_factor}>"
+
+    def is_retryable_request(self, method: str, endpoint: str) -> bool:
+        """Whether a request may be replayed at all."""
+        method = method.upper()
+        if method in self.retry_methods:
+            return True
+        return method == "POST" and endpoint.strip('/') in self.retry_post_endpoints
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def get_backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait before retry number attempt + 1."""
+        if self.respect_retry_after and response is not None and response.status_code in (429, 503):
+            retry_after = parse_retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Parses a Retry-After header given either in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After failure_threshold consecutive failures (connection errors or 5xx responses) the circuit
+    opens and requests fail fast with CircuitOpenError for recovery_timeout seconds. Then a single
+    trial request is let through; its success closes the circuit, its failure re-opens it.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker state={self.state} failures={self._failures}>"
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def before_request(self, host: str = "") -> bool:
+        """
+        Raises CircuitOpenError if the request must not be sent. Returns True if the request is
+        the half-open trial, which must then end in record_success, record_failure or release_trial.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return False
+            remaining = self.recovery_timeout - (time.monotonic() - self._opened_at)
+            if self._state == self.OPEN and remaining <= 0:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+        raise CircuitOpenError(host=host, retry_in=max(0.0, remaining))
+
+    def release_trial(self) -> None:
+        """Frees the trial slot of a trial request that ended without an outcome (e.g. it was cancelled)."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            # Late failures of requests sent before the circuit opened must not push recovery back.
+            if self._state == self.OPEN:
+                return
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+_breakers: Dict[Tuple[str, int, float], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(host: str, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> CircuitBreaker:
+    """Returns the process-wide breaker for a host, shared by every client talking to it."""
+    key = (host, failure_threshold, recovery_timeout)
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(failure_threshold, recovery_timeout)
+        return breaker
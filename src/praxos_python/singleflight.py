@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+class SingleFlight:
+    """
+    Collapses concurrent identical calls: while a call for a key is running, other threads calling
+    do() with the same key wait for it and receive its result (or exception) instead of repeating it.
+    Nothing is remembered once the call finishes; that is the result cache's job.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, List[Any]] = {}
+        self.shared = 0
+
+    def __repr__(self) -> str:
+        return f"<SingleFlight in_flight={len(self._calls)} shared={self.shared}>"
+
+    def do(self, key: str, func: Callable[[], Any], share: Optional[Callable[[Any], Any]] = None) -> Tuple[Any, bool]:
+        """
+        Returns func()'s result and whether it was shared from another caller's in-flight call.
+
+        When share is given, callers that joined receive share(result) instead of the result
+        itself. It is computed once, before the leading caller gets its result back, so the
+        leader mutating its result cannot race with the joiners (e.g. share=codec.encode, with
+        every joiner decoding its own copy).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call[1] += 1
+                self.shared += 1
+                leader = False
+            else:
+                # [future, number of callers that joined]
+                call = self._calls[key] = [Future(), 0]
+                leader = True
+
+        future = call[0]
+        if not leader:
+            result, shared_value = future.result()
+            return (shared_value if share is not None else result), True
+
+        try:
+            result = func()
+            with self._lock:
+                del self._calls[key]
+            # Nobody can join once the call is removed, so call[1] is final here.
+            shared_value = share(result) if share is not None and call[1] else None
+        except BaseException as e:
+            with self._lock:
+                # share() may fail after the key was freed and taken by a new call.
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            # Joiners wait on the future, so it must be resolved whatever goes wrong.
+            future.set_exception(e)
+            raise
+        future.set_result((result, shared_value))
+        return result, False
+
+
+class AsyncSingleFlight:
+    """Async counterpart of SingleFlight for tasks on one event loop."""
+    def __init__(self):
+        self._calls: Dict[str, List[Any]] = {}
+        self.shared = 0
+
+    def __repr__(self) -> str:
+        return f"<AsyncSingleFlight in_flight={len(self._calls)} shared={self.shared}>"
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]],
+                 share: Optional[Callable[[Any], Any]] = None) -> Tuple[Any, bool]:
+        """Awaits func() once per key at a time; see SingleFlight.do, including share."""
+        call = self._calls.get(key)
+        if call is not None:
+            call[1] += 1
+            self.shared += 1
+            # Shielded, so a cancelled waiter does not cancel the call the others are waiting on.
+            result, shared_value = await asyncio.shield(call[0])
+            return (shared_value if share is not None else result), True
+
+        call = [None, 0]
+
+        async def run():
+            try:
+                result = await func()
+            finally:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            return result, (share(result) if share is not None and call[1] else None)
+
+        call[0] = asyncio.ensure_future(run())
+        self._calls[key] = call
+        result, _ = await asyncio.shield(call[0])
+        return result, False
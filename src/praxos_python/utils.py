@@ -1,5 +1,11 @@
+import json
+import time
+import asyncio
+import logging
 import httpx
-from typing import Dict, Any
+from collections import deque
+from concurrent.futures import ALL_COMPLETED, FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Optional
 from .exceptions import APIError, APIKeyInvalidError
 
 def parse_httpx_error(e: httpx.HTTPStatusError) -> APIError:
@@ -20,13 +26,267 @@ def parse_httpx_error(e: httpx.HTTPStatusError) -> APIError:
     
     return APIError(status_code=e.response.status_code, message=error_message, response_data=response_data)
 
-def handle_response_content(response: httpx.Response) -> Dict[str, Any]:
+def handle_response_content(response: httpx.Response, decode: Optional[Callable[[bytes], Any]] = None) -> Dict[str, Any]:
     """
     Processes httpx.Response content after raise_for_status.
     Assumes response.raise_for_status() has been called.
+    decode parses the body bytes (e.g. a JSONCodec's decode); defaults to response.json().
     """
     if response.status_code == 204: # No Content
         return {}
     if not response.content:
         return {}
-    return response.json()
\ No newline at end of file
+    if decode is not None:
+        return decode(response.content)
+    return response.json()
+
+def run_concurrently(func: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 8) -> List[Any]:
+    """
+    Calls func on every item using a bounded thread pool and returns the results in input order.
+    An exception raised for one item is returned in that item's slot instead of being raised.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    def call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            return e
+
+    if max_workers == 1 or len(items) == 1:
+        return [call(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(call, items))
+
+
+async def gather_bounded(coroutine_func: Callable[[Any], Awaitable[Any]], items: Iterable[Any], max_concurrency: int = 8) -> List[Any]:
+    """
+    Async counterpart of run_concurrently: awaits coroutine_func(item) for every item with at most
+    max_concurrency in flight, returning results (or exceptions) in input order.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(item):
+        async with semaphore:
+            return await coroutine_func(item)
+
+    return await asyncio.gather(*[call(item) for item in items], return_exceptions=True)
+
+
+def map_concurrently(func: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 8,
+                     timeout: Optional[float] = None, return_exceptions: bool = True) -> List[Any]:
+    """
+    Like run_concurrently, with an overall timeout: calls still queued when it expires are
+    cancelled and their slots (and those of calls still running) hold a TimeoutError. Running
+    calls cannot be interrupted; they finish in the background and their results are dropped.
+    With return_exceptions=False the first exception (or the timeout) is raised instead, and
+    the calls that have not started yet are cancelled.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+    try:
+        futures = [executor.submit(func, item) for item in items]
+        pending = futures
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = wait(pending, timeout=remaining, return_when=ALL_COMPLETED if return_exceptions else FIRST_EXCEPTION)
+            if not return_exceptions:
+                for future in done:
+                    if future.exception() is not None:
+                        raise future.exception()
+            if pending and deadline is not None and time.monotonic() >= deadline:
+                if not return_exceptions:
+                    raise TimeoutError(f"{len(pending)} of {len(items)} calls did not finish within {timeout}s")
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return [
+        _result_or_exception(future) if future.done() and not future.cancelled()
+        else TimeoutError(f"Call did not finish within {timeout}s")
+        for future in futures
+    ]
+
+
+async def gather_until(coroutine_func: Callable[[Any], Awaitable[Any]], items: Iterable[Any], max_concurrency: int = 8,
+                       timeout: Optional[float] = None, return_exceptions: bool = True) -> List[Any]:
+    """
+    Async counterpart of map_concurrently. On timeout the unfinished calls are cancelled
+    (coroutines, unlike threads, can be), and their slots hold a TimeoutError.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(item):
+        async with semaphore:
+            return await coroutine_func(item)
+
+    tasks = [asyncio.ensure_future(call(item)) for item in items]
+    if not tasks:
+        return []
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=timeout,
+                                           return_when=asyncio.ALL_COMPLETED if return_exceptions else asyncio.FIRST_EXCEPTION)
+        if not return_exceptions:
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+            if pending:
+                raise TimeoutError(f"{len(pending)} of {len(tasks)} calls did not finish within {timeout}s")
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        # Let cancelled calls unwind (closing their responses) before returning.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return [
+        TimeoutError(f"Call did not finish within {timeout}s") if task.cancelled()
+        else (task.exception() or task.result())
+        for task in tasks
+    ]
+
+
+def _result_or_exception(future: Future) -> Any:
+    try:
+        return future.result()
+    except Exception as e:
+        return e
+
+
+def iter_concurrently(func: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 4) -> Iterator[Any]:
+    """
+    Streaming variant of run_concurrently: pulls items lazily and keeps at most max_workers calls
+    in flight, yielding results (or the exception raised for an item) in input order. The input is
+    never materialized, so memory stays bounded for very large iterables and generators.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    in_flight = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in items:
+            if len(in_flight) >= max_workers:
+                yield _result_or_exception(in_flight.popleft())
+            in_flight.append(executor.submit(func, item))
+        while in_flight:
+            yield _result_or_exception(in_flight.popleft())
+
+
+async def aiter_concurrently(coroutine_func: Callable[[Any], Awaitable[Any]], items: Iterable[Any], max_concurrency: int = 4) -> AsyncIterator[Any]:
+    """Async counterpart of iter_concurrently."""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    async def call(item):
+        try:
+            return await coroutine_func(item)
+        except Exception as e:
+            return e
+
+    in_flight = deque()
+    try:
+        for item in items:
+            if len(in_flight) >= max_concurrency:
+                yield await in_flight.popleft()
+            in_flight.append(asyncio.ensure_future(call(item)))
+        while in_flight:
+            yield await in_flight.popleft()
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+def _page_status(page: List[Any], previous_page: List[Any], page_size: int) -> str:
+    """
+    Classifies a fetched page as "more" (full, keep paging), "last" (short page) or "repeat".
+    A page longer than page_size, or one that repeats the previous page, means the server ignored
+    limit/offset and already returned everything it will return.
+    """
+    if previous_page and page and page[0] == previous_page[0]:
+        return "repeat"
+    if len(page) > page_size:
+        logging.getLogger(__name__).warning("PRAXOS-PYTHON: server returned %d items for page_size=%d, pagination unsupported", len(page), page_size)
+    return "more" if len(page) == page_size else "last"
+
+
+def iter_pages(fetch_page: Callable[[int, int], List[Any]], page_size: int, prefetch: bool = True) -> Iterator[Any]:
+    """
+    Yields the items of a paginated listing. fetch_page(offset, limit) returns one page; with
+    prefetch the next page is requested on a background thread while the current one is consumed,
+    so at most two pages are held in memory.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        offset = 0
+        previous_page = []
+        page = fetch_page(offset, page_size)
+        while True:
+            status = _page_status(page, previous_page, page_size)
+            if status == "repeat":
+                return
+            if status == "last":
+                yield from page
+                return
+            offset += page_size
+            next_page = executor.submit(fetch_page, offset, page_size) if executor else None
+            yield from page
+            previous_page = page
+            page = next_page.result() if next_page else fetch_page(offset, page_size)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_pages(fetch_page: Callable[[int, int], Awaitable[List[Any]]], page_size: int, prefetch: bool = True) -> AsyncIterator[Any]:
+    """Async counterpart of iter_pages; the next page is prefetched as a task."""
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    next_page = None
+    try:
+        offset = 0
+        previous_page = []
+        page = await fetch_page(offset, page_size)
+        while True:
+            status = _page_status(page, previous_page, page_size)
+            if status == "repeat":
+                return
+            if status == "last":
+                for item in page:
+                    yield item
+                return
+            offset += page_size
+            next_page = asyncio.ensure_future(fetch_page(offset, page_size)) if prefetch else None
+            for item in page:
+                yield item
+            previous_page = page
+            page = await next_page if next_page else await fetch_page(offset, page_size)
+            next_page = None
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+def iter_json_lines(path: str) -> Iterator[Any]:
+    """Yields the records of a JSON Lines file one at a time, skipping blank lines."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
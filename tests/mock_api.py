@@ -0,0 +1,26 @@
+"""Clients wired to an in-process mock API: handler(request) -> httpx.Response, sync or async."""
+import httpx
+
+from praxos_python import SyncClient, AsyncClient, SyncEnvironment, AsyncEnvironment
+
+BASE_URL = "http://praxos.mock/"
+
+
+def sync_client(handler, **kwargs) -> SyncClient:
+    client = SyncClient("test-key", base_url=BASE_URL, transport=httpx.MockTransport(handler), lazy_validation=True, **kwargs)
+    client._needs_validation = False
+    return client
+
+
+def async_client(handler, **kwargs) -> AsyncClient:
+    client = AsyncClient("test-key", base_url=BASE_URL, transport=httpx.MockTransport(handler), **kwargs)
+    client._needs_validation = False
+    return client
+
+
+def sync_environment(handler, **kwargs) -> SyncEnvironment:
+    return SyncEnvironment(sync_client(handler, **kwargs), id="env", name="env", created_at=None, description=None)
+
+
+def async_environment(handler, **kwargs) -> AsyncEnvironment:
+    return AsyncEnvironment(async_client(handler, **kwargs), id="env", name="env", created_at=None, description=None)
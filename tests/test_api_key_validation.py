@@ -0,0 +1,76 @@
+import time
+import uuid
+import threading
+
+import httpx
+import pytest
+
+from praxos_python import SyncClient, APIKeyInvalidError, RetryPolicy
+from mock_api import BASE_URL
+
+
+class ValidatingAPI:
+    """Mock API whose key check is slow; records whether each request arrived after it passed."""
+    def __init__(self, valid: bool = True):
+        self.valid = valid
+        self.validations = 0
+        self.validated = False
+        self.unvalidated_requests = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api-token-validataion":
+            with self._lock:
+                self.validations += 1
+            time.sleep(0.05)
+            if not self.valid:
+                return httpx.Response(401, json={"message": "invalid key"})
+            self.validated = True
+            return httpx.Response(200, json={})
+        with self._lock:
+            if not self.validated:
+                self.unvalidated_requests += 1
+        return httpx.Response(200, json={"id": "env", "name": "env", "created_at": None, "description": None})
+
+
+def make_client(api: ValidatingAPI) -> SyncClient:
+    # A fresh key per client, as validated keys are remembered for the whole process.
+    return SyncClient(f"key-{uuid.uuid4()}", base_url=BASE_URL, transport=httpx.MockTransport(api),
+                      retry_policy=RetryPolicy(max_retries=0), lazy_validation=True)
+
+
+def test_concurrent_first_requests_wait_for_validation():
+    api = ValidatingAPI()
+    client = make_client(api)
+    threads = [threading.Thread(target=client.get_environment, kwargs={"id": "env"}) for _ in range(8)]
+    with client:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert api.validations == 1
+    assert api.unvalidated_requests == 0
+    assert not client._needs_validation
+
+
+def test_a_rejected_key_stays_unvalidated():
+    api = ValidatingAPI(valid=False)
+    client = make_client(api)
+    with client:
+        with pytest.raises(APIKeyInvalidError):
+            client.get_environment(id="env")
+        assert client._needs_validation and not client.config.is_api_key_validated()
+        with pytest.raises(APIKeyInvalidError):
+            client.get_environment(id="env")
+    assert api.validations == 2 and api.unvalidated_requests == 0
+
+
+def test_validated_keys_are_trusted_by_later_clients():
+    api = ValidatingAPI()
+    client = make_client(api)
+    with client:
+        client.validate_api_key()
+    other = SyncClient(client.config.api_key, base_url=BASE_URL, transport=httpx.MockTransport(api))
+    with other:
+        assert not other._needs_validation
+    assert api.validations == 1
@@ -0,0 +1,91 @@
+import json
+import asyncio
+
+import httpx
+import pytest
+
+from praxos_python import ResultCache
+
+from mock_api import sync_environment, async_environment
+
+
+class Recorder:
+    """Mock API recording the JSON body of every uploaded source."""
+    def __init__(self):
+        self.bodies = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.bodies.append(json.loads(request.content))
+        index = len(self.bodies)
+        return httpx.Response(200, json={"id": f"source-{index}", "environment_id": "env", "name": None,
+                                         "created_at": "2024-01-01T00:00:00", "description": None})
+
+
+def test_business_data_batches_are_encoded_like_single_posts():
+    recorder = Recorder()
+    env = sync_environment(recorder)
+    records = [{"index": i, 1: "non-str key", "text": "ü" * 50} for i in range(100)]
+    sources = env.add_business_data_chunked(records, name="export", metadata={2: "b"}, max_batch_bytes=2048)
+
+    assert len(sources) == len(recorder.bodies) > 1
+    sent = [record for body in sorted(recorder.bodies, key=lambda body: body["metadata"]["batch_index"]) for record in body["data"]]
+    assert sent == json.loads(json.dumps(records))
+    assert all(body["metadata"]["2"] == "b" for body in recorder.bodies)
+    assert all(len(json.dumps(body["data"], separators=(",", ":"), ensure_ascii=False).encode()) <= 2048
+               for body in recorder.bodies)
+
+    env.add_business_data({1: "a"}, metadata={2: "b"})
+    assert recorder.bodies[-1]["data"] == {"1": "a"}
+
+
+def test_conversation_batches_keep_message_order():
+    recorder = Recorder()
+    messages = [{"content": f"message {i}", "role": "user", "timestamp": "2024-01-01T00:00:00"} for i in range(40)]
+
+    async def main():
+        env = async_environment(recorder)
+        async with env._client:
+            return await env.add_conversation_chunked(messages, name="chat", max_batch_bytes=512, max_concurrency=1)
+
+    sources = asyncio.run(main())
+    assert len(sources) == len(recorder.bodies) > 1
+    assert [body["name"] for body in recorder.bodies] == [f"chat (part {i + 1})" for i in range(len(sources))]
+    assert [message["content"] for body in recorder.bodies for message in body["messages"]] == [m["content"] for m in messages]
+
+
+def test_a_record_that_cannot_be_encoded_fails_only_its_batch():
+    recorder = Recorder()
+    env = sync_environment(recorder, cache=ResultCache())
+    records = [{"index": i} for i in range(4)] + [{"index": object()}] + [{"index": i} for i in range(5, 8)]
+    results = env.add_business_data_chunked(records, max_batch_bytes=30, max_concurrency=1)
+
+    # Batches hold two records: [0, 1], then [2, 3] fails with the record that follows them.
+    assert isinstance(results[1], TypeError)
+    assert len(results) - 1 == len(recorder.bodies)
+    assert [record["index"] for body in recorder.bodies for record in body["data"]] == [0, 1, 5, 6, 7]
+    assert env._client.cache.generation("env") == 1
+
+
+def test_the_cache_is_invalidated_when_the_records_iterable_fails():
+    def records():
+        yield {"index": 0}
+        raise RuntimeError("export broke")
+
+    env = sync_environment(Recorder(), cache=ResultCache())
+    with pytest.raises(RuntimeError):
+        env.add_business_data_chunked(records(), max_batch_bytes=10)
+    assert env._client.cache.generation("env") == 1
+
+
+def test_graph_batches_cover_every_node_and_edge():
+    recorder = Recorder()
+    env = sync_environment(recorder)
+    nodes = [(f"n{i}", {"type": "schema:Thing", 1: i}) for i in range(30)]
+    edges = [(f"n{i}", f"n{i + 1}", {"type": "NEXT"}) for i in range(29)]
+    env.add_graph_chunked(edges=edges, nodes=nodes, name="graph", max_batch_bytes=1024, max_concurrency=1)
+
+    assert len(recorder.bodies) > 1
+    graphs = [body["graph_data"] for body in recorder.bodies]
+    assert [node["id"] for graph in graphs for node in graph["nodes"]] == [node_id for node_id, _ in nodes]
+    assert all(node["1"] == int(node["id"][1:]) for graph in graphs for node in graph["nodes"])
+    assert [(link["source"], link["target"]) for graph in graphs for link in graph["links"]] == [edge[:2] for edge in edges]
@@ -0,0 +1,118 @@
+import time
+import asyncio
+
+import httpx
+import pytest
+
+from praxos_python import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+from mock_api import sync_client, async_client
+
+
+class Interrupted(BaseException):
+    """Stands in for KeyboardInterrupt or an exception from an upload's progress callback."""
+
+
+def half_open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    return breaker
+
+
+def make_sync_client(breaker: CircuitBreaker, handler):
+    return sync_client(handler, circuit_breaker=breaker, retry_policy=RetryPolicy(max_retries=0))
+
+
+def make_async_client(breaker: CircuitBreaker, handler):
+    return async_client(handler, circuit_breaker=breaker, retry_policy=RetryPolicy(max_retries=0))
+
+
+def test_trial_outcomes():
+    breaker = half_open_breaker()
+    assert breaker.before_request("host") is True
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("host")
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.before_request("host") is False
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("host")
+
+
+def test_released_trial_lets_the_next_request_through():
+    breaker = half_open_breaker()
+    assert breaker.before_request("host") is True
+    breaker.release_trial()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.before_request("host") is True
+
+
+def test_sync_interrupted_trial_frees_the_slot():
+    breaker = half_open_breaker()
+    interrupt = [True]
+
+    def handler(request):
+        if interrupt:
+            interrupt.pop()
+            raise Interrupted()
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_sync_client(breaker, handler)
+    with pytest.raises(Interrupted):
+        client._request("GET", "environment")
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert client._request("GET", "environment") == {"ok": True}
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_async_cancelled_trial_frees_the_slot():
+    breaker = half_open_breaker()
+    hang = [True]
+
+    async def handler(request):
+        if hang:
+            hang.pop()
+            await asyncio.sleep(60)
+        return httpx.Response(200, json={"ok": True})
+
+    async def main():
+        client = make_async_client(breaker, handler)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client._request("GET", "environment"), timeout=0.05)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert await client._request("GET", "environment") == {"ok": True}
+        assert breaker.state == CircuitBreaker.CLOSED
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_failed_trial_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    client = make_sync_client(breaker, lambda request: httpx.Response(503))
+    with pytest.raises(CircuitOpenError):
+        client._request("GET", "environment")
+
+    time.sleep(0.06)
+    with pytest.raises(Exception) as info:
+        client._request("GET", "environment")
+    assert getattr(info.value, "status_code", None) == 503
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_late_failures_do_not_postpone_recovery():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    # Requests that were in flight when the circuit opened keep failing after it.
+    for _ in range(5):
+        time.sleep(0.015)
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.before_request("host") is True
@@ -0,0 +1,50 @@
+import json
+
+import httpx
+import pytest
+
+from praxos_python import get_json_codec
+from praxos_python.codec import supported_encodings, accept_encoding_header
+from mock_api import sync_client
+
+
+def available_codecs():
+    names = []
+    for name in ("orjson", "msgspec", "json"):
+        try:
+            get_json_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("name", available_codecs())
+@pytest.mark.parametrize("payload", [
+    {"records": [{"id": 1, "name": "naïve"}]},
+    {1: "a", 2.5: "b", True: "c", None: "d"},
+    {"metadata": {2: "b"}, "big": 2 ** 70},
+])
+def test_codecs_encode_like_the_stdlib(name, payload):
+    codec = get_json_codec(name)
+    assert json.loads(codec.encode(payload)) == json.loads(json.dumps(payload))
+
+
+def test_non_str_keys_reach_the_api():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"ok": True})
+
+    client = sync_client(handler)
+    client._request("POST", "sources", json_data={"data": {1: "a"}, "metadata": {2: "b"}})
+    assert bodies == [{"data": {"1": "a"}, "metadata": {"2": "b"}}]
+
+
+def test_accept_encoding():
+    assert {"gzip", "deflate"} <= set(supported_encodings())
+    assert accept_encoding_header(False) == "identity"
+    assert accept_encoding_header("gzip") == "gzip"
+    assert accept_encoding_header(["unknown"]) == "identity"
+    assert accept_encoding_header(True) == ", ".join(supported_encodings())
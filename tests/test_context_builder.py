@@ -0,0 +1,91 @@
+import json
+import asyncio
+
+import httpx
+
+from praxos_python.models.context_builder import ContextPacker, approximate_tokens
+from mock_api import sync_environment, async_environment
+
+SENTENCES = [f"Alice worked on project {i} with team {i} in {2000 + i}" for i in range(200)]
+
+
+def hit(index, sentence):
+    return {"node_id": f"edge-{index}", "score": 1.0 - index / 1000, "sentence": sentence,
+            "data": {"source_id": f"source-{index % 3}"}}
+
+
+class EdgeAPI:
+    """Mock vec_edge /search over SENTENCES, recording the top_k of each request."""
+    def __init__(self, sentences=SENTENCES):
+        self.sentences = sentences
+        self.top_ks = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        top_k = json.loads(request.content)["top_k"]
+        self.top_ks.append(top_k)
+        return httpx.Response(200, json={"hits": [hit(i, sentence) for i, sentence in enumerate(self.sentences[:top_k])]})
+
+
+def test_packs_hits_in_rank_order_within_the_budget():
+    packer = ContextPacker(budget=30)
+    packer.offer([hit(0, "first sentence here"), hit(1, "x" * 200), hit(2, "third one")])
+    bundle = packer.bundle(requests=1)
+    assert bundle.text == "[1] first sentence here\n[2] third one"
+    assert bundle.used <= 30 and bundle.candidates == 3
+    assert [entry["node_id"] for entry in bundle.provenance] == ["edge-0", "edge-2"]
+    assert bundle.provenance[1]["index"] == 2 and bundle.provenance[0]["source_id"] == "source-0"
+
+
+def test_near_duplicates_are_dropped():
+    packer = ContextPacker(budget=1000, numbered=False)
+    packer.offer([hit(0, "Alice joined Acme in 2020."), hit(1, "alice joined ACME in 2020"), hit(2, "Bob left")])
+    assert packer.bundle(1).text == "Alice joined Acme in 2020.\nBob left"
+
+
+def test_hits_already_offered_are_skipped():
+    packer = ContextPacker(budget=1000)
+    hits = [hit(i, sentence) for i, sentence in enumerate(SENTENCES[:4])]
+    packer.offer(hits[:2])
+    packer.offer(hits)
+    assert len(packer.bundle(2).contexts) == 4 and packer.candidates == 4
+
+
+def test_build_context_grows_the_search_until_the_budget_is_full():
+    api = EdgeAPI()
+    env = sync_environment(api)
+    with env._client:
+        bundle = env.build_context("alice", budget=200, initial_top_k=4)
+    assert bundle.used <= 200 and bundle.budget - bundle.used <= approximate_tokens("\n") + 8 + approximate_tokens(max(SENTENCES, key=len))
+    assert api.top_ks[0] == 4 and api.top_ks == sorted(api.top_ks) and bundle.requests == len(api.top_ks) > 1
+    assert bundle.text.startswith("[1] " + SENTENCES[0])
+
+
+def test_build_context_stops_when_hits_run_out():
+    api = EdgeAPI(SENTENCES[:5])
+    env = sync_environment(api)
+    with env._client:
+        bundle = env.build_context("alice", budget=10000, unit="chars", initial_top_k=4)
+    assert len(bundle.contexts) == 5
+    # The second search already returned fewer hits than asked for, so there is no third.
+    assert len(api.top_ks) == 2 and bundle.used == len(bundle.text)
+
+
+def test_build_context_honours_max_top_k_and_a_custom_count():
+    api = EdgeAPI()
+    env = sync_environment(api)
+    with env._client:
+        bundle = env.build_context("alice", budget=10 ** 6, count=lambda text: len(text.split()), max_top_k=16)
+    assert api.top_ks[-1] == 16 and len(bundle.contexts) == 16
+    # The separator has no words, so it costs nothing.
+    assert bundle.used == len(bundle.text.split())
+
+
+def test_async_build_context():
+    api = EdgeAPI(SENTENCES[:3])
+
+    async def run():
+        env = async_environment(api)
+        async with env._client:
+            return await env.build_context("alice", budget=1000)
+
+    assert str(asyncio.run(run())).count("\n") == 2
@@ -0,0 +1,90 @@
+import asyncio
+
+import httpx
+import pytest
+
+from praxos_python import APIError, RetryPolicy
+from mock_api import sync_environment, async_environment
+
+SOURCE = {"id": "source-1", "environment_id": "env", "name": "report", "created_at": None, "description": None}
+
+
+class UploadAPI:
+    """Mock /sources receiving multipart uploads; the first `failures` attempts get a 503."""
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.bodies = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.bodies.append(request.read())
+        if len(self.bodies) <= self.failures:
+            return httpx.Response(503, json={"message": "unavailable"})
+        return httpx.Response(200, json=SOURCE)
+
+
+@pytest.fixture
+def report(tmp_path):
+    path = tmp_path / "report.pdf"
+    path.write_bytes(bytes(range(256)) * 1024)
+    return path
+
+
+def test_a_file_is_streamed_with_progress(report):
+    api = UploadAPI()
+    env = sync_environment(api)
+    progress = []
+    with env._client:
+        source = env.add_file(str(report), progress=lambda sent, total: progress.append((sent, total)))
+    assert source.id == "source-1"
+    assert report.read_bytes() in api.bodies[0]
+    assert len(progress) > 1 and progress[-1] == (256 * 1024, 256 * 1024)
+    assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+
+
+def test_uploads_are_only_retried_when_asked(report):
+    policy = RetryPolicy(max_retries=1, backoff_factor=0, jitter=False)
+    env = sync_environment(UploadAPI(failures=1), retry_policy=policy)
+    with env._client, pytest.raises(APIError) as error:
+        env.add_file(str(report))
+    assert error.value.status_code == 503
+
+    api = UploadAPI(failures=1)
+    env = sync_environment(api, retry_policy=policy)
+    with env._client:
+        env.add_file(str(report), retry_upload=True)
+    # The retry re-sends the whole file.
+    assert len(api.bodies) == 2 and all(report.read_bytes() in body for body in api.bodies)
+
+
+def test_add_files_expands_directories_and_reports_each_file(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"a")
+    (tmp_path / "b.json").write_bytes(b"{}")
+    (tmp_path / "notes.txt").write_bytes(b"skipped")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "c.pdf").write_bytes(b"c")
+    missing = str(tmp_path / "missing.pdf")
+
+    env = sync_environment(UploadAPI())
+    with env._client:
+        results = env.add_files([str(tmp_path), missing], max_concurrency=2)
+        assert list(results) == [str(tmp_path / "a.pdf"), str(tmp_path / "b.json"), missing]
+        assert all(source.id == "source-1" for source in list(results.values())[:2])
+        assert isinstance(results[missing], FileNotFoundError)
+
+        recursive = env.add_files(str(tmp_path / "**" / "*.pdf"), recursive=True)
+        assert sorted(recursive) == sorted([str(tmp_path / "a.pdf"), str(tmp_path / "nested" / "c.pdf")])
+
+
+def test_async_add_files(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"a")
+    (tmp_path / "b.pdf").write_bytes(b"b")
+    api = UploadAPI()
+
+    async def run():
+        env = async_environment(api)
+        async with env._client:
+            return await env.add_files(str(tmp_path))
+
+    results = asyncio.run(run())
+    assert [source.id for source in results.values()] == ["source-1", "source-1"]
+    assert len(api.bodies) == 2
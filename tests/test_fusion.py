@@ -0,0 +1,116 @@
+import json
+import asyncio
+
+import httpx
+import pytest
+
+from praxos_python import APIError
+from praxos_python.models.fusion import fuse_results, rerank_hits, LexicalReranker, np
+from mock_api import sync_environment, async_environment
+
+
+def hits(*ids, **extra):
+    return [{"node_id": node_id, "score": 10.0 - rank, **extra} for rank, node_id in enumerate(ids)]
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = fuse_results({"fast": hits("a", "b", "c"), "graph": hits("b", "c", "d")}, top_k=3)
+    assert [hit["node_id"] for hit in fused] == ["b", "c", "a"]
+    assert fused[0]["score"] == pytest.approx(1 / 62 + 1 / 61)
+    assert fused[0]["modality_scores"] == {"fast": 9.0, "graph": 10.0}
+
+
+def test_weights_and_minmax_fusion():
+    lists = {"fast": hits("a", "b"), "graph": hits("b", "a")}
+    assert fuse_results(lists, weights={"graph": 2.0})[0]["node_id"] == "b"
+    fused = fuse_results({"fast": [{"node_id": "a", "score": 0.9}, {"node_id": "b", "score": 0.1}],
+                          "graph": [{"node_id": "b", "score": 500.0}, {"node_id": "a", "score": 499.0}]}, method="minmax")
+    assert [(hit["node_id"], hit["score"]) for hit in fused] == [("a", 1.0), ("b", 1.0)]
+    with pytest.raises(ValueError):
+        fuse_results(lists, method="max")
+
+
+def test_duplicates_keep_their_best_ranked_payload():
+    fast = [{"node_id": "a", "score": 1.0}, {"node_id": "a", "score": 0.5}]
+    graph = [{"node_id": "b", "score": 1.0}, {"node_id": "a", "score": 0.9, "graph_context": {"hops": 1}}]
+    fused = {hit["node_id"]: hit for hit in fuse_results({"fast": fast, "graph": graph})}
+    assert fused["a"]["score"] == pytest.approx(1 / 61 + 1 / 62)
+    assert "graph_context" not in fused["a"]
+    assert fuse_results({"graph": graph, "fast": fast})[0]["graph_context"] == {"hops": 1}
+    # Hits without an id are deduplicated by sentence.
+    sentences = fuse_results({"x": [{"sentence": "s", "score": 1}], "y": [{"sentence": "s", "score": 1}]})
+    assert len(sentences) == 1
+
+
+def test_lexical_reranker_scores_query_terms():
+    candidates = [{"sentence": "Bob likes tea"}, {"sentence": "Alice joined Acme"}, {"data": {"label": "Acme Corp"}}]
+    reranker = LexicalReranker()
+    scores = reranker("acme alice", candidates)
+    assert scores[1] > scores[2] > scores[0] == 0.0
+    assert reranker("", candidates) == [0.0, 0.0, 0.0]
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+def test_numpy_and_python_scores_agree():
+    candidates = [{"sentence": f"alice acme {'filler ' * i}"} for i in range(5)] + [{"sentence": "acme"}]
+    reranker = LexicalReranker()
+    counts = [[1, 1]] * 5 + [[1, 0]]
+    lengths = [2 + i for i in range(5)] + [1]
+    assert reranker("alice acme", candidates) == pytest.approx(reranker._score_python(counts, lengths))
+
+
+def test_rerank_blends_with_the_fused_score():
+    fused = [{"node_id": "a", "score": 0.03, "sentence": "unrelated"}, {"node_id": "b", "score": 0.02, "sentence": "acme"}]
+    reranked = rerank_hits("acme", [dict(hit) for hit in fused], LexicalReranker(), weight=0.8)
+    assert [hit["node_id"] for hit in reranked] == ["b", "a"]
+    assert reranked[0]["fused_score"] == 0.02
+    with pytest.raises(ValueError):
+        rerank_hits("acme", fused, lambda query, candidates: [1.0])
+
+
+class ModalityAPI:
+    """Mock /search answering each search_modality with its own ranking; failing modalities get a 400."""
+    RANKINGS = {"fast": ["a", "b", "c"], "node_vec": ["b", "c", "d"]}
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        modality = body["search_modality"]
+        self.requests.append((modality, body["top_k"], body.get("source_id")))
+        if modality in self.failing:
+            return httpx.Response(400, json={"message": "unsupported"})
+        return httpx.Response(200, json={"hits": hits(*self.RANKINGS[modality][:body["top_k"]])})
+
+
+def test_hybrid_search_fuses_concurrent_modalities():
+    api = ModalityAPI()
+    env = sync_environment(api)
+    with env._client:
+        fused = env.hybrid_search("acme", top_k=2, modalities=("fast", "graph"), source_id="source-1")
+    assert [hit["node_id"] for hit in fused] == ["b", "c"]
+    assert sorted(api.requests) == [("fast", 4, "source-1"), ("node_vec", 4, "source-1")]
+
+
+def test_hybrid_search_skips_failed_modalities_unless_all_fail():
+    env = sync_environment(ModalityAPI(failing={"node_vec"}))
+    with env._client:
+        assert [hit["node_id"] for hit in env.hybrid_search("acme", modalities=("fast", "graph"))] == ["a", "b", "c"]
+    env = sync_environment(ModalityAPI(failing={"fast", "node_vec"}))
+    with env._client, pytest.raises(APIError):
+        env.hybrid_search("acme", modalities=("fast", "graph"))
+    with pytest.raises(ValueError):
+        env.hybrid_search("acme", modalities=("telepathy",))
+
+
+def test_async_hybrid_search_with_custom_modality_and_reranker():
+    async def run():
+        env = async_environment(ModalityAPI())
+        async with env._client:
+            return await env.hybrid_search("acme", top_k=3, modalities=("fast", {"search_modality": "node_vec"}),
+                                           rerank=lambda query, candidates: [0.0] * len(candidates))
+
+    fused = asyncio.run(run())
+    assert len(fused) == 3 and set(fused[0]["modality_scores"]) == {"fast", "custom_1"}
@@ -0,0 +1,139 @@
+import asyncio
+
+import httpx
+import pytest
+
+from praxos_python import APIError, Instrumentation, RetryPolicy
+from praxos_python.instrumentation import LatencyHistogram, Metrics
+from mock_api import sync_environment, async_environment
+
+
+class FlakyAPI:
+    """Mock API failing the first `failures` searches with a 503 and rejecting fetch-graph-nodes."""
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/fetch-graph-nodes":
+            return httpx.Response(400, json={"message": "bad ids"})
+        if self.failures:
+            self.failures -= 1
+            return httpx.Response(503, json={"message": "unavailable"})
+        return httpx.Response(200, json={"hits": [{"node_id": "node-1", "score": 1.0}]})
+
+
+class RecordingTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None):
+        span = RecordingSpan(name, attributes)
+        self.spans.append(span)
+        return span
+
+
+class RecordingSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.exceptions = []
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, error):
+        self.exceptions.append(error)
+
+    def set_status(self, status):
+        pass
+
+    def end(self):
+        self.ended = True
+
+
+def test_hooks_see_every_request_and_its_outcome():
+    instrumentation = Instrumentation()
+    started, finished = [], []
+    instrumentation.on_request(lambda event: started.append((event.method, event.endpoint, event.status_code)))
+
+    @instrumentation.on_response
+    def record(event):
+        finished.append((event.endpoint, event.status_code, event.retries, event.error))
+
+    env = sync_environment(FlakyAPI(failures=1), instrumentation=instrumentation,
+                           retry_policy=RetryPolicy(max_retries=1, backoff_factor=0, jitter=False))
+    with env._client:
+        env.search("acme")
+        with pytest.raises(APIError):
+            env.fetch_graph_nodes(["node-1"])
+
+    assert started == [("POST", "/search", 0), ("POST", "/fetch-graph-nodes", 0)]
+    assert finished[0] == ("/search", 200, 1, None)
+    assert finished[1][:3] == ("/fetch-graph-nodes", 400, 0) and isinstance(finished[1][3], APIError)
+
+
+def test_metrics_are_kept_per_endpoint():
+    instrumentation = Instrumentation()
+    env = sync_environment(FlakyAPI(), instrumentation=instrumentation)
+    with env._client:
+        for _ in range(3):
+            env.search("acme")
+        with pytest.raises(APIError):
+            env.fetch_graph_nodes(["node-1"])
+
+    snapshot = instrumentation.metrics.snapshot()
+    search = snapshot["POST /search"]
+    assert search["requests"] == 3 and search["errors"] == 0 and search["status_codes"] == {200: 3}
+    assert search["request_bytes"] > 0 and search["response_bytes"] > 0
+    assert search["total_time"]["count"] == 3 and search["total_time"]["p99"] is not None
+    assert snapshot["POST /fetch-graph-nodes"]["errors"] == 1
+
+    instrumentation.metrics.reset()
+    assert instrumentation.metrics.snapshot() == {}
+
+
+def test_a_failing_hook_does_not_fail_the_request():
+    instrumentation = Instrumentation(metrics=False)
+
+    @instrumentation.on_request
+    def broken(event):
+        raise RuntimeError("hook bug")
+
+    env = sync_environment(FlakyAPI(), instrumentation=instrumentation)
+    with env._client:
+        assert env.search("acme")[0]["node_id"] == "node-1"
+
+
+def test_spans_are_ended_with_the_outcome():
+    tracer = RecordingTracer()
+    env = sync_environment(FlakyAPI(), instrumentation=Instrumentation(metrics=False, tracer=tracer))
+    with env._client:
+        env.search("acme")
+        with pytest.raises(APIError):
+            env.fetch_graph_nodes(["node-1"])
+    ok, failed = tracer.spans
+    assert ok.name == "praxos POST /search" and ok.ended and ok.attributes["http.response.status_code"] == 200
+    assert failed.ended and failed.attributes["http.response.status_code"] == 400 and len(failed.exceptions) == 1
+
+
+def test_latency_histogram_quantiles_are_bucket_bounds():
+    histogram = LatencyHistogram()
+    for value in (0.0005, 0.003, 0.003, 0.1):
+        histogram.record(value)
+    assert histogram.quantile(0.5) == 0.004
+    assert histogram.quantile(1.0) == 0.1
+    assert histogram.to_dict()["min"] == 0.0005
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+def test_async_clients_share_the_metrics():
+    metrics = Metrics()
+
+    async def run():
+        env = async_environment(FlakyAPI(), instrumentation=Instrumentation(metrics=metrics))
+        async with env._client:
+            await asyncio.gather(*(env.search(f"query {i}") for i in range(4)))
+
+    asyncio.run(run())
+    assert metrics.snapshot()["POST /search"]["requests"] == 4
@@ -0,0 +1,62 @@
+import pytest
+
+from praxos_python import LocalEnvironment
+from praxos_python.models.local import SnapshotWriter
+
+ALICE = {"id": "node-alice", "label": "Alice", "type": "schema:Person", "sentence": "Alice works at Acme"}
+BOB = {"id": "node-bob", "label": "Bob", "type": "schema:Person"}
+CAROL = {"id": "node-carol", "label": "Carol", "type": "schema:Person"}
+PHONE = {"id": "phone-1", "value": "555"}
+
+
+def tagged(record, source_id):
+    return {**record, "source_id": source_id}
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = str(tmp_path / "env.snapshot")
+    with SnapshotWriter(path, environment={"id": "env", "name": "env"}) as writer:
+        writer.add_items("Person", [tagged(ALICE, "source-1"), tagged(BOB, "source-1")])
+        writer.add_items("Person", [tagged(ALICE, "source-2"), tagged(CAROL, "source-2")])
+        writer.add_literals("PhoneType", "literals_only", [tagged(PHONE, "source-1"), tagged(PHONE, "source-2")])
+        writer.set_sources([("source-1", None, "completed", True), ("source-2", None, "completed", True)])
+    return path
+
+
+def labels(path, **filters):
+    with LocalEnvironment(path) as local:
+        return sorted(item["label"] for item in local.iter_items("Person", **filters))
+
+
+def test_records_belong_to_every_source_that_contains_them(snapshot):
+    assert labels(snapshot) == ["Alice", "Bob", "Carol"]
+    assert labels(snapshot, source_id="source-1") == ["Alice", "Bob"]
+    assert labels(snapshot, source_id="source-2") == ["Alice", "Carol"]
+    with LocalEnvironment(snapshot) as local:
+        assert local.search_entities("Alice")[0]["node_id"] == "node-alice"
+        assert local.find_by_label(" alice ") and local.get_nodes(["node-carol", "missing"])[0]["label"] == "Carol"
+        assert len(local.extract_literals("PhoneType", source_id="source-1")["literals"]) == 1
+        assert local.stats()["items"] == {"Person": 3}
+
+
+def test_snapshots_are_read_only(snapshot):
+    with LocalEnvironment(snapshot) as local:
+        with pytest.raises(Exception):
+            local._connection.execute("DELETE FROM items")
+
+
+def test_shared_records_survive_until_their_last_source_is_removed(snapshot):
+    with SnapshotWriter(snapshot, replace=False) as writer:
+        assert writer.remove_source("source-1") == 1
+    assert labels(snapshot) == ["Alice", "Carol"]
+    with LocalEnvironment(snapshot) as local:
+        assert local.find_literal("555")
+
+    with SnapshotWriter(snapshot, replace=False) as writer:
+        assert writer.remove_source("source-2") == 3
+        assert writer.known_sources() == {}
+    assert labels(snapshot) == []
+    with LocalEnvironment(snapshot) as local:
+        assert local.search_entities("Alice") == []
+        assert local.find_literal("555") == []
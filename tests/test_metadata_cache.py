@@ -0,0 +1,117 @@
+import time
+import asyncio
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from praxos_python import APIError, MetadataCache
+from praxos_python.metadata_cache import ontology_json_schema
+from mock_api import sync_client, async_client
+
+ENVIRONMENT = {"id": "env", "name": "env", "created_at": None, "description": None}
+
+
+class EnvironmentAPI:
+    """Mock GET /environment with an ETag; answers 304 when If-None-Match matches the current one."""
+    def __init__(self, etag='"v1"', description=None):
+        self.etag = etag
+        self.description = description
+        self.conditional = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.conditional.append(request.headers.get("If-None-Match"))
+        if self.etag is not None and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        headers = {"ETag": self.etag} if self.etag is not None else {}
+        return httpx.Response(200, json={**ENVIRONMENT, "description": self.description}, headers=headers)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = MetadataCache(directory=str(tmp_path), ttl=0.05)
+    yield cache
+    cache.close()
+
+
+def test_fresh_entries_are_used_without_a_request(cache):
+    api = EnvironmentAPI()
+    client = sync_client(api, metadata_cache=cache)
+    with client:
+        assert client.get_environment(id="env").id == "env"
+        assert client.get_environment(id="env").id == "env"
+    assert api.conditional == [None]
+
+
+def test_stale_entries_are_revalidated_with_their_etag(cache):
+    api = EnvironmentAPI(description="first")
+    client = sync_client(api, metadata_cache=cache)
+    with client:
+        client.get_environment(id="env")
+        time.sleep(0.06)
+        assert client.get_environment(id="env").description == "first"
+        # The 304 made the entry fresh again.
+        client.get_environment(id="env")
+        assert api.conditional == [None, '"v1"']
+
+        time.sleep(0.06)
+        api.etag, api.description = '"v2"', "second"
+        assert client.get_environment(id="env").description == "second"
+        time.sleep(0.06)
+        client.get_environment(id="env")
+    assert api.conditional == [None, '"v1"', '"v1"', '"v2"']
+
+
+def test_entries_without_etag_are_refetched(cache):
+    api = EnvironmentAPI(etag=None)
+    client = sync_client(api, metadata_cache=cache)
+    with client:
+        client.get_environment(id="env")
+        time.sleep(0.06)
+        client.get_environment(id="env")
+    assert api.conditional == [None, None]
+
+
+def test_not_modified_without_a_cached_entry_is_an_error(cache):
+    client = sync_client(lambda request: httpx.Response(304), metadata_cache=cache)
+    with client:
+        with pytest.raises(APIError) as error:
+            client.get_environment(id="env")
+    assert error.value.status_code == 304
+    assert cache.get(cache.make_key(client.config, "environment", {"id": "env"})) is None
+
+
+def test_entries_are_scoped_to_the_api_key(cache):
+    client = sync_client(EnvironmentAPI(), metadata_cache=cache)
+    client.get_environment(id="env")
+    key = cache.make_key(client.config, "environment", {"id": "env"})
+    other = sync_client(EnvironmentAPI(), metadata_cache=cache)
+    other.config.api_key = "other-key"
+    assert cache.make_key(other.config, "environment", {"id": "env"}) != key
+    assert cache.get(key).value["id"] == "env"
+
+
+def test_async_client_revalidates(cache):
+    api = EnvironmentAPI()
+
+    async def run():
+        client = async_client(api, metadata_cache=cache)
+        async with client:
+            await client.get_environment(id="env")
+            await asyncio.sleep(0.06)
+            return await client.get_environment(id="env")
+
+    assert asyncio.run(run()).id == "env"
+    assert api.conditional == [None, '"v1"']
+
+
+class Invoice(BaseModel):
+    number: str
+    total: float
+
+
+def test_ontology_schemas_are_persisted(cache):
+    schema = ontology_json_schema([Invoice], cache=cache)
+    stored = cache._connection.execute("SELECT key FROM entries WHERE key LIKE 'schema:%'").fetchall()
+    assert len(stored) == 1
+    assert cache.get(stored[0][0]).value == schema
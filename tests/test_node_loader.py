@@ -0,0 +1,101 @@
+import json
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from praxos_python.models.loader import NodeLoader, AsyncNodeLoader
+from mock_api import sync_environment, async_environment
+
+
+class GraphAPI:
+    """Mock /fetch-graph-nodes knowing every id except "node-missing"; records the ids of each request."""
+    def __init__(self):
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def nodes(self, node_ids):
+        return [{"id": node_id, "label": node_id} for node_id in node_ids if node_id != "node-missing"]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        node_ids = json.loads(request.content)["node_ids"]
+        with self._lock:
+            self.batches.append(node_ids)
+        return httpx.Response(200, json={"results": self.nodes(node_ids)})
+
+
+def test_load_many_keeps_order_dedupes_and_chunks():
+    api = GraphAPI()
+    env = sync_environment(api)
+    env.node_loader.max_batch_size = 3
+    ids = ["node-1", "node-2", "node-1", "node-missing", "node-3", "node-4"]
+    with env._client:
+        nodes = env.load_nodes(ids)
+    assert [node and node["id"] for node in nodes] == ["node-1", "node-2", "node-1", None, "node-3", "node-4"]
+    assert sorted(len(batch) for batch in api.batches) == [2, 3]
+    assert sorted(sum(api.batches, [])) == ["node-1", "node-2", "node-3", "node-4", "node-missing"]
+
+
+def test_cached_nodes_are_not_requested_again_until_ingestion():
+    api = GraphAPI()
+    env = sync_environment(api)
+    with env._client:
+        env.load_nodes(["node-1", "node-missing"])
+        env.node_loader.prime([{"id": "node-2"}])
+        assert [node and node["id"] for node in env.load_nodes(["node-1", "node-2", "node-missing"])] == ["node-1", "node-2", None]
+        # Unknown ids are asked for again, in case they were added since.
+        assert api.batches == [["node-1", "node-missing"], ["node-missing"]]
+
+        env._client._invalidate_cache("env")
+        env.load_nodes(["node-1"])
+    assert api.batches[-1] == ["node-1"]
+
+
+def test_concurrent_callers_are_coalesced_into_one_request():
+    fetched = []
+    loader = NodeLoader(lambda node_ids: fetched.append(node_ids) or [{"id": node_id} for node_id in node_ids],
+                        batch_window=0.05)
+    barrier = threading.Barrier(4)
+    results = {}
+
+    def load(index):
+        barrier.wait()
+        results[index] = loader.load_many([f"node-{index}", "node-shared"])
+
+    threads = [threading.Thread(target=load, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(fetched) == 1 and sorted(fetched[0]) == ["node-0", "node-1", "node-2", "node-3", "node-shared"]
+    assert all([node["id"] for node in results[index]] == [f"node-{index}", "node-shared"] for index in range(4))
+    assert loader.stats()["requests"] == 1
+
+
+def test_a_failed_chunk_fails_only_its_callers():
+    def fetch(node_ids):
+        if "node-bad" in node_ids:
+            raise RuntimeError("chunk failed")
+        return [{"id": node_id} for node_id in node_ids]
+
+    loader = NodeLoader(fetch, batch_window=0, max_batch_size=1)
+    with pytest.raises(RuntimeError):
+        loader.load_many(["node-1", "node-bad"])
+    assert loader.load("node-1") == {"id": "node-1"}
+    assert loader.stats()["requests"] == 2 and not loader._in_flight
+
+
+def test_async_loader_coalesces_concurrent_tasks():
+    api = GraphAPI()
+
+    async def run():
+        env = async_environment(api)
+        async with env._client:
+            results = await asyncio.gather(env.load_nodes(["node-1", "node-2"]), env.load_nodes(["node-2", "node-3"]))
+            return results, env.node_loader
+
+    results, loader = asyncio.run(run())
+    assert [[node["id"] for node in nodes] for nodes in results] == [["node-1", "node-2"], ["node-2", "node-3"]]
+    assert api.batches == [["node-1", "node-2", "node-3"]]
+    assert isinstance(loader, AsyncNodeLoader)
@@ -0,0 +1,86 @@
+import json
+import asyncio
+import threading
+
+import httpx
+
+from praxos_python.utils import iter_pages, aiter_pages
+from mock_api import sync_environment, async_environment
+
+ITEMS = [{"id": f"node-{i}", "label": f"item {i}"} for i in range(25)]
+
+
+def pages_of(items):
+    """fetch_page over a list, recording the offsets it was asked for."""
+    requested = []
+
+    def fetch_page(offset, limit):
+        requested.append(offset)
+        return items[offset:offset + limit]
+
+    return fetch_page, requested
+
+
+def test_pages_until_a_short_page():
+    fetch_page, requested = pages_of(list(range(25)))
+    assert list(iter_pages(fetch_page, 10, prefetch=False)) == list(range(25))
+    assert requested == [0, 10, 20]
+
+    fetch_page, requested = pages_of(list(range(20)))
+    assert list(iter_pages(fetch_page, 10)) == list(range(20))
+    # A full last page needs one more (empty) page to tell it was the last.
+    assert requested == [0, 10, 20]
+
+
+def test_the_next_page_is_fetched_while_the_current_one_is_consumed():
+    second_page_requested = threading.Event()
+
+    def fetch_page(offset, limit):
+        if offset:
+            second_page_requested.set()
+        return list(range(offset, min(offset + limit, 15)))
+
+    pages = iter_pages(fetch_page, 10)
+    assert next(pages) == 0
+    assert second_page_requested.wait(5)
+    assert list(pages) == list(range(1, 15))
+
+
+def test_servers_ignoring_paging_are_read_once():
+    everything = list(range(25))
+    assert list(iter_pages(lambda offset, limit: everything, 10)) == everything
+    assert list(iter_pages(lambda offset, limit: everything[:10], 10)) == everything[:10]
+
+
+def test_abandoned_iterators_stop_prefetching():
+    fetch_page, requested = pages_of(list(range(100)))
+    pages = iter_pages(fetch_page, 10)
+    assert next(pages) == 0
+    pages.close()
+    assert len(requested) <= 2
+
+
+def extract_api(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    return httpx.Response(200, json={"items": ITEMS[body["offset"]:body["offset"] + body["limit"]]})
+
+
+def test_iter_items_pages_through_extract():
+    env = sync_environment(extract_api)
+    with env._client:
+        assert list(env.iter_items("Person", page_size=10)) == ITEMS
+
+
+def test_async_iter_items_and_aiter_pages():
+    async def run():
+        env = async_environment(extract_api)
+        async with env._client:
+            items = [item async for item in env.iter_items("Person", page_size=10)]
+
+        async def fetch_page(offset, limit):
+            return list(range(25))[offset:offset + limit]
+
+        numbers = [number async for number in aiter_pages(fetch_page, 10)]
+        return items, numbers
+
+    assert asyncio.run(run()) == (ITEMS, list(range(25)))
@@ -0,0 +1,55 @@
+import httpx
+
+from praxos_python import SyncClient
+from praxos_python.client import get_shared_http_client
+from praxos_python.config import ClientConfig
+from mock_api import BASE_URL, sync_client
+
+
+def test_phase_timeouts_fall_back_to_timeout():
+    config = ClientConfig("key", timeout=7.0, connect_timeout=2.0, pool_timeout=1.0)
+    assert config.timeouts == httpx.Timeout(7.0, connect=2.0, pool=1.0)
+    assert config.upload_timeouts == httpx.Timeout(300.0, connect=2.0, pool=1.0)
+
+
+def test_pool_settings_carry_limits_http2_and_transport():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    config = ClientConfig("key", max_connections=10, max_keepalive_connections=5, keepalive_expiry=1.0,
+                          transport=transport, httpx_settings={"trust_env": False})
+    settings = config.pool_settings()
+    assert settings["limits"] == httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=1.0)
+    assert settings["transport"] is transport and settings["http2"] is False and settings["trust_env"] is False
+    assert ClientConfig("other-key", max_connections=10, max_keepalive_connections=5, keepalive_expiry=1.0,
+                        transport=transport, httpx_settings={"trust_env": False}).pool_key() == config.pool_key()
+    assert ClientConfig("key", max_connections=11).pool_key() != ClientConfig("key", max_connections=10).pool_key()
+
+
+def test_clients_sharing_a_pool_send_their_own_key():
+    keys = []
+
+    def handler(request):
+        keys.append((str(request.url), request.headers["api-key"]))
+        return httpx.Response(200, json={"id": "env", "name": "env", "created_at": None, "description": None})
+
+    pool = httpx.Client(transport=httpx.MockTransport(handler))
+    first = sync_client(handler, http_client=pool)
+    second = SyncClient("second-key", base_url=BASE_URL, http_client=pool, lazy_validation=True)
+    second._needs_validation = False
+    first.get_environment(id="env")
+    second.get_environment(id="env")
+    assert keys == [(BASE_URL + "environment?id=env", "test-key"), (BASE_URL + "environment?id=env", "second-key")]
+
+    # A pool passed in belongs to the caller.
+    first.close()
+    second.close()
+    assert not pool.is_closed
+    pool.close()
+
+
+def test_share_pool_reuses_one_client_per_pool_settings():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    first = SyncClient("first-key", base_url=BASE_URL, share_pool=True, transport=transport, lazy_validation=True)
+    second = SyncClient("second-key", base_url=BASE_URL, share_pool=True, transport=transport, lazy_validation=True)
+    assert first._http_client is second._http_client is get_shared_http_client(first.config)
+    first.close()
+    assert not second._http_client.is_closed
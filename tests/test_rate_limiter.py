@@ -0,0 +1,123 @@
+import time
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from praxos_python import APIError, RateLimit, RateLimiter, RetryPolicy
+from praxos_python.ratelimit import endpoint_class, get_rate_limiter
+from mock_api import sync_environment, async_environment
+
+
+def test_endpoint_classes():
+    assert endpoint_class("post", "/search") == "search"
+    assert endpoint_class("POST", "fetch-graph-nodes") == "search"
+    assert endpoint_class("POST", "sources") == "upload"
+    assert endpoint_class("GET", "sources") == "default"
+
+
+def test_token_bucket_allows_a_burst_then_paces():
+    budget = RateLimiter({"default": RateLimit(rate=100.0, burst=2)}).budget("GET", "environment")
+    waits = [budget.reserve() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert 0.005 < waits[2] <= 0.01 and 0.015 < waits[3] <= 0.02
+
+
+def test_429_bursts_halve_rate_and_concurrency_once_and_successes_raise_them_again():
+    limiter = RateLimiter({"search": RateLimit(rate=8.0, max_in_flight=8)})
+    budget = limiter.budget("POST", "search")
+    for _ in range(5):
+        budget.record(429, None)
+    assert budget.rate == 4.0 and budget.in_flight_limit == 4 and budget.throttled == 5
+
+    for _ in range(4):
+        budget.record(200, None)
+    assert budget.rate == pytest.approx(4.8) and budget.in_flight_limit == 5
+
+    fixed = RateLimiter({"search": RateLimit(rate=8.0)}, adaptive=False).budget("POST", "search")
+    fixed.record(429, None)
+    assert fixed.rate == 8.0
+
+
+def test_retry_after_pauses_the_whole_class():
+    limiter = RateLimiter({"search": RateLimit(rate=1000.0, burst=1000)})
+    budget, _ = limiter.acquire("POST", "search")
+    limiter.release(budget, httpx.Response(429, headers={"Retry-After": "0.2"}))
+    assert 0.1 < budget.reserve() <= 0.2
+    assert limiter.budget("POST", "extract").reserve() == 0.0
+
+
+class ConcurrencyAPI:
+    """Mock /search tracking how many requests it serves at once; set `status` to answer with an error."""
+    def __init__(self, latency: float = 0.01, status: int = 200):
+        self.latency = latency
+        self.status = status
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        if self.status != 200:
+            return httpx.Response(self.status, json={"message": "error"})
+        return httpx.Response(200, json={"hits": []})
+
+
+def test_client_requests_respect_the_in_flight_limit():
+    api = ConcurrencyAPI()
+    limiter = RateLimiter({"search": RateLimit(rate=1000.0, burst=1000, max_in_flight=3)})
+    env = sync_environment(api, rate_limit=limiter)
+    with env._client:
+        env.search_many([{"query": f"q{i}"} for i in range(12)], max_concurrency=12)
+    assert api.max_in_flight == 3
+    assert limiter.stats()["search"]["requests"] == 12 and limiter.stats()["search"]["in_flight"] == 0
+
+
+def test_slots_are_released_after_errors_and_retries():
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    limiter = RateLimiter({"search": RateLimit(rate=1000.0, burst=1000, max_in_flight=1)})
+    for handler in (refuse, ConcurrencyAPI(latency=0, status=503)):
+        env = sync_environment(handler, rate_limit=limiter, retry_policy=RetryPolicy(max_retries=1, backoff_factor=0, jitter=False))
+        with env._client, pytest.raises(APIError):
+            env.search("acme")
+    stats = limiter.stats()["search"]
+    # Every attempt, retries included, takes a token and a slot and gives the slot back.
+    assert stats["requests"] == 4 and stats["in_flight"] == 0
+
+
+def test_sync_and_async_clients_can_share_a_limiter():
+    api = ConcurrencyAPI(latency=0.005)
+    limiter = RateLimiter({"search": RateLimit(rate=1000.0, burst=1000, max_in_flight=2)})
+
+    async def run():
+        async def handler(request):
+            await asyncio.sleep(0.005)
+            return httpx.Response(200, json={"hits": []})
+
+        env = async_environment(handler, rate_limit=limiter)
+        async with env._client:
+            await asyncio.gather(*(env.search(f"q{i}") for i in range(10)))
+
+    env = sync_environment(api, rate_limit=limiter)
+    with env._client:
+        thread = threading.Thread(target=env.search_many, args=([{"query": f"s{i}"} for i in range(10)],))
+        thread.start()
+        asyncio.run(run())
+        thread.join()
+    stats = limiter.stats()["search"]
+    assert stats["requests"] == 20 and stats["in_flight"] == 0
+
+
+def test_rate_limit_true_shares_one_limiter_per_key():
+    assert get_rate_limiter("http://praxos.mock/", "key") is get_rate_limiter("http://praxos.mock/", "key")
+    assert get_rate_limiter("http://praxos.mock/", "key") is not get_rate_limiter("http://praxos.mock/", "other")
+    env = sync_environment(ConcurrencyAPI(), rate_limit=True)
+    assert env._client.config.rate_limiter is get_rate_limiter(env._client.config.base_url, "test-key")
@@ -0,0 +1,87 @@
+import time
+
+import httpx
+
+from praxos_python import ResultCache
+from mock_api import sync_environment
+
+
+def test_entries_expire_after_ttl():
+    cache = ResultCache(ttl=0.05)
+    cache.set("key", {"value": 1})
+    assert cache.get("key") == {"value": 1}
+    time.sleep(0.06)
+    assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted_first():
+    cache = ResultCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_size_is_bounded_in_bytes():
+    cache = ResultCache(max_bytes=40)
+    cache.set("a", "x" * 20)
+    cache.set("b", "y" * 20)
+    assert cache.get("a") is None and cache.get("b") == "y" * 20
+    cache.set("huge", "z" * 100)
+    assert cache.get("huge") is None
+    assert cache.stats()["bytes"] <= 40
+
+
+def test_callers_get_their_own_copy():
+    cache = ResultCache()
+    cache.set("key", {"hits": [1]})
+    cache.get("key")["hits"].append(2)
+    assert cache.get("key") == {"hits": [1]}
+
+
+def test_invalidation_drops_an_environment_and_results_read_before_it():
+    cache = ResultCache()
+    cache.set("a", 1, environment_id="env-1")
+    cache.set("b", 2, environment_id="env-2")
+    generation = cache.generation("env-1")
+    assert cache.invalidate_environment("env-1") == 1
+    assert cache.get("a") is None and cache.get("b") == 2
+    # Read before the invalidation, so it may be stale.
+    cache.set("a", 1, environment_id="env-1", generation=generation)
+    assert cache.get("a") is None
+    cache.set("a", 1, environment_id="env-1", generation=cache.generation("env-1"))
+    assert cache.get("a") == 1
+
+
+def test_keys_are_canonical():
+    assert ResultCache.make_key("/search", {"a": 1, "b": 2}) == ResultCache.make_key("search", {"b": 2, "a": 1})
+    assert ResultCache.make_key("search", {"a": 1}) != ResultCache.make_key("search", {"a": 2})
+
+
+def test_client_serves_repeated_searches_from_the_cache_until_ingestion():
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/search":
+            return httpx.Response(200, json={"hits": [{"node_id": "node-1", "score": 1.0}]})
+        return httpx.Response(200, json={"id": "source-1", "environment_id": "env", "name": None,
+                                         "created_at": None, "description": None})
+
+    cache = ResultCache(ttl=60)
+    env = sync_environment(handler, cache=cache)
+    with env._client:
+        hits = env.search("acme")
+        hits[0]["score"] = 0.0
+        assert env.search("acme") == [{"node_id": "node-1", "score": 1.0}]
+        env.search("acme", search_modality="node_vec")
+        assert requests == ["/search", "/search"]
+
+        env.add_business_data({"records": []})
+        env.search("acme")
+    assert requests == ["/search", "/search", "/sources", "/search"]
+    assert cache.hits == 1
@@ -0,0 +1,68 @@
+import json
+import time
+import random
+import asyncio
+import threading
+
+import httpx
+
+from praxos_python import APIError
+from mock_api import sync_environment, async_environment
+
+
+class SearchAPI:
+    """Mock /search answering each query with one hit named after it, after a random delay."""
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def hit(self, query):
+        return {"hits": [{"node_id": f"node-{query}", "score": 1.0, "label": query}]}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(random.uniform(0, 0.01))
+            if query.startswith("bad"):
+                return httpx.Response(400, json={"message": f"rejected {query}"})
+            return httpx.Response(200, json=self.hit(query))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+QUERIES = [{"query": f"q{i}"} for i in range(12)] + [{"query": "bad-1"}] + [{"query": f"q{i}"} for i in range(12, 16)]
+
+
+def check(results, api):
+    assert len(results) == len(QUERIES)
+    for query, result in zip(QUERIES, results):
+        if query["query"].startswith("bad"):
+            assert isinstance(result, APIError) and result.status_code == 400
+        else:
+            assert result == api.hit(query["query"])["hits"]
+
+
+def test_search_many_keeps_input_order_and_per_query_errors():
+    api = SearchAPI()
+    env = sync_environment(api)
+    with env._client:
+        results = env.search_many(QUERIES, max_concurrency=4)
+    check(results, api)
+    assert 1 < api.max_in_flight <= 4
+
+
+def test_async_search_many_keeps_input_order_and_per_query_errors():
+    api = SearchAPI()
+
+    async def run():
+        env = async_environment(api)
+        async with env._client:
+            return await env.search_many(QUERIES, max_concurrency=4)
+
+    check(asyncio.run(run()), api)
+    assert api.max_in_flight <= 4
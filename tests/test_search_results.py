@@ -0,0 +1,50 @@
+import json
+
+from praxos_python import SearchHit, SearchResults, JSONCodec
+
+HITS = [
+    {"score": 0.9, "sentence": "Alice works at Acme", "data": {"id": "node-1", "label": "Alice"},
+     "graph_context": {"neighbours": [{"id": "node-2"}]}},
+    {"score": 0.5, "node_id": "node-3", "data": {"label": "Bob", "tags": ["a", "b"]}},
+    {"score": 0.1, "sentence": "no payload"},
+]
+
+
+class CountingCodec(JSONCodec):
+    def __init__(self):
+        self.calls = {"encode": 0, "decode": 0}
+        super().__init__("counting", self._encode, self._decode)
+
+    def _encode(self, value):
+        self.calls["encode"] += 1
+        return json.dumps(value).encode("utf-8")
+
+    def _decode(self, body):
+        self.calls["decode"] += 1
+        return json.loads(body)
+
+
+def test_results_match_raw_hits():
+    results = SearchResults(HITS)
+    assert results.to_dicts() == HITS
+    assert list(results.scores) == [0.9, 0.5, 0.1]
+    assert results.ids == ["node-1", "node-3", None]
+    assert results.sentences == ["Alice works at Acme", None, "no payload"]
+    assert results[1]["data"]["tags"] == ["a", "b"]
+    assert results[2].get("data") is None and "data" not in results[2]
+    assert len(results[1:]) == 2
+
+
+def test_compaction_uses_the_given_codec():
+    codec = CountingCodec()
+    results = SearchResults(HITS, codec=codec)
+    assert codec.calls == {"encode": 3, "decode": 0}
+    assert results[0].data == HITS[0]["data"]
+    assert results[0].data is results[0].data
+    assert codec.calls["decode"] == 1
+
+
+def test_uncompacted_hits_keep_payloads():
+    hit = SearchHit(HITS[0], compact=False)
+    assert hit.data is HITS[0]["data"]
+    assert hit.graph_context is HITS[0]["graph_context"]
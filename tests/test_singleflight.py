@@ -0,0 +1,126 @@
+import time
+import asyncio
+import threading
+
+from praxos_python.singleflight import SingleFlight, AsyncSingleFlight
+
+
+def run_with_joiners(flight, func, joiners=4, share=None):
+    """Runs flight.do("key", func) in a leader thread and joiners; returns each caller's result or exception."""
+    started = threading.Event()
+    release = threading.Event()
+    outcomes = [None] * (joiners + 1)
+
+    def leader_func():
+        started.set()
+        release.wait(5)
+        return func()
+
+    def call(index):
+        try:
+            outcomes[index] = flight.do("key", leader_func if index == 0 else func, share=share)
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(joiners + 1)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flight.shared < joiners and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert not any(thread.is_alive() for thread in threads)
+    return outcomes
+
+
+def test_joiners_receive_the_leaders_result():
+    flight = SingleFlight()
+    outcomes = run_with_joiners(flight, lambda: [1, 2])
+    assert outcomes[0] == ([1, 2], False)
+    assert all(outcome == ([1, 2], True) for outcome in outcomes[1:])
+    assert flight._calls == {} and flight.shared == 4
+
+
+def test_a_failing_call_is_raised_to_every_caller():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    outcomes = run_with_joiners(flight, fail)
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert flight._calls == {}
+
+
+def test_async_callers_share_one_call():
+    calls = []
+
+    async def run():
+        flight = AsyncSingleFlight()
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        outcomes = await asyncio.gather(*[flight.do("key", func) for _ in range(4)])
+        return flight, outcomes
+
+    flight, outcomes = asyncio.run(run())
+    assert calls == [1]
+    assert sorted(outcomes) == [("result", False)] + [("result", True)] * 3
+    assert flight._calls == {} and flight.shared == 3
+
+
+def test_joiners_receive_the_shared_copy():
+    flight = SingleFlight()
+    outcomes = run_with_joiners(flight, lambda: [1, 2], share=tuple)
+    assert outcomes[0] == ([1, 2], False)
+    assert all(outcome == ((1, 2), True) for outcome in outcomes[1:])
+    assert flight._calls == {}
+
+
+def test_a_failing_share_is_raised_to_every_caller():
+    flight = SingleFlight()
+
+    def share(result):
+        raise TypeError("cannot share")
+
+    outcomes = run_with_joiners(flight, lambda: "result", share=share)
+    assert all(isinstance(outcome, TypeError) for outcome in outcomes)
+    assert flight._calls == {}
+    assert flight.do("key", lambda: 1, share=share) == (1, False)
+
+
+def test_share_is_skipped_without_joiners():
+    flight = SingleFlight()
+    shared = []
+    assert flight.do("key", lambda: 1, share=shared.append) == (1, False)
+    assert shared == []
+
+
+def test_async_failing_share_is_raised_to_every_caller():
+    def share(result):
+        raise TypeError("cannot share")
+
+    async def run():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def func():
+            await release.wait()
+            return "result"
+
+        calls = [asyncio.ensure_future(flight.do("key", func, share=share)) for _ in range(4)]
+        await asyncio.sleep(0)
+        release.set()
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        return flight, outcomes
+
+    flight, outcomes = asyncio.run(run())
+    assert all(isinstance(outcome, TypeError) for outcome in outcomes)
+    assert flight._calls == {} and flight.shared == 3
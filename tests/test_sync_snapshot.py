@@ -0,0 +1,108 @@
+import json
+import asyncio
+
+import httpx
+
+from praxos_python import SyncEnvironment, LocalEnvironment, RetryPolicy
+from mock_api import sync_environment, async_environment
+
+
+class MockSources:
+    """Mock API serving a mutable set of sources and the Person entities each one contains."""
+    def __init__(self):
+        self.sources = {}
+        self.contents = {}
+        self.failing = set()
+        self.extracted = []
+
+    def put(self, source_id, created_at, status, labels):
+        self.sources[source_id] = {"id": source_id, "environment_id": "env", "name": None, "description": None,
+                                   "created_at": created_at, "status": status}
+        self.contents[source_id] = labels
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/sources":
+            offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+            return httpx.Response(200, json=list(self.sources.values())[offset:offset + limit])
+        body = json.loads(request.content)
+        source_id = body.get("source_id")
+        if body["offset"] == 0:
+            self.extracted.append(source_id)
+        if source_id in self.failing:
+            return httpx.Response(500, json={"message": "extraction failed"})
+        items = [{"id": f"node-{label}", "label": label, "type": "schema:Person", "source_id": owner}
+                 for owner, labels in self.contents.items() if source_id in (None, owner) for label in labels]
+        return httpx.Response(200, json={"items": items[body["offset"]:body["offset"] + body["limit"]]})
+
+
+def environment(api: MockSources) -> SyncEnvironment:
+    return sync_environment(api, retry_policy=RetryPolicy(max_retries=0))
+
+
+def labels(path, **filters):
+    with LocalEnvironment(path) as local:
+        return sorted(item["label"] for item in local.iter_items("Person", **filters))
+
+
+def test_sync_refetches_only_sources_whose_created_at_or_status_changed(tmp_path):
+    path = str(tmp_path / "env.snapshot")
+    api = MockSources()
+    api.put("source-1", "2024-01-01", "completed", ["Alice", "Bob"])
+    api.put("source-2", "2024-01-02", "completed", ["Carol"])
+    env = environment(api)
+    env.export_snapshot(path, schemas=["Person"]).close()
+
+    api.extracted.clear()
+    report = env.sync_snapshot(path, schemas=["Person"])
+    assert api.extracted == [] and report["sources_updated"] == 0
+
+    # Reprocessed in place: same id, newer created_at, and Bob is gone.
+    api.put("source-1", "2024-02-01", "completed", ["Alice"])
+    report = env.sync_snapshot(path, schemas=["Person"])
+    assert api.extracted == ["source-1"]
+    assert report["sources_updated"] == 1 and report["items"] == 1
+    assert labels(path) == ["Alice", "Carol"]
+    assert labels(path, source_id="source-1") == ["Alice"]
+
+    api.extracted.clear()
+    env.sync_snapshot(path, schemas=["Person"])
+    assert api.extracted == []
+
+
+def test_a_changed_source_whose_refetch_fails_is_retried_next_sync(tmp_path):
+    path = str(tmp_path / "env.snapshot")
+    api = MockSources()
+    api.put("source-1", "2024-01-01", "completed", ["Alice"])
+    env = environment(api)
+    env.export_snapshot(path, schemas=["Person"]).close()
+
+    api.put("source-1", "2024-01-01", "processed", ["Alice", "Bob"])
+    api.failing.add("source-1")
+    report = env.sync_snapshot(path, schemas=["Person"])
+    assert list(report["errors"]) == ["source-1"] and report["sources_pending"] == 1
+
+    api.failing.clear()
+    api.extracted.clear()
+    report = env.sync_snapshot(path, schemas=["Person"])
+    assert api.extracted == ["source-1"] and report["sources_updated"] == 1
+    assert labels(path) == ["Alice", "Bob"]
+
+
+def test_async_sync_refetches_changed_sources(tmp_path):
+    path = str(tmp_path / "env.snapshot")
+    api = MockSources()
+    api.put("source-1", "2024-01-01", "completed", ["Alice", "Bob"])
+    environment(api).export_snapshot(path, schemas=["Person"]).close()
+    api.put("source-1", "2024-02-01", "completed", ["Bob"])
+
+    async def sync():
+        async def handler(request):
+            return api(request)
+        env = async_environment(handler, retry_policy=RetryPolicy(max_retries=0))
+        async with env._client:
+            return await env.sync_snapshot(path, schemas=["Person"])
+
+    api.extracted.clear()
+    report = asyncio.run(sync())
+    assert api.extracted == ["source-1"] and report["sources_updated"] == 1
+    assert labels(path) == ["Bob"]
@@ -0,0 +1,292 @@
+"""
+Thread-safety of a shared SyncClient and of the helpers behind it, against an httpx.MockTransport
+API (the pytest-sized counterpart of benchmarks/stress_threads.py).
+"""
+import json
+import time
+import random
+import asyncio
+import threading
+from collections import Counter
+
+import httpx
+
+from praxos_python import (
+    SyncClient, SyncEnvironment, AsyncEnvironment, ResultCache, Instrumentation, RateLimiter, RateLimit, RetryPolicy
+)
+from praxos_python.singleflight import SingleFlight
+from praxos_python.models.loader import NodeLoader
+from mock_api import sync_client, async_client
+
+THREADS = 32
+
+
+def search_hits(top_k):
+    return [{"node_id": f"node-{i}", "score": 1.0 - i / 100, "label": f"hit {i}"} for i in range(top_k)]
+
+
+class MockAPI:
+    """Mock API counting the requests it serves; searches can be held until released."""
+    def __init__(self, latency: float = 0.001):
+        self.latency = latency
+        self.requests = Counter()
+        self.node_ids = Counter()
+        self.search_gate = threading.Event()
+        self.search_gate.set()
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.strip("/")
+        body = json.loads(request.content) if request.content else {}
+        with self._lock:
+            self.requests[endpoint] += 1
+            if endpoint == "fetch-graph-nodes":
+                self.node_ids.update(body["node_ids"])
+        time.sleep(self.latency)
+        if endpoint == "search":
+            self.search_gate.wait(5)
+            return httpx.Response(200, json={"hits": search_hits(body.get("top_k", 10))})
+        if endpoint == "fetch-graph-nodes":
+            return httpx.Response(200, json={"results": [{"id": node_id, "label": node_id} for node_id in body["node_ids"]]})
+        if endpoint == "sources":
+            return httpx.Response(200, json={"id": "source-new", "environment_id": "env", "name": None,
+                                             "created_at": None, "description": None, "status": "processing"})
+        if endpoint == "environment":
+            return httpx.Response(200, json={"id": "env", "name": "env", "created_at": None, "description": None})
+        return httpx.Response(404, json={"message": f"no mock route for {endpoint}"})
+
+    @property
+    def served(self) -> int:
+        return sum(self.requests.values())
+
+
+def make_client(api: MockAPI, **kwargs) -> SyncClient:
+    return sync_client(api, retry_policy=RetryPolicy(max_retries=0), max_connections=THREADS, **kwargs)
+
+
+def run_threads(count, target):
+    """Runs target(index) in count threads released together; returns the exceptions they raised."""
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_shared_client_under_a_mixed_workload():
+    api = MockAPI()
+    limits = {name: RateLimit(rate=5000, burst=5000, max_in_flight=8) for name in ("search", "extract", "upload", "default")}
+    client = make_client(api, cache=ResultCache(ttl=60), instrumentation=Instrumentation(), rate_limit=RateLimiter(limits))
+    failures = []
+
+    def worker(index):
+        rng = random.Random(index)
+        env = SyncEnvironment(client, id="env", name="env", created_at=None, description=None)
+        for _ in range(15):
+            operation = rng.choice(("search", "search", "nodes", "metadata", "ingest"))
+            if operation == "search":
+                top_k = rng.choice((3, 5))
+                # Few distinct queries, so threads collide in the cache and in single-flight.
+                hits = env.search(f"query {rng.randrange(3)}", top_k=top_k)
+                if hits != search_hits(top_k):
+                    failures.append(f"search top_k={top_k} returned unexpected hits")
+                hits[0]["score"] = -1.0  # must not leak into other threads' results
+            elif operation == "nodes":
+                start = rng.randrange(200)
+                ids = [f"node-{i}" for i in range(start, start + rng.randint(1, 40))]
+                if [node["id"] for node in env.load_nodes(ids)] != ids:
+                    failures.append("load_nodes returned the wrong nodes")
+            elif operation == "metadata":
+                if client.get_environment(id="env").id != "env":
+                    failures.append("get_environment returned another environment")
+            else:
+                env.add_business_data({"records": [{"thread": index}]})
+
+    with client:
+        assert run_threads(THREADS, worker) == []
+        assert failures == []
+
+        recorded = sum(endpoint["requests"] for endpoint in client.config.instrumentation.metrics.snapshot().values())
+        assert recorded == api.served
+        assert all(stats["in_flight"] == 0 for stats in client.config.rate_limiter.stats().values())
+        assert not client._single_flight._calls
+
+
+def test_concurrent_identical_searches_share_one_request():
+    api = MockAPI()
+    api.search_gate.clear()
+    client = make_client(api)
+    env = SyncEnvironment(client, id="env", name="env", created_at=None, description=None)
+    results = [None] * THREADS
+
+    def search(index):
+        results[index] = env.search("same query", top_k=5)
+
+    threads = [threading.Thread(target=search, args=(index,)) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    # Hold the leader's request until every other thread has joined it.
+    deadline = time.monotonic() + 5
+    while client._single_flight.shared < THREADS - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    api.search_gate.set()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert api.requests["search"] == 1
+    assert all(hits == search_hits(5) for hits in results)
+    # Every caller owns its copy.
+    assert len({id(hits) for hits in results}) == THREADS
+
+
+def test_single_flight_propagates_exceptions_and_forgets_finished_calls():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = Counter()
+
+    def fail():
+        calls["fail"] += 1
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    errors = []
+
+    def join(index):
+        if index:
+            started.wait(5)
+        try:
+            flight.do("key", fail)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=join, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flight.shared < 7 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls["fail"] == 1 and len(errors) == 8
+    assert flight._calls == {}
+    assert flight.do("key", lambda: 42) == (42, False)
+
+
+def test_result_cache_stays_consistent_under_concurrent_writes_and_invalidation():
+    cache = ResultCache(ttl=60, max_entries=50)
+
+    def worker(index):
+        rng = random.Random(index)
+        for i in range(300):
+            environment_id = f"env-{rng.randrange(4)}"
+            key = f"{environment_id}:{rng.randrange(100)}"
+            action = rng.random()
+            if action < 0.5:
+                cache.set(key, {"key": key, "index": i}, environment_id=environment_id, generation=cache.generation(environment_id))
+            elif action < 0.9:
+                value = cache.get(key)
+                assert value is None or value["key"] == key
+            else:
+                cache.invalidate_environment(environment_id)
+
+    assert run_threads(THREADS, worker) == []
+    stats = cache.stats()
+    assert stats["entries"] <= 50
+    assert stats["bytes"] == sum(len(entry[2]) for entry in cache._entries.values())
+    assert sum(len(keys) for keys in cache._keys_by_environment.values()) == stats["entries"]
+
+
+def test_node_loader_requests_each_id_once_across_threads():
+    fetched = Counter()
+    lock = threading.Lock()
+
+    def fetch(node_ids):
+        with lock:
+            fetched.update(node_ids)
+        time.sleep(0.002)
+        return [{"id": node_id} for node_id in node_ids if node_id != "node-missing"]
+
+    loader = NodeLoader(fetch)
+    results = {}
+
+    def load(index):
+        rng = random.Random(index)
+        ids = [f"node-{rng.randrange(300)}" for _ in range(60)] + ["node-missing"]
+        results[index] = (ids, loader.load_many(ids))
+
+    assert run_threads(THREADS, load) == []
+    for ids, nodes in results.values():
+        assert [node["id"] if node else None for node in nodes] == ids[:-1] + [None]
+    # Unknown ids are not cached, so only known nodes are guaranteed a single request.
+    del fetched["node-missing"]
+    assert max(fetched.values()) == 1
+
+
+def test_ingestion_epochs_advance_once_per_invalidation():
+    client = make_client(MockAPI())
+    with client:
+        assert run_threads(THREADS, lambda index: [client._invalidate_cache("env") for _ in range(50)]) == []
+        assert client._ingestion_epochs["env"] == THREADS * 50
+
+
+def test_map_concurrent_keeps_order_and_honours_its_timeout():
+    client = make_client(MockAPI())
+    env = SyncEnvironment(client, id="env", name="env", created_at=None, description=None)
+    with client:
+        ids = [f"node-{i}" for i in range(100)]
+        results = env.map_concurrent("fetch_graph_nodes", [([node_id],) for node_id in ids], max_concurrency=16)
+        assert [result[0]["id"] for result in results] == ids
+
+        def slow(item):
+            time.sleep(0.05)
+            return item
+
+        start = time.perf_counter()
+        results = env.map_concurrent(slow, range(200), max_concurrency=8, timeout=0.2)
+        assert time.perf_counter() - start < 1.0
+        finished = [(index, result) for index, result in enumerate(results) if not isinstance(result, TimeoutError)]
+        # Calls running at the deadline may finish in any order, but each result stays in its input's slot.
+        assert 0 < len(finished) < 200 and all(index == result for index, result in finished)
+
+
+def test_async_map_concurrent_cancels_unfinished_calls_on_timeout():
+    unwound = []
+
+    async def run():
+        client = async_client(MockAPI())
+        async with client:
+            env = AsyncEnvironment(client, id="env", name="env", created_at=None, description=None)
+
+            async def slow(item):
+                try:
+                    await asyncio.sleep(0.05 if item < 4 else 10)
+                    return item
+                finally:
+                    unwound.append(item)
+
+            start = time.perf_counter()
+            results = await env.map_concurrent(slow, range(12), max_concurrency=12, timeout=0.2)
+            return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(run())
+    assert elapsed < 1.0
+    assert results[:4] == [0, 1, 2, 3]
+    assert all(isinstance(result, TimeoutError) for result in results[4:])
+    # Cancelled calls ran their cleanup before map_concurrent returned.
+    assert sorted(unwound) == list(range(12))
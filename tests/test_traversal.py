@@ -0,0 +1,98 @@
+import json
+import asyncio
+
+import httpx
+
+from mock_api import sync_environment, async_environment
+
+
+class TreeAPI:
+    """Mock anchored /search over a binary tree: the neighbours of n<i> are n<2i+1> and n<2i+2>."""
+    def __init__(self, size: int = 1000):
+        self.size = size
+        self.searches = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/fetch-graph-nodes":
+            node_ids = json.loads(request.content)["node_ids"]
+            return httpx.Response(200, json={"results": [{"id": node_id, "full": True} for node_id in node_ids]})
+        anchors = [int(anchor["id"][1:]) for anchor in json.loads(request.content)["known_anchors"]]
+        self.searches.append(anchors)
+        hits = [{"node_id": f"n{child}", "score": 1.0 / (child + 1)}
+                for anchor in anchors for child in (2 * anchor + 1, 2 * anchor + 2) if child < self.size]
+        return httpx.Response(200, json={"hits": hits})
+
+
+def test_breadth_first_to_max_depth():
+    api = TreeAPI()
+    env = sync_environment(api)
+    with env._client:
+        traversal = env.traverse(["n0"], max_depth=3, anchors_per_request=2, max_concurrency=1)
+        nodes = list(traversal)
+    assert [node.id for node in nodes] == [f"n{i}" for i in range(1, 15)]
+    assert [node.depth for node in nodes] == [1] * 2 + [2] * 4 + [3] * 8
+    assert traversal.stop_reason == "max_depth"
+    assert traversal.requests == len(api.searches) == 1 + 1 + 2
+    assert max(len(anchors) for anchors in api.searches) == 2
+
+
+def test_an_exhausted_graph_stops_early():
+    env = sync_environment(TreeAPI(size=7))
+    with env._client:
+        traversal = env.traverse(["n0"], max_depth=10)
+        assert len(list(traversal)) == 6
+    assert traversal.stop_reason == "exhausted" and traversal.depth == 3
+
+
+def test_node_and_request_budgets():
+    env = sync_environment(TreeAPI())
+    with env._client:
+        traversal = env.traverse(["n0"], max_depth=10, max_nodes=5)
+        assert len(list(traversal)) == 5
+        assert traversal.stop_reason == "max_nodes"
+
+        traversal = env.traverse(["n0"], max_depth=10, anchors_per_request=1, max_requests=3, max_concurrency=1)
+        list(traversal)
+        assert traversal.stop_reason == "max_requests" and traversal.requests == 3
+
+
+def test_time_budget():
+    env = sync_environment(TreeAPI(size=10 ** 6))
+    with env._client:
+        traversal = env.traverse(["n0"], max_depth=30, max_frontier=10 ** 6, max_nodes=10 ** 6, max_requests=10 ** 6,
+                                 time_budget=0.05)
+        list(traversal)
+    assert traversal.stop_reason == "time_budget" and traversal.elapsed < 1.0
+
+
+def test_frontier_is_filtered_and_capped():
+    api = TreeAPI()
+    env = sync_environment(api)
+    with env._client:
+        # Only odd nodes are expanded, and only the best-scoring one of them.
+        traversal = env.traverse(["n0"], max_depth=3, max_frontier=1, expand=lambda node: int(node.id[1:]) % 2 == 1)
+        ids = [node.id for node in traversal]
+    assert ids == ["n1", "n2", "n3", "n4", "n7", "n8"]
+    assert api.searches == [[0], [1], [3]]
+
+
+def test_fetched_nodes_are_attached_and_counted():
+    env = sync_environment(TreeAPI())
+    with env._client:
+        traversal = env.traverse(["n0"], max_depth=2, fetch_nodes=True)
+        nodes = list(traversal)
+    assert all(node.node == {"id": node.id, "full": True} for node in nodes)
+    assert traversal.requests == 2 + 2
+
+
+def test_async_traversal():
+    api = TreeAPI()
+
+    async def run():
+        env = async_environment(api)
+        async with env._client:
+            traversal = env.traverse(["n0"], max_depth=2)
+            return [node.id async for node in traversal], traversal.stop_reason
+
+    ids, stop_reason = asyncio.run(run())
+    assert ids == ["n1", "n2", "n3", "n4", "n5", "n6"] and stop_reason == "max_depth"
@@ -0,0 +1,83 @@
+import asyncio
+
+import httpx
+import pytest
+
+from praxos_python import SyncSource
+from praxos_python.models import source as source_module
+from mock_api import sync_client, sync_environment, async_environment
+
+
+def source_entry(source_id, status):
+    return {"id": source_id, "environment_id": "env", "name": None, "created_at": None, "description": None, "status": status}
+
+
+class StatusAPI:
+    """Mock /sources reporting, per source, the next status of its script on every request."""
+    def __init__(self, scripts):
+        self.scripts = {source_id: list(statuses) for source_id, statuses in scripts.items()}
+        self.requests = 0
+
+    def status(self, source_id):
+        script = self.scripts[source_id]
+        return script.pop(0) if len(script) > 1 else script[0]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        source_id = request.url.params.get("id")
+        if source_id is not None:
+            return httpx.Response(200, json=source_entry(source_id, self.status(source_id)))
+        return httpx.Response(200, json=[source_entry(source_id, self.status(source_id)) for source_id in self.scripts])
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(source_module.time, "sleep", slept.append)
+    return slept
+
+
+def test_polls_back_off_up_to_the_maximum(sleeps):
+    api = StatusAPI({"source-1": ["processing"] * 5 + ["completed"]})
+    source = SyncSource(sync_client(api), **source_entry("source-1", "processing"))
+    assert source.wait_until_ready(poll_interval=1.0, max_poll_interval=3.0, backoff=2.0) == "completed"
+    assert source.is_ready and not source.is_failed
+    assert sleeps == [1.0, 2.0, 3.0, 3.0, 3.0]
+    assert api.requests == 6
+
+
+def test_a_failed_source_is_terminal(sleeps):
+    source = SyncSource(sync_client(StatusAPI({"source-1": ["processing", "Failed"]})), **source_entry("source-1", None))
+    assert source.wait_until_ready() == "Failed"
+    assert source.is_failed
+
+
+def test_wait_until_ready_times_out():
+    source = SyncSource(sync_client(StatusAPI({"source-1": ["processing"]})), **source_entry("source-1", None))
+    with pytest.raises(TimeoutError):
+        source.wait_until_ready(timeout=0.05, poll_interval=0.01)
+
+
+def test_wait_for_sources_lists_once_per_tick_and_yields_in_completion_order(sleeps):
+    api = StatusAPI({"slow": ["processing"] * 3 + ["completed"], "fast": ["processing", "error"], "done": ["ready"]})
+    env = sync_environment(api)
+    sources = [SyncSource(env._client, **source_entry(source_id, None)) for source_id in ("slow", "fast", "done")]
+    finished = [(source.id, source.status) for source in env.wait_for_sources(sources, poll_interval=1.0, backoff=2.0)]
+    assert finished == [("done", "ready"), ("fast", "error"), ("slow", "completed")]
+    assert api.requests == 4
+    # Reset after each tick where something finished, grown otherwise.
+    assert sleeps == [1.0, 1.0, 2.0]
+
+
+def test_async_wait_for_sources():
+    api = StatusAPI({"a": ["processing", "completed"], "b": ["completed"]})
+
+    async def run():
+        env = async_environment(api)
+        async with env._client:
+            sources = [source_module.AsyncSource(env._client, **source_entry(source_id, None)) for source_id in ("a", "b")]
+            ready = [source.id async for source in env.wait_for_sources(sources, poll_interval=0.01)]
+            status = await sources[0].wait_until_ready()
+            return ready, status
+
+    assert asyncio.run(run()) == (["b", "a"], "completed")